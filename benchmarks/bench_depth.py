@@ -0,0 +1,85 @@
+"""Complete-render probe cost on deep and wide shapes.
+
+Run from the repository root with ``python -m benchmarks.bench_depth``.
+
+``recursive`` writes the complete rendering with one Python call per node, as
+the probe did before it walked an explicit stack; it does the same per-node
+work through the engine's ``_open_node``. ``stack`` is the engine's
+``_write_full``. ``render`` is the engine entry point at a budget
+too small for the complete rendering, so the structural renderers run too.
+Shapes deeper than the interpreter's recursion limit report ``recursion``.
+"""
+
+import timeit
+
+from reprobate._engine import render
+from reprobate._engine.render import _open_node, _write_full
+from reprobate._engine.writer import BoundedWriter
+
+LIMIT = 10_000_000
+BUDGET = 2_000
+
+
+def _chain(depth: int, mapping: bool) -> object:
+    value: object = "end"
+    for index in range(depth):
+        value = {"next": value, "index": index} if mapping else [value, index]
+    return value
+
+
+CASES = {
+    "deep list 200": _chain(200, mapping=False),
+    "deep dict 200": _chain(200, mapping=True),
+    "deep list 5000": _chain(5_000, mapping=False),
+    "deep dict 5000": _chain(5_000, mapping=True),
+    "wide rows": [
+        {"id": index, "name": f"user{index}", "tags": ["a", "b"]}
+        for index in range(1_000)
+    ],
+    "wide ints": list(range(10_000)),
+}
+
+
+def _write_recursive(obj: object, writer: BoundedWriter, seen: set[int]) -> None:
+    frame = _open_node(obj, writer, seen, None, None, None)
+    if frame is None:
+        return
+    seen.add(id(obj))
+    for child in frame[1]:
+        _write_recursive(child, writer, seen)
+    seen.discard(id(obj))
+
+
+def _recursive(value: object) -> None:
+    _write_recursive(value, BoundedWriter(LIMIT), set())
+
+
+def _stack(value: object) -> None:
+    _write_full(value, BoundedWriter(LIMIT), set())
+
+
+def _render(value: object) -> None:
+    render(value, BUDGET, inference="off")
+
+
+def _milliseconds(run, value: object) -> str:
+    try:
+        seconds = min(timeit.repeat(lambda: run(value), number=5, repeat=5)) / 5
+    except RecursionError:
+        return f"{'recursion':>10}"
+    return f"{seconds * 1e3:10.2f}"
+
+
+def main() -> None:
+    print(f"{'case':>16} {'recursive':>10} {'stack':>10} {'render':>10}  (ms)")
+    for name, value in CASES.items():
+        print(
+            f"{name:>16}"
+            f" {_milliseconds(_recursive, value)}"
+            f" {_milliseconds(_stack, value)}"
+            f" {_milliseconds(_render, value)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Per-node dispatch overhead in the rendering engine.
+
+Run from the repository root with ``python -m benchmarks.bench_dispatch``.
+
+``classify`` repeats the per-class checks for every node, as the engine did
+before dispatch was cached per type: protocol lookup, registry MRO walk,
+namedtuple probe, repr-ownership scans, and the structural ``isinstance``
+chain. ``cached`` is the per-node cost of the dispatch table. ``render`` is the
+full per-node cost of the engine entry point for reference.
+"""
+
+import collections
+import dataclasses
+import timeit
+
+from reprobate._engine.context import InspectionBudget, RenderContext
+from reprobate._engine.render import (
+    _PROTOCOL_METHOD,
+    _classify,
+    _dispatch,
+    _render_value,
+)
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+
+
+Pair = collections.namedtuple("Pair", ["left", "right"])
+
+COUNT = 100_000
+BUDGET = 40
+CASES = {
+    "ints": list(range(COUNT)),
+    "strings": [f"item-{index}" for index in range(COUNT)],
+    "tuples": [(index, index) for index in range(COUNT)],
+    "ordered": [collections.OrderedDict(a=index) for index in range(COUNT)],
+    "dataclasses": [Point(index, index) for index in range(COUNT)],
+    "namedtuples": [Pair(index, index) for index in range(COUNT)],
+}
+
+
+def _classify_all(values: list[object]) -> None:
+    for value in values:
+        cls = type(value)
+        _classify(cls, getattr(cls, _PROTOCOL_METHOD, None))
+
+
+def _dispatch_all(values: list[object]) -> None:
+    for value in values:
+        _dispatch(type(value))
+
+
+def _render_all(values: list[object]) -> None:
+    context = RenderContext(
+        policy="greedy",
+        inference="off",
+        work=InspectionBudget(100 * COUNT),
+    )
+    for value in values:
+        _render_value(value, BUDGET, context)
+
+
+def _per_node(run, values: list[object]) -> float:
+    seconds = min(timeit.repeat(lambda: run(values), number=1, repeat=5))
+    return seconds * 1e9 / len(values)
+
+
+def main() -> None:
+    print(f"{'case':>12} {'classify':>10} {'cached':>10} {'render':>10}  (ns/node)")
+    for name, values in CASES.items():
+        print(
+            f"{name:>12}"
+            f" {_per_node(_classify_all, values):10.0f}"
+            f" {_per_node(_dispatch_all, values):10.0f}"
+            f" {_per_node(_render_all, values):10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
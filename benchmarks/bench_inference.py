@@ -0,0 +1,113 @@
+"""Record merging cost in schema inference on list-of-dict payloads.
+
+Run from the repository root with ``python -m benchmarks.bench_inference``.
+
+Every payload is long enough to be sampled, so inference reads
+``SAMPLE_SIZE`` records of up to ``MAX_RECORD_FIELDS`` fields each. ``scan``
+merges the sampled record schemas by scanning every field of every record for
+each key, as the engine did before it indexed fields by key; ``indexed`` is
+the engine's ``_merge_records``. ``infer`` is whole-payload inference with an
+inspection allowance large enough to read every sampled field.
+"""
+
+import timeit
+
+from reprobate._engine.context import InspectionBudget
+from reprobate._engine.inference import (
+    EXACT_ELEMENT_LIMIT,
+    MAX_RECORD_FIELDS,
+    SAMPLE_SIZE,
+    _merge_records,
+    _merge_schemas,
+    infer_schema,
+    sample_indices,
+)
+from reprobate._engine.schema import FieldSchema, RecordSchema
+
+LENGTH = EXACT_ELEMENT_LIMIT * 4
+INSPECTION = SAMPLE_SIZE * (MAX_RECORD_FIELDS + 1) * 4
+
+
+def _rows(fields: int, shift: int, typed: bool) -> list[dict[str, object]]:
+    """Rows whose key sets slide by ``shift`` and whose values vary by row."""
+    rows = []
+    for index in range(LENGTH):
+        start = (index * shift) % (fields * 2)
+        row: dict[str, object] = {}
+        for offset in range(fields):
+            column = start + offset
+            value: object = column
+            if typed and (index + column) % 3 == 0:
+                value = None if (index + column) % 2 else str(column)
+            row[f"field_{column}"] = value
+        rows.append(row)
+    return rows
+
+
+CASES = {
+    "uniform": _rows(MAX_RECORD_FIELDS, 0, typed=False),
+    "nullable": _rows(MAX_RECORD_FIELDS, 0, typed=True),
+    "sliding keys": _rows(MAX_RECORD_FIELDS, 1, typed=False),
+    "sliding typed": _rows(MAX_RECORD_FIELDS, 3, typed=True),
+}
+
+
+def _sampled_records(rows: list[dict[str, object]]) -> list[RecordSchema]:
+    records = []
+    for index in sample_indices(LENGTH):
+        schema = infer_schema(rows[index], "best_effort", InspectionBudget(INSPECTION))
+        if isinstance(schema, RecordSchema) and schema not in records:
+            records.append(schema)
+    return records
+
+
+def _merge_scanning(records: list[RecordSchema]) -> RecordSchema:
+    keys: list[object] = []
+    for record in records:
+        for field in record.fields:
+            if field.key not in keys:
+                keys.append(field.key)
+
+    merged = []
+    for key in keys[:MAX_RECORD_FIELDS]:
+        matching = [
+            field for record in records for field in record.fields if field.key == key
+        ]
+        value = _merge_schemas([field.value for field in matching])
+        if value is not None:
+            merged.append(
+                FieldSchema(key, value, optional=len(matching) < len(records))
+            )
+    return RecordSchema(
+        tuple(merged),
+        complete=all(record.complete for record in records)
+        and len(keys) <= MAX_RECORD_FIELDS,
+    )
+
+
+def _infer(rows: list[dict[str, object]]) -> None:
+    infer_schema(rows, "best_effort", InspectionBudget(INSPECTION))
+
+
+def _milliseconds(run, value: object) -> str:
+    seconds = min(timeit.repeat(lambda: run(value), number=20, repeat=5)) / 20
+    return f"{seconds * 1e3:10.3f}"
+
+
+def main() -> None:
+    print(
+        f"{'case':>14} {'records':>8} {'scan':>10} {'indexed':>10} {'infer':>10}  (ms)"
+    )
+    for name, rows in CASES.items():
+        records = _sampled_records(rows)
+        assert _merge_scanning(records) is _merge_records(records)
+        print(
+            f"{name:>14} {len(records):>8}"
+            f" {_milliseconds(_merge_scanning, records)}"
+            f" {_milliseconds(_merge_records, records)}"
+            f" {_milliseconds(_infer, rows)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,58 @@
 """reprobate: Budget-controlled repr for Python objects."""
 
-from .core import InferencePolicy, Policy, render, render_attrs, render_child
-from .registry import register
+from .core import (
+    IncrementalRenderer,
+    InferencePolicy,
+    Policy,
+    Renderer,
+    RenderLimits,
+    RenderReport,
+    ResultCache,
+    SchemaCache,
+    approximate_token_count,
+    child_complete_budgets,
+    complete_budget,
+    estimate,
+    fits,
+    render,
+    render_attrs,
+    render_child,
+    render_into,
+    render_ladder,
+    render_many,
+    render_namespace,
+    render_report,
+)
+from .registry import pure, register
 
 __all__ = [
+    "IncrementalRenderer",
     "InferencePolicy",
     "Policy",
+    "Renderer",
+    "RenderLimits",
+    "RenderReport",
+    "ResultCache",
+    "SchemaCache",
+    "approximate_token_count",
+    "child_complete_budgets",
+    "complete_budget",
+    "estimate",
+    "fits",
+    "pure",
     "register",
     "render",
     "render_attrs",
     "render_child",
+    "render_into",
+    "render_ladder",
+    "render_many",
+    "render_namespace",
+    "render_report",
 ]
 
-# Auto-register optional type renderers when their deps are available.
+# Declare optional type renderers by name; their libraries are never imported
+# here and each renderer resolves once its library is already loaded.
 from . import (
     ext_arrow,  # noqa: F401
     ext_numpy,  # noqa: F401
@@ -1,5 +1,44 @@
 """Private entry point for the rendering engine."""
 
-from .render import InferencePolicy, Policy, render, render_attrs
+from .cache import ResultCache, SchemaCache
+from .context import RenderLimits
+from .render import (
+    IncrementalRenderer,
+    InferencePolicy,
+    Policy,
+    Renderer,
+    RenderReport,
+    child_complete_budgets,
+    complete_budget,
+    estimate,
+    fits,
+    render,
+    render_attrs,
+    render_into,
+    render_ladder,
+    render_many,
+    render_namespace,
+    render_report,
+)
 
-__all__ = ["InferencePolicy", "Policy", "render", "render_attrs"]
+__all__ = [
+    "IncrementalRenderer",
+    "InferencePolicy",
+    "Policy",
+    "Renderer",
+    "RenderLimits",
+    "RenderReport",
+    "ResultCache",
+    "SchemaCache",
+    "child_complete_budgets",
+    "complete_budget",
+    "estimate",
+    "fits",
+    "render",
+    "render_attrs",
+    "render_into",
+    "render_ladder",
+    "render_many",
+    "render_namespace",
+    "render_report",
+]
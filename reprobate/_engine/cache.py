@@ -0,0 +1,216 @@
+"""Caches kept across renders: outputs of immutable values, list schemas."""
+
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from ..registry import add_change_hook
+from .context import InferencePolicy
+from .inference import ListInference
+
+# Exact leaf types whose value, and so whose rendering, is fixed for life.
+_IMMUTABLE_LEAVES = frozenset({str, bytes, int, float, bool, type(None)})
+# Tuples and frozensets with more descendants than this are not proven
+# immutable, so the proof stays bounded like every other engine walk.
+_MAX_PROOF_NODES = 100_000
+
+
+class ResultCache:
+    """Least-recently-used cache of render outputs for immutable values.
+
+    Only values built entirely from exact builtin immutables are cached:
+    ``str`` and ``bytes``, and ``tuple`` and ``frozenset`` values holding
+    numbers, text, ``None``, and further such tuples and frozensets. Their
+    output depends on nothing but the value, the budget, and the renderer's
+    options. Text is keyed by value, tuples and frozensets by identity; the
+    cache holds text and tuples until their entries are evicted, and drops a
+    frozenset's entries once it is garbage collected.
+
+    Entries are evicted least recently used first once their outputs total more
+    than ``max_chars`` characters. Registering a renderer clears every cache.
+    One instance may be shared by several ``Renderer`` objects and threads.
+    """
+
+    def __init__(self, max_chars: int = 1_000_000) -> None:
+        if max_chars < 0:
+            raise ValueError("max_chars must be nonnegative")
+        self._max_chars = max_chars
+        # (fingerprint, budget, options) -> (obj or weak reference, output)
+        self._entries: OrderedDict[Hashable, tuple[object, str]] = OrderedDict()
+        self._chars = 0
+        # Frozensets watched for collection, and the entry keys of each.
+        self._watched: dict[int, tuple[weakref.ref, set[Hashable]]] = {}
+        # Weak-reference callbacks can run during any allocation, including
+        # inside a locked section of the same thread.
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        _CACHES.add(self)
+
+    @property
+    def max_chars(self) -> int:
+        return self._max_chars
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry; the hit and miss counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._watched.clear()
+            self._chars = 0
+
+    def get(self, obj: object, budget: int, options: Hashable) -> str | None:
+        """Return the cached output of ``obj``, or ``None`` on a miss."""
+        fingerprint = _fingerprint(obj)
+        if fingerprint is None:
+            return None
+        key = (fingerprint, budget, options)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (
+                isinstance(entry[0], weakref.ref) and entry[0]() is not obj
+            ):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, obj: object, budget: int, options: Hashable, output: str) -> None:
+        """Cache ``output`` for ``obj`` if ``obj`` is provably immutable."""
+        fingerprint = _fingerprint(obj)
+        if (
+            fingerprint is None
+            or len(output) > self._max_chars
+            or not _provably_immutable(obj)
+        ):
+            return
+        key = (fingerprint, budget, options)
+        with self._lock:
+            holder: object = obj
+            if type(obj) is frozenset:
+                holder = self._watch(obj, key)
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._chars -= len(previous[1])
+            self._entries[key] = (holder, output)
+            self._chars += len(output)
+            while self._chars > self._max_chars:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._chars -= len(evicted)
+
+    def _watch(self, obj: frozenset, key: Hashable) -> weakref.ref:
+        obj_id = id(obj)
+        watched = self._watched.get(obj_id)
+        if watched is None or watched[0]() is not obj:
+            reference = weakref.ref(obj, lambda _: self._forget(obj_id))
+            watched = self._watched[obj_id] = (reference, set())
+        watched[1].add(key)
+        return watched[0]
+
+    def _forget(self, obj_id: int) -> None:
+        with self._lock:
+            watched = self._watched.pop(obj_id, None)
+            if watched is None:
+                return
+            for key in watched[1]:
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self._chars -= len(entry[1])
+
+
+class SchemaCache:
+    """Least-recently-used cache of list schema inference across renders.
+
+    Each entry keeps, for one list, the schemas inferred for its sampled
+    elements. The next render of the same list reuses the schemas of elements
+    that are still at a sampled position and unchanged wherever inference
+    looked, and infers only the rest, so a list that grows by appending
+    costs inference of its new samples. Schemas, and so outputs, are the
+    same as without the cache.
+
+    Entries pin their lists; at most ``max_entries`` are kept. One instance
+    may be shared by several ``Renderer`` objects and threads.
+    """
+
+    def __init__(self, max_entries: int = 128) -> None:
+        if max_entries < 0:
+            raise ValueError("max_entries must be nonnegative")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[int, ListInference] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry; the hit and miss counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, obj: list, policy: InferencePolicy) -> ListInference | None:
+        """Return what was last inferred for ``obj`` under ``policy``."""
+        with self._lock:
+            entry = self._entries.get(id(obj))
+            if entry is None or entry.obj is not obj or entry.policy != policy:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(id(obj))
+            self.hits += 1
+            return entry
+
+    def put(self, entry: ListInference) -> None:
+        """Keep ``entry`` for the next render of its list."""
+        with self._lock:
+            self._entries[id(entry.obj)] = entry
+            self._entries.move_to_end(id(entry.obj))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+def _fingerprint(obj: object) -> Hashable | None:
+    """Key text by value and immutable containers by identity."""
+    cls = type(obj)
+    if cls is str or cls is bytes:
+        return obj
+    if cls is tuple or cls is frozenset:
+        return id(obj)
+    return None
+
+
+def _provably_immutable(obj: object) -> bool:
+    """Whether ``obj`` is built only from exact immutable builtins."""
+    stack = [obj]
+    nodes = 0
+    while stack:
+        value = stack.pop()
+        cls = type(value)
+        if cls in _IMMUTABLE_LEAVES:
+            continue
+        if cls is not tuple and cls is not frozenset:
+            return False
+        nodes += len(value)
+        if nodes > _MAX_PROOF_NODES:
+            return False
+        stack.extend(value)
+    return True
+
+
+_CACHES: weakref.WeakSet[ResultCache] = weakref.WeakSet()
+
+
+def _clear_caches() -> None:
+    for cache in list(_CACHES):
+        cache.clear()
+
+
+add_change_hook(_clear_caches)
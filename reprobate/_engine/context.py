@@ -1,25 +1,94 @@
 """Render-session state for the rendering engine."""
 
+import time
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
-Policy = Literal["greedy", "even"]
+if TYPE_CHECKING:
+    from .cache import SchemaCache
+
+Policy = Literal["greedy", "even", "global"]
 InferencePolicy = Literal["off", "exact", "best_effort"]
 MAX_INSPECTION_NODES = 1_024
 MIN_RENDER_WORK_NODES = 1_024
 RENDER_WORK_NODES_PER_CHAR = 4
 
 
+@dataclass(frozen=True)
+class RenderLimits:
+    """Node allowances that bound the engine's inspection and rendering work.
+
+    ``inspection_nodes`` caps schema inference per render. The render work
+    allowance is ``max(min_work_nodes, budget * work_nodes_per_char)``.
+    """
+
+    inspection_nodes: int = MAX_INSPECTION_NODES
+    min_work_nodes: int = MIN_RENDER_WORK_NODES
+    work_nodes_per_char: int = RENDER_WORK_NODES_PER_CHAR
+
+
+DEFAULT_LIMITS = RenderLimits()
+
+
 @dataclass
 class InspectionBudget:
     remaining: int = MAX_INSPECTION_NODES
+    # A ``time.monotonic()`` instant after which the allowance is spent.
+    deadline: float | None = None
+    expired: bool = False
 
     def consume(self) -> bool:
         if self.remaining <= 0:
             return False
+        if self.deadline is not None and self.out_of_time():
+            return False
         self.remaining -= 1
         return True
 
+    def out_of_time(self) -> bool:
+        """Spend the whole allowance once the deadline has passed."""
+        if self.deadline is not None and not self.expired:
+            if time.monotonic() >= self.deadline:
+                self.remaining = 0
+                self.expired = True
+        return self.expired
+
+
+@dataclass
+class ProbeRecord:
+    """Complete-render probe outcomes for one object within a render.
+
+    ``obj`` keeps the id from being reused by a later temporary. A complete
+    output answers every budget, and so does an exact ``size`` measured while
+    the object was written inside a larger probe; otherwise ``failed`` is the
+    largest budget known to be too small, and ``unsupported`` marks values no
+    budget fits.
+    """
+
+    obj: object
+    output: str | None = None
+    size: int | None = None
+    failed: int = -1
+    unsupported: bool = False
+
+
+@dataclass
+class RenderTrace:
+    """What one render read, kept to check later whether its output could change.
+
+    ``opened`` holds containers whose children the structural renderers,
+    planning, or inference read, and ``scanned`` those read whole by a
+    uniformity proof. ``probed`` holds complete-render probe roots with the
+    largest budget each was probed at. ``complete`` turns false once the render
+    read state no snapshot of these covers, such as an object's own ``repr``.
+    Entries pin their objects like the render caches.
+    """
+
+    opened: dict[int, object] = field(default_factory=dict)
+    scanned: dict[int, object] = field(default_factory=dict)
+    probed: dict[int, tuple[object, int]] = field(default_factory=dict)
+    complete: bool = True
+
 
 @dataclass
 class RenderContext:
@@ -27,16 +96,57 @@ class RenderContext:
 
     policy: Policy
     inference: InferencePolicy
+    references: bool = False
     seen: set[int] = field(default_factory=set)
+    # Nesting depth of the structural renderers at the current node.
+    depth: int = 0
     inspection: InspectionBudget = field(default_factory=InspectionBudget)
     work: InspectionBudget = field(default_factory=InspectionBudget)
     # Entries hold (obj, schema): the object reference keeps the id from being
     # reused by a temporary allocated later in the same render.
     schema_cache: dict[int, tuple[object, object | None]] = field(default_factory=dict)
+    # List schemas kept across renders, when the renderer has a cache for them.
+    list_schemas: "SchemaCache | None" = None
+    probe_cache: dict[int, ProbeRecord] = field(default_factory=dict)
+    # Expansion ladders planned by the ``global`` policy as (obj, cap, blocks),
+    # pinned like schemas.
+    ladders: dict[int, tuple[object, int, list[tuple[int, float]]]] = field(
+        default_factory=dict
+    )
+
+    # Outputs of deterministic nodes keyed by (id, budget); entries pin the
+    # object like the schema cache.
+    memo: dict[tuple[int, int], tuple[object, str]] = field(default_factory=dict)
+    memo_hits: int = 0
+    memo_misses: int = 0
+    # Reprs of exact str and bytes values as (obj, repr). Short values are
+    # keyed by value so equal keys across records share one entry; longer ones
+    # by id, pinned like schemas.
+    literals: dict[object, tuple[object, str]] = field(default_factory=dict)
+    # Back-references: path segments from the root to the current node, with
+    # ``None`` for a child that has no path; each shared container's owner as
+    # (container, path, paths from there to the root), pinned like schemas;
+    # and whether each of those paths was last rendered showing it whole.
+    path: list[str | None] = field(default_factory=list)
+    reference_paths: dict[int, tuple[object, str, tuple[str, ...]]] = field(
+        default_factory=dict
+    )
+    reference_shown: dict[str, bool] = field(default_factory=dict)
+    # Reads recorded for incremental re-rendering, when requested.
+    trace: RenderTrace | None = None
+
+    @property
+    def deadline_exceeded(self) -> bool:
+        return self.work.expired or self.inspection.expired
 
 
-def render_work_budget(budget: int) -> InspectionBudget:
+def render_work_budget(
+    budget: int,
+    limits: RenderLimits = DEFAULT_LIMITS,
+    deadline: float | None = None,
+) -> InspectionBudget:
     """Create a work allowance that is bounded and scales with possible output."""
     return InspectionBudget(
-        max(MIN_RENDER_WORK_NODES, budget * RENDER_WORK_NODES_PER_CHAR)
+        max(limits.min_work_nodes, budget * limits.work_nodes_per_char),
+        deadline,
     )
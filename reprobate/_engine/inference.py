@@ -2,6 +2,9 @@
 
 import collections
 import itertools
+import operator
+from collections.abc import Iterable
+from dataclasses import dataclass
 
 from .context import InferencePolicy, InspectionBudget
 from .schema import (
@@ -21,6 +24,42 @@ MAX_RECORD_FIELDS = 32
 MAX_RECORD_KEY_CHARS = 1_024
 MAX_TYPE_NAME_CHARS = 128
 
+# Schemas are interned, so holding the common scalars keeps them from being
+# collected and built again between renders.
+_NONE = ScalarSchema("None")
+_BOOL = ScalarSchema("bool")
+_INT = ScalarSchema("int")
+_FLOAT = ScalarSchema("float")
+_STR = ScalarSchema("str")
+_BYTES = ScalarSchema("bytes")
+
+
+@dataclass
+class SampledElement:
+    """One list element's schema, the inspection it cost, and what it read.
+
+    ``read`` holds each container inference opened under the element with its
+    length and the children inference read from it, in order.
+    """
+
+    value: object
+    schema: Schema | None
+    cost: int
+    read: list[tuple[object, int, list[object]]]
+
+
+@dataclass
+class ListInference:
+    """The schemas inferred for a list's sampled elements, by position.
+
+    Only elements whose inference finished within the inspection allowance
+    are kept. ``obj`` pins the list so its id is not reused.
+    """
+
+    obj: list
+    policy: InferencePolicy
+    elements: dict[int, SampledElement]
+
 
 def infer_schema(
     obj: object,
@@ -28,11 +67,17 @@ def infer_schema(
     inspection: InspectionBudget,
     *,
     record_mapping: bool = True,
+    opened: dict[int, object] | None = None,
 ) -> Schema | None:
-    """Infer a schema under the selected policy and inspection budget."""
+    """Infer a schema under the selected policy and inspection budget.
+
+    ``opened``, when given, receives every container whose elements were read.
+    """
     if policy == "off":
         return None
-    return _infer(obj, policy, inspection, 0, set(), record_mapping=record_mapping)
+    return _infer(
+        obj, policy, inspection, 0, set(), opened, record_mapping=record_mapping
+    )
 
 
 def _infer(
@@ -41,6 +86,7 @@ def _infer(
     inspection: InspectionBudget,
     depth: int,
     active: set[int],
+    opened: dict[int, object] | None,
     *,
     record_mapping: bool = False,
 ) -> Schema | None:
@@ -61,11 +107,13 @@ def _infer(
     if obj_id in active:
         return None
     active.add(obj_id)
+    if opened is not None:
+        opened[obj_id] = obj
     try:
         if isinstance(obj, dict):
             if record_mapping and _is_record_mapping(obj):
-                return _infer_record(obj, policy, inspection, depth, active)
-            return _infer_mapping(obj, policy, inspection, depth, active)
+                return _infer_record(obj, policy, inspection, depth, active, opened)
+            return _infer_mapping(obj, policy, inspection, depth, active, opened)
 
         kind = _type_name(obj)
         values, complete = _sequence_values(obj, policy)
@@ -78,34 +126,156 @@ def _infer(
                 inspection,
                 depth + 1,
                 active,
+                opened,
                 record_mapping=isinstance(value, dict),
             )
             for value in values
         ]
-        if policy == "exact" and any(schema is None for schema in schemas):
-            return SequenceSchema(kind, None)
-        missing_schema = any(schema is None for schema in schemas)
-        item = _merge_schemas([schema for schema in schemas if schema is not None])
-        if missing_schema and isinstance(item, RecordSchema):
-            item = RecordSchema(item.fields, complete=False)
-        return SequenceSchema(kind, item)
+        return _sequence_schema(kind, schemas, policy)
     finally:
         active.discard(obj_id)
 
 
+def infer_list_schema(
+    obj: list,
+    policy: InferencePolicy,
+    inspection: InspectionBudget,
+    previous: ListInference | None,
+    *,
+    opened: dict[int, object] | None = None,
+) -> tuple[Schema | None, ListInference]:
+    """Infer the schema of ``obj`` as ``infer_schema`` does, reusing ``previous``.
+
+    An element still at a position ``previous`` sampled keeps its schema when
+    every container its inference read has the same length and children and
+    the inspection allowance covers what it cost then; the allowance is
+    charged as if it were inferred again. Appending to a list therefore costs
+    inference of the new samples only. Returns the schema and the record to
+    pass as ``previous`` next time.
+    """
+    elements: dict[int, SampledElement] = {}
+    record = ListInference(obj, policy, elements)
+    if policy == "off" or not inspection.consume():
+        return None, record
+    if opened is not None:
+        opened[id(obj)] = obj
+    kind = _type_name(obj)
+    length = len(obj)
+    if length <= EXACT_ELEMENT_LIMIT:
+        positions: Iterable[int] = range(length)
+    elif policy == "exact":
+        return SequenceSchema(kind, None), record
+    else:
+        positions = sample_indices(length)
+    reusable = (
+        previous.elements
+        if previous is not None and previous.obj is obj and previous.policy == policy
+        else {}
+    )
+    active = {id(obj)}
+    schemas = []
+    for index in positions:
+        value = obj[index]
+        element = reusable.get(index)
+        if (
+            element is not None
+            and element.value is value
+            and _still_reusable(element, policy, inspection)
+        ):
+            inspection.remaining -= element.cost
+            if opened is not None:
+                opened.update(
+                    (id(container), container) for container, *_ in element.read
+                )
+        else:
+            element = _infer_element(value, policy, inspection, active, opened)
+        if element.cost >= 0:
+            elements[index] = element
+        schemas.append(element.schema)
+    return _sequence_schema(kind, schemas, policy), record
+
+
+def _infer_element(
+    value: object,
+    policy: InferencePolicy,
+    inspection: InspectionBudget,
+    active: set[int],
+    opened: dict[int, object] | None,
+) -> SampledElement:
+    """Infer a list element, with a negative cost if the allowance ran out."""
+    before = inspection.remaining
+    read: dict[int, object] = {}
+    schema = _infer(
+        value,
+        policy,
+        inspection,
+        1,
+        active,
+        read,
+        record_mapping=isinstance(value, dict),
+    )
+    if opened is not None:
+        opened.update(read)
+    if inspection.remaining <= 0:
+        # Starved inference may have skipped nodes a later render can afford.
+        return SampledElement(value, schema, -1, [])
+    snapshot = [
+        (container, len(container), _read_children(container, policy))
+        for container in read.values()
+    ]
+    return SampledElement(value, schema, before - inspection.remaining, snapshot)
+
+
+def _still_reusable(
+    element: SampledElement, policy: InferencePolicy, inspection: InspectionBudget
+) -> bool:
+    if inspection.remaining < element.cost or inspection.out_of_time():
+        return False
+    for container, length, children in element.read:
+        if len(container) != length:
+            return False
+        current = _read_children(container, policy)
+        if len(current) != len(children) or not all(
+            map(operator.is_, current, children)
+        ):
+            return False
+    return True
+
+
+def _read_children(obj: object, policy: InferencePolicy) -> list[object]:
+    """The children inference reads from a container, in order."""
+    if isinstance(obj, dict):
+        items, _ = _mapping_items(obj, policy)
+        return list(itertools.chain.from_iterable(items))
+    values, _ = _sequence_values(obj, policy)
+    return values
+
+
+def _sequence_schema(
+    kind: str, schemas: list[Schema | None], policy: InferencePolicy
+) -> SequenceSchema:
+    if policy == "exact" and any(schema is None for schema in schemas):
+        return SequenceSchema(kind, None)
+    missing_schema = any(schema is None for schema in schemas)
+    item = _merge_schemas([schema for schema in schemas if schema is not None])
+    if missing_schema and isinstance(item, RecordSchema):
+        item = RecordSchema(item.fields, complete=False)
+    return SequenceSchema(kind, item)
+
+
 def _scalar_schema(obj: object) -> Schema | None:
     if obj is None:
-        return ScalarSchema("None")
+        return _NONE
     if isinstance(obj, bool):
-        return ScalarSchema("bool")
+        return _BOOL
     if isinstance(obj, int):
-        return ScalarSchema("int")
+        return _INT
     if isinstance(obj, float):
-        return ScalarSchema("float")
+        return _FLOAT
     if isinstance(obj, str):
-        return ScalarSchema("str")
+        return _STR
     if isinstance(obj, bytes):
-        return ScalarSchema("bytes")
+        return _BYTES
     return None
 
 
@@ -120,11 +290,7 @@ def _sequence_values(
         return [], False
 
     if isinstance(obj, (list, tuple)):
-        indices = set(range(min(8, length)))
-        indices.update(range(max(0, length - 8), length))
-        for step in range(1, 17):
-            indices.add((step * (length - 1)) // 17)
-        return [obj[index] for index in sorted(indices)[:SAMPLE_SIZE]], False
+        return [obj[index] for index in sample_indices(length)], False
 
     if isinstance(obj, collections.deque):
         head = list(itertools.islice(obj, SAMPLE_SIZE // 2))
@@ -135,12 +301,25 @@ def _sequence_values(
     return list(itertools.islice(obj, SAMPLE_SIZE)), False
 
 
+def sample_indices(length: int) -> list[int]:
+    """Positions sampled from a list or tuple too long to read whole.
+
+    The head, the tail, and evenly spaced positions between them.
+    """
+    indices = set(range(min(8, length)))
+    indices.update(range(max(0, length - 8), length))
+    for step in range(1, 17):
+        indices.add((step * (length - 1)) // 17)
+    return sorted(indices)[:SAMPLE_SIZE]
+
+
 def _infer_mapping(
     obj: dict,
     policy: InferencePolicy,
     inspection: InspectionBudget,
     depth: int,
     active: set[int],
+    opened: dict[int, object] | None,
 ) -> Schema:
     items, complete = _mapping_items(obj, policy)
     if policy == "exact" and not complete:
@@ -149,13 +328,14 @@ def _infer_mapping(
     key_schemas = []
     value_schemas = []
     for key, value in items:
-        key_schema = _infer(key, policy, inspection, depth + 1, active)
+        key_schema = _infer(key, policy, inspection, depth + 1, active, opened)
         value_schema = _infer(
             value,
             policy,
             inspection,
             depth + 1,
             active,
+            opened,
             record_mapping=isinstance(value, dict),
         )
         if policy == "exact" and (key_schema is None or value_schema is None):
@@ -176,6 +356,7 @@ def _infer_record(
     inspection: InspectionBudget,
     depth: int,
     active: set[int],
+    opened: dict[int, object] | None,
 ) -> RecordSchema | None:
     fields = []
     complete = True
@@ -186,6 +367,7 @@ def _infer_record(
             inspection,
             depth + 1,
             active,
+            opened,
             record_mapping=isinstance(value, dict),
         )
         if policy == "exact" and value_schema is None:
@@ -226,12 +408,14 @@ def _merge_schemas(schemas: list[Schema]) -> Schema | None:
     if not schemas:
         return None
 
-    members: list[Schema] = []
+    # Interned schemas hash by identity, so this ordered set dedupes in O(1).
+    unique: dict[Schema, None] = {}
     for schema in schemas:
-        candidates = schema.members if isinstance(schema, UnionSchema) else (schema,)
-        for candidate in candidates:
-            if candidate not in members:
-                members.append(candidate)
+        if isinstance(schema, UnionSchema):
+            unique.update(dict.fromkeys(schema.members))
+        else:
+            unique[schema] = None
+    members = list(unique)
 
     if all(isinstance(member, RecordSchema) for member in members):
         return _merge_records(
@@ -249,30 +433,33 @@ def _merge_schemas(schemas: list[Schema]) -> Schema | None:
 
 
 def _merge_records(records: list[RecordSchema]) -> RecordSchema:
-    keys: list[object] = []
+    # One pass collects each key's value schemas in first-seen key order. A
+    # record holds a key at most once, so a key's list length is the number
+    # of records that have it.
+    values: dict[object, list[Schema]] = {}
     for record in records:
         for field in record.fields:
-            if field.key not in keys:
-                keys.append(field.key)
+            schemas = values.get(field.key)
+            if schemas is None:
+                values[field.key] = [field.value]
+            else:
+                schemas.append(field.value)
 
     merged = []
-    for key in keys[:MAX_RECORD_FIELDS]:
-        matching = [
-            field for record in records for field in record.fields if field.key == key
-        ]
-        value = _merge_schemas([field.value for field in matching])
+    for key, schemas in itertools.islice(values.items(), MAX_RECORD_FIELDS):
+        value = _merge_schemas(schemas)
         if value is not None:
             merged.append(
                 FieldSchema(
                     key,
                     value,
-                    optional=len(matching) < len(records),
+                    optional=len(schemas) < len(records),
                 )
             )
     return RecordSchema(
         tuple(merged),
         complete=all(record.complete for record in records)
-        and len(keys) <= MAX_RECORD_FIELDS,
+        and len(values) <= MAX_RECORD_FIELDS,
     )
 
 
@@ -1,6 +1,10 @@
 """Pure allocation helpers for bounded representation planning."""
 
-from collections.abc import Sequence
+import heapq
+from collections.abc import Iterable, Sequence
+
+# An expansion block: characters it costs and values it reveals.
+Block = tuple[int, float]
 
 
 def allocate_even(demands: Sequence[int | None], available: int) -> list[int]:
@@ -36,3 +40,58 @@ def allocate_even(demands: Sequence[int | None], available: int) -> list[int]:
         active = next_active
 
     return allocations
+
+
+def merge_blocks(steps: Iterable[Block], limit: int) -> list[Block]:
+    """Group ordered expansion steps into blocks of nonincreasing worth.
+
+    Steps must be taken in order, so a valuable step behind a poor one is
+    priced together with it: adjacent blocks merge while the later one reveals
+    more per character than the earlier one. Steps past ``limit`` cumulative
+    characters are dropped.
+    """
+    blocks: list[list[float]] = []
+    spent = 0
+    for cost, gain in steps:
+        spent += cost
+        if spent > limit:
+            break
+        blocks.append([cost, gain])
+        while (
+            len(blocks) > 1
+            and blocks[-2][1] * blocks[-1][0] <= blocks[-1][1] * blocks[-2][0]
+        ):
+            cost_tail, gain_tail = blocks.pop()
+            blocks[-1][0] += cost_tail
+            blocks[-1][1] += gain_tail
+    return [(int(cost), gain) for cost, gain in blocks]
+
+
+def allocate_best_first(
+    ladders: Sequence[Sequence[Block]], available: int
+) -> tuple[list[int], int]:
+    """Take the most revealing affordable block across ladders until none fits.
+
+    Each ladder is consumed in order; a block that no longer fits closes its
+    ladder, because every later block sits behind it. Returns the characters
+    granted to each ladder and the characters left over.
+    """
+    allocations = [0] * len(ladders)
+    heap = [
+        (-ladder[0][1] / ladder[0][0], index, 0)
+        for index, ladder in enumerate(ladders)
+        if ladder
+    ]
+    heapq.heapify(heap)
+    while heap and available > 0:
+        _, index, position = heapq.heappop(heap)
+        cost = ladders[index][position][0]
+        if cost > available:
+            continue
+        allocations[index] += cost
+        available -= cost
+        position += 1
+        if position < len(ladders[index]):
+            cost, gain = ladders[index][position]
+            heapq.heappush(heap, (-gain / cost, index, position))
+    return allocations, available
@@ -1,28 +1,55 @@
 """Budget-bounded rendering engine for Python values and object graphs."""
 
+import bisect
 import collections
 import dataclasses
-from collections.abc import Iterable
-from typing import TypeAlias
-
-from .._session import RenderSession, activate_session
-from ..registry import get_renderer
+import heapq
+import itertools
+import math
+import operator
+import sys
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from contextvars import ContextVar
+from typing import Any, Callable, TypeAlias, TypeVar
+
+from .._session import RenderSession, reset_active_session, set_active_session
+from ..registry import add_change_hook, get_renderer, has_pending, is_pure
+from .cache import ResultCache, SchemaCache
 from .context import (
+    DEFAULT_LIMITS,
     InferencePolicy,
     InspectionBudget,
     Policy,
+    ProbeRecord,
     RenderContext,
+    RenderLimits,
+    RenderTrace,
     render_work_budget,
 )
-from .inference import infer_schema
-from .planning import allocate_even
+from .inference import (
+    EXACT_ELEMENT_LIMIT,
+    SAMPLE_SIZE,
+    infer_list_schema,
+    infer_schema,
+    sample_indices,
+)
+from .planning import Block, allocate_best_first, allocate_even, merge_blocks
 from .schema import RecordSchema, Schema, SequenceSchema
 from .text import single_line
-from .writer import BoundedWriter, BudgetExceeded
+from .tokens import CHARS_PER_TOKEN, TokenCounter
+from .writer import (
+    BoundedWriter,
+    BudgetExceeded,
+    MeasuringWriter,
+    Sink,
+    sink_writer,
+)
 
 _Scalar: TypeAlias = None | bool | int | float
+_T = TypeVar("_T")
 
-_POLICIES = {"greedy", "even"}
+_POLICIES = {"greedy", "even", "global"}
 _INFERENCE_POLICIES = {"off", "exact", "best_effort"}
 _CIRCULAR = "<...>"
 _PROTOCOL_METHOD = "__budget_repr__"
@@ -47,46 +74,916 @@ _EXACT_STRUCTURED = {
 }
 _KNOWN_STRUCTURED_REPR_OWNERS = _EXACT_STRUCTURED | {collections.OrderedDict}
 
+_Handler: TypeAlias = Callable[[Any, int, RenderContext], str]
+# (protocol method seen at classification, opaque to planning probes, handler,
+# output memoizable per object and budget)
+_DispatchEntry: TypeAlias = tuple[object, bool, _Handler, bool]
+# Classes are held strongly, so the table is cleared once it reaches its limit
+# rather than pinning every dynamically created class forever.
+_DISPATCH: dict[type, _DispatchEntry] = {}
+# A shared container, pinned, with its owning path and the paths from there to
+# the root.
+_Owner: TypeAlias = tuple[object, str, tuple[str, ...]]
+# Owners by container id, which paths were shown whole, and the path a probe
+# starts at.
+_Owners: TypeAlias = tuple[dict[int, _Owner], dict[str, bool], str]
+# Interned reprs of exact str and bytes values; see ``RenderContext.literals``.
+_Literals: TypeAlias = dict[object, tuple[object, str]]
+# Literals up to this length are interned by value, longer ones by identity.
+_INTERNED_BY_VALUE = 64
+# Incremental snapshots. An opened container: the container, how many children
+# were snapshotted, its length, those children, and the lengths of the ones
+# that are containers. A probe root: the root, the largest budget it was probed
+# at, and the nodes and container lengths its probes could read, in order.
+_Opened: TypeAlias = tuple[object, int, int, list[object], list[int]]
+_Probed: TypeAlias = tuple[object, int, list[object], list[int]]
+# The value, budget, and output of a render, plus the snapshots that vouch for it.
+_Entry: TypeAlias = tuple[object, int, str, list[_Opened], list[_Probed]]
+# A node's size ladder: its stub length, the smallest budget past the stub at
+# which its rendering can change, and its complete size, or ``None`` past the
+# cap or when it has no complete rendering.
+_SizeLadder: TypeAlias = tuple[int, int, int | None]
+# A container rendering left unjoined: its opener, the parts its renderer
+# separates with commas, and its closer.
+_Parts: TypeAlias = tuple[str, list[str], str]
+# Marks an exhausted iterator in the incremental snapshot walk.
+_WALKED = object()
+_DISPATCH_LIMIT = 4_096
+# Complete-render probes record the exact size of written subtrees this large.
+_RECORDED_SIZE = 64
+# Default ceiling for complete-budget searches, which have no budget of their own.
+_MAX_COMPLETE_BUDGET = 1_000_000
+# Token-budget search: candidates whose estimated count is within this fraction
+# of the limit are counted exactly, and the search renders at most this often.
+_TOKEN_MARGIN = 0.2
+_TOKEN_SEARCH_STEPS = 32
+# Token-budget searches try no budget past this many characters per token.
+_MAX_CHARS_PER_TOKEN = 32
+# Structural renderers recurse once per nesting level; deeper nodes render
+# through stack-based writers instead, far from the interpreter's recursion
+# limit.
+_MAX_RENDER_DEPTH = 100
+# Global planning prices a text preview this many characters past its stub, and
+# values it at half a complete value.
+_LADDER_PREVIEW = 16
+_PREVIEW_GAIN = 0.5
+add_change_hook(_DISPATCH.clear)
+
 
 class _CannotRenderFull(Exception):
     """Raised when the bounded complete-render path does not support a value."""
 
 
+class _SharedElsewhere(_CannotRenderFull):
+    """Raised when a probe meets a container owned by another path.
+
+    With back-references enabled, such a container must render as a marker,
+    which only the structural renderers draw. The failure belongs to this
+    render's reference state, not to the subtree, so it is never recorded.
+    """
+
+
+@dataclasses.dataclass(frozen=True)
+class RenderReport:
+    """Rendered text plus whether a wall-clock deadline cut the render short.
+
+    ``memo_hits`` and ``memo_misses`` count lookups in the per-render memo of
+    node outputs, which answers a container rendered again at a budget it was
+    already rendered at. They are diagnostics and do not take part in equality.
+    """
+
+    text: str
+    deadline_exceeded: bool = False
+    memo_hits: int = dataclasses.field(default=0, compare=False)
+    memo_misses: int = dataclasses.field(default=0, compare=False)
+
+    @property
+    def memo_hit_rate(self) -> float:
+        lookups = self.memo_hits + self.memo_misses
+        return self.memo_hits / lookups if lookups else 0.0
+
+
+class Renderer:
+    """Reusable engine entry point with options validated once.
+
+    Every call still gets a fresh render context, so cycle tracking, caches,
+    and work allowances never leak between calls; only option validation and
+    the session plumbing used by ``render_child`` and ``render_attrs`` are
+    shared. Instances are safe to share across threads. ``render_many``,
+    ``render_ladder``, and ``tokens`` searches share caches between the
+    renders of one call, and only within it.
+
+    With ``references``, a container shown in full at its first path renders at
+    every later path as a back-reference such as ``<same as [0]['config']>``,
+    so values shared many times are shown, and rendered, once.
+
+    With ``cache``, ``render`` and ``render_report`` answer immutable values
+    rendered before at the same budget and options from that ``ResultCache``.
+    With ``schema_cache``, lists rendered again reuse the schemas inferred for
+    their unchanged samples from that ``SchemaCache``.
+    """
+
+    def __init__(
+        self,
+        policy: Policy = "greedy",
+        *,
+        inference: InferencePolicy = "best_effort",
+        limits: RenderLimits = DEFAULT_LIMITS,
+        references: bool = False,
+        cache: ResultCache | None = None,
+        schema_cache: SchemaCache | None = None,
+    ) -> None:
+        if policy not in _POLICIES:
+            raise ValueError(f"unknown rendering policy: {policy!r}")
+        if inference not in _INFERENCE_POLICIES:
+            raise ValueError(f"unknown inference policy: {inference!r}")
+        if not isinstance(limits, RenderLimits):
+            raise TypeError("limits must be a RenderLimits instance")
+        if (
+            min(
+                limits.inspection_nodes,
+                limits.min_work_nodes,
+                limits.work_nodes_per_char,
+            )
+            < 0
+        ):
+            raise ValueError("render limits must be nonnegative")
+        if cache is not None and not isinstance(cache, ResultCache):
+            raise TypeError("cache must be a ResultCache instance")
+        if schema_cache is not None and not isinstance(schema_cache, SchemaCache):
+            raise TypeError("schema_cache must be a SchemaCache instance")
+        self._policy: Policy = policy
+        self._inference: InferencePolicy = inference
+        self._limits = limits
+        self._references = references
+        self._cache = cache
+        self._schema_cache = schema_cache
+        # Everything besides the value and budget that shapes the output.
+        self._options = (policy, inference, limits, references)
+
+    @property
+    def policy(self) -> Policy:
+        return self._policy
+
+    @property
+    def inference(self) -> InferencePolicy:
+        return self._inference
+
+    @property
+    def limits(self) -> RenderLimits:
+        return self._limits
+
+    @property
+    def references(self) -> bool:
+        return self._references
+
+    @property
+    def cache(self) -> ResultCache | None:
+        return self._cache
+
+    @property
+    def schema_cache(self) -> SchemaCache | None:
+        return self._schema_cache
+
+    def render(
+        self,
+        obj: object,
+        budget: int = 200,
+        *,
+        deadline: float | None = None,
+        tokens: int | None = None,
+        counter: TokenCounter | None = None,
+    ) -> str:
+        """Render ``obj`` within ``budget`` characters.
+
+        ``deadline`` and ``tokens`` are described under ``render_report``.
+        """
+        return self.render_report(
+            obj, budget, deadline=deadline, tokens=tokens, counter=counter
+        ).text
+
+    def render_report(
+        self,
+        obj: object,
+        budget: int = 200,
+        *,
+        deadline: float | None = None,
+        tokens: int | None = None,
+        counter: TokenCounter | None = None,
+    ) -> RenderReport:
+        """Render ``obj`` and report whether the deadline cut the render short.
+
+        Once ``deadline`` seconds have elapsed, the work allowance is spent:
+        pending probes fail, native reprs and custom renderers are skipped, and
+        the engine finishes with the degraded forms it can build without them.
+        The character budget holds either way.
+
+        With ``tokens``, the output is fitted under ``counter(text) <= tokens``
+        instead of a character budget, and ``budget`` is ignored.
+
+        The policy and inference settings apply to the first 100 levels of
+        nesting. Deeper dicts, lists, and tuples are filled greedily on an
+        explicit stack, with previews for text, bytes, and numbers and stubs,
+        never inferred summaries, for everything else that does not fit whole.
+        """
+        expires = _expiry(deadline)
+        if tokens is not None:
+            if tokens < 0:
+                raise ValueError("tokens must be nonnegative")
+            if counter is None:
+                raise ValueError("tokens needs a counter")
+            # Budgets past the complete rendering all render the same output.
+            ceiling = max(1, tokens) * _MAX_CHARS_PER_TOKEN
+            complete = self.estimate(obj, ceiling)
+            shared = self._context(0)
+            return _fit_tokens(
+                lambda budget: self._report(obj, budget, shared, expires),
+                tokens,
+                counter,
+                complete if isinstance(complete, int) else ceiling,
+            )
+        if budget < 0:
+            raise ValueError("budget must be nonnegative")
+        return self._report(obj, budget, None, expires)
+
+    def estimate(self, obj: object, limit: int) -> int | float | None:
+        """Return the length of the complete rendering of ``obj``.
+
+        ``None`` means the complete rendering needs more than ``limit``
+        characters, or more work than a ``limit``-sized render allows.
+        ``math.inf`` means ``obj`` has no complete rendering at any budget: it
+        contains a cycle or a value drawn by a custom renderer or by its own
+        ``repr``. Such values used to report ``None`` as well, which could not
+        be told apart from an overflow. Namedtuples, dataclasses, and other
+        objects are measured in the record form ``render`` gives them; since
+        ``render`` fits a record's field stubs first, it can need more room
+        than this to show a record whole. Characters are counted without
+        building the output.
+        """
+        if limit < 0:
+            raise ValueError("limit must be nonnegative")
+        work = render_work_budget(limit, self._limits)
+        return _measure_full(obj, limit, set(), work)
+
+    def fits(self, obj: object, budget: int) -> bool:
+        """Whether the complete rendering of ``obj`` fits within ``budget``."""
+        size = self.estimate(obj, budget)
+        return size is not None and size <= budget
+
+    def complete_budget(
+        self, obj: object, limit: int | None = None
+    ) -> int | float | None:
+        """Return the smallest budget at which ``obj`` renders losslessly.
+
+        The size is assembled bottom-up from the exact sizes of the top-level
+        children; ``None`` and ``math.inf`` mean what they do for ``estimate``.
+        ``limit`` defaults to a million characters.
+        """
+        return self._complete_sizes(obj, limit)[0]
+
+    def child_complete_budgets(
+        self, obj: object, limit: int | None = None
+    ) -> dict[object, int | float | None]:
+        """Return the complete budget of each top-level child of ``obj``.
+
+        Keys are mapping keys, sequence indexes, set elements, or the field
+        names of records; scalars and opaque values have no children. Each
+        child is measured against ``limit`` on its own, all under one work
+        allowance.
+        """
+        return self._complete_sizes(obj, limit)[1]
+
+    def _complete_sizes(
+        self, obj: object, limit: int | None
+    ) -> tuple[int | float | None, dict[object, int | float | None]]:
+        if limit is None:
+            limit = _MAX_COMPLETE_BUDGET
+        if limit < 0:
+            raise ValueError("limit must be nonnegative")
+        return _complete_sizes(obj, limit, render_work_budget(limit, self._limits))
+
+    def render_into(self, obj: object, budget: int, sink: Sink) -> int:
+        """Render ``obj`` into ``sink`` and return the characters written.
+
+        ``sink`` is a text stream, a list that receives fragments, or a callable
+        taking each fragment. Complete output is written as the fragments the
+        complete-render probe wrote, without joining them. Degraded dicts,
+        lists, tuples, and sets are written as their opener, each rendered
+        entry, the separators, and their closer; each entry, and any other
+        degraded output, is built as one string.
+        """
+        if budget < 0:
+            raise ValueError("budget must be nonnegative")
+        emit = sink_writer(sink)
+        if budget == 0:
+            return 0
+        context = self._context(budget)
+        if not _dispatch(type(obj))[1]:
+            writer = self._run(_probe_writer, obj, budget, context)
+            if writer is not None:
+                return writer.write_to(emit)
+        rendered = self._run(_render_root, obj, budget, context)
+        if isinstance(rendered, str):
+            result = _checked(rendered, budget)
+            emit(result)
+            return len(result)
+        fragments = list(_fragments(rendered))
+        written = sum(map(len, fragments))
+        if written > budget:
+            # Join only to report the overflow; this raises.
+            _checked(_joined(rendered), budget)
+        for fragment in fragments:
+            emit(fragment)
+        return written
+
+    def render_many(
+        self, objs: Iterable[object], budgets: int | Iterable[int]
+    ) -> list[str]:
+        """Render several objects that share schema and probe caches.
+
+        ``budgets`` is one budget per object, or a single budget for all of them.
+        Each object keeps its own cycle tracking, work allowance, and budget
+        guarantee; inference and complete-render probes of sub-objects shared
+        between the objects are computed once for the whole batch.
+        """
+        values = list(objs)
+        if isinstance(budgets, int):
+            limits = [budgets] * len(values)
+        else:
+            limits = list(budgets)
+            if len(limits) != len(values):
+                raise ValueError("render_many needs one budget per object")
+        if any(budget < 0 for budget in limits):
+            raise ValueError("budget must be nonnegative")
+
+        shared = self._context(0)
+        results = []
+        for obj, budget in zip(values, limits):
+            if budget == 0:
+                results.append("")
+                continue
+            context = self._context(budget, shared)
+            result = self._run(_render_value, obj, budget, context)
+            results.append(_checked(result, budget))
+        return results
+
+    def render_ladder(self, obj: object, budgets: Iterable[int]) -> list[str]:
+        """Render one object at several budgets, returning one output per budget.
+
+        Rungs render from the largest budget down under shared schema and probe
+        caches, so inference runs once and every complete-size probe answered
+        on a larger rung answers the smaller ones: a child that fit stays
+        complete wherever its size fits, and one that overflowed is never
+        re-measured at a smaller budget.
+        """
+        limits = list(budgets)
+        if any(budget < 0 for budget in limits):
+            raise ValueError("budget must be nonnegative")
+
+        shared = self._context(0)
+        outputs = {0: ""}
+        for budget in sorted(set(limits), reverse=True):
+            if budget == 0:
+                continue
+            context = self._context(budget, shared)
+            result = self._run(_render_value, obj, budget, context)
+            outputs[budget] = _checked(result, budget)
+        return [outputs[budget] for budget in limits]
+
+    def render_namespace(
+        self, namespace: Mapping[str, object], total_budget: int
+    ) -> dict[str, str]:
+        """Render every variable of ``namespace`` within one shared budget.
+
+        The returned strings together use at most ``total_budget`` characters;
+        names and any separators the caller adds are not counted.
+        """
+        if total_budget < 0:
+            raise ValueError("budget must be nonnegative")
+        values = dict(namespace)
+        if total_budget == 0:
+            return {name: "" for name in values}
+        rendered = self._run(
+            _render_namespace,
+            values,
+            total_budget,
+            self._context(total_budget),
+            values.items(),
+        )
+        used = sum(map(len, rendered.values()))
+        if used > total_budget:
+            raise AssertionError(
+                f"rendering engine exceeded budget {total_budget}: {rendered!r}"
+            )
+        return rendered
+
+    def render_attrs(
+        self, attrs: dict[str, object], type_name: str, budget: int
+    ) -> str:
+        """Render a standalone ``TypeName(key=value, ...)`` record."""
+        if budget < 0:
+            raise ValueError("budget must be nonnegative")
+        if budget == 0:
+            return ""
+        return self._run(
+            lambda value, value_budget, context: _render_record(
+                value, type_name, value_budget, context
+            ),
+            attrs,
+            budget,
+            self._context(budget),
+            [(f".{name}", value) for name, value in attrs.items()],
+        )
+
+    def _report(
+        self,
+        obj: object,
+        budget: int,
+        shared: RenderContext | None,
+        expires: float | None,
+    ) -> RenderReport:
+        if budget == 0:
+            return RenderReport("")
+        # Token searches share one context across budgets; only plain renders
+        # are cached.
+        cache = self._cache if shared is None else None
+        if cache is not None:
+            cached = cache.get(obj, budget, self._options)
+            if cached is not None:
+                return RenderReport(cached)
+        context = self._context(budget, shared, expires=expires)
+        result = _checked(self._run(_render_value, obj, budget, context), budget)
+        if cache is not None and not context.deadline_exceeded:
+            cache.put(obj, budget, self._options, result)
+        return RenderReport(
+            result,
+            context.deadline_exceeded,
+            context.memo_hits,
+            context.memo_misses,
+        )
+
+    def _render_traced(self, obj: object, budget: int) -> tuple[str, RenderTrace]:
+        """Render ``obj`` and record what the render read from it."""
+        # Back-references depend on sharing anywhere in the value.
+        trace = RenderTrace(complete=not self._references)
+        if budget == 0:
+            return "", trace
+        context = self._context(budget)
+        context.trace = trace
+        result = self._run(_render_value, obj, budget, context)
+        return _checked(result, budget), trace
+
+    def _context(
+        self,
+        budget: int,
+        shared: RenderContext | None = None,
+        *,
+        expires: float | None = None,
+    ) -> RenderContext:
+        context = RenderContext(
+            policy=self._policy,
+            inference=self._inference,
+            references=self._references,
+            inspection=InspectionBudget(self._limits.inspection_nodes, expires),
+            work=render_work_budget(budget, self._limits, expires),
+            list_schemas=self._schema_cache,
+        )
+        if shared is not None:
+            context.schema_cache = shared.schema_cache
+            context.probe_cache = shared.probe_cache
+        return context
+
+    def _run(
+        self,
+        render_fn: Callable[[Any, int, RenderContext], _T],
+        obj: object,
+        budget: int,
+        context: RenderContext,
+        roots: Iterable[tuple[str, object]] | None = None,
+    ) -> _T:
+        """Run ``render_fn`` with the public recursive helpers bound to ``context``.
+
+        ``roots`` are the top-level values and their paths for back-references;
+        by default ``obj`` itself is the only root.
+        """
+        context_token = _active_context.set(context)
+        session_token = set_active_session(_SESSION)
+        try:
+            if context.references:
+                _index_references([("", obj)] if roots is None else roots, context)
+            return render_fn(obj, budget, context)
+        finally:
+            reset_active_session(session_token)
+            _active_context.reset(context_token)
+
+
+def _expiry(deadline: float | None) -> float | None:
+    """Convert a deadline in seconds from now into a ``time.monotonic()`` instant."""
+    if deadline is None:
+        return None
+    if deadline < 0:
+        raise ValueError("deadline must be nonnegative")
+    return time.monotonic() + deadline
+
+
+def _fit_tokens(
+    render_at: Callable[[int], RenderReport],
+    tokens: int,
+    counter: TokenCounter,
+    ceiling: int,
+) -> RenderReport:
+    """Return the output of the largest character budget that fits ``tokens``.
+
+    Character budgets are bracketed between the largest one measured to fit
+    and the smallest one counted not to, and searched with secant steps
+    through the last two counted candidates that fall back to bisection. A
+    chars-per-token ratio, recalibrated on every counted candidate, estimates
+    the token count of the rest; only candidates whose estimate lands near
+    the limit reach ``counter``. A lower bound set by an estimate is counted
+    before the search stops on it, and only counted output is returned. No
+    budget past ``ceiling`` is tried.
+    """
+    best = render_at(0)
+    if counter(best.text) > tokens:
+        raise ValueError(f"no output fits within {tokens} tokens")
+    ratio = slope = CHARS_PER_TOKEN
+    calibrated = False
+    low, high = 0, None
+    counted, last = 0, (0, 0)
+    fitted, fitted_exact = best, True
+    budget = min(ceiling, max(1, round(tokens * ratio)))
+    for _ in range(_TOKEN_SEARCH_STEPS):
+        report = render_at(budget)
+        size = len(report.text)
+        count: float = size / ratio
+        exact = not calibrated or abs(count - tokens) <= tokens * _TOKEN_MARGIN
+        if exact:
+            count = counter(report.text)
+            if size and count > 0:
+                ratio, calibrated = size / count, True
+                slope = _secant_slope(last, (size, count), ratio)
+                last = (size, count)
+        if count <= tokens:
+            if exact:
+                best, counted = report, budget
+            low, fitted, fitted_exact = budget, report, exact
+            step = max(1, int((tokens - count) * slope))
+        else:
+            # Estimates drift as the output grows, so only a counted
+            # candidate may rule its budget out.
+            if exact:
+                high = budget
+            step = -max(1, int((count - tokens) * slope))
+        if report.deadline_exceeded:
+            break
+        # Stop once the bracket is narrower than about one token.
+        closed = high is not None and high - low <= max(1, int(slope))
+        if low >= ceiling or closed:
+            if fitted_exact:
+                break
+            # Count the estimated lower bound before settling on it.
+            fitted_exact = True
+            if counter(fitted.text) <= tokens:
+                best = fitted
+                break
+            low, high = counted, low
+            budget = (low + high) // 2
+            continue
+        budget = min(ceiling, budget + step)
+        if high is not None and not low < budget < high:
+            budget = (low + high) // 2
+    if not fitted_exact and counter(fitted.text) <= tokens:
+        return fitted
+    return best
+
+
+def _secant_slope(
+    previous: tuple[int, float], current: tuple[int, float], ratio: float
+) -> float:
+    """Characters per token between two counted outputs, else ``ratio``.
+
+    When later characters cost fewer tokens than the first ones, the ratio
+    through zero takes steps far too short to reach the limit; the slope
+    between the last two counts follows the output as it grows instead.
+    """
+    (previous_size, previous_count), (size, count) = previous, current
+    if previous_count and count != previous_count:
+        slope = (size - previous_size) / (count - previous_count)
+        if 0 < slope <= _MAX_CHARS_PER_TOKEN:
+            return slope
+    return ratio
+
+
+class IncrementalRenderer:
+    """Render named values again, reusing output when nothing it read changed.
+
+    Each render records what it read: the containers whose children it
+    looked at and the roots of its complete-render probes. ``render`` keeps,
+    per name, the output plus a snapshot of exactly those parts: container
+    lengths, child identities, and the lengths of child containers shown as
+    stubs. The next call for the same name, object, and budget returns the
+    previous output when every snapshot still matches, so the check costs in
+    proportion to what the last render inspected rather than to the value.
+
+    A changed value is rendered again whole. Values containing objects other
+    than builtin containers, text, numbers, and ``None``, or rendered by a
+    custom renderer, may depend on state no snapshot covers and are rendered
+    every time; so is everything when the renderer uses back-references.
+    """
+
+    def __init__(self, renderer: Renderer | None = None) -> None:
+        if renderer is not None and not isinstance(renderer, Renderer):
+            raise TypeError("renderer must be a Renderer instance")
+        self._renderer = Renderer() if renderer is None else renderer
+        self._entries: dict[str, _Entry] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def renderer(self) -> Renderer:
+        return self._renderer
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def render(self, name: str, obj: object, budget: int = 200) -> str:
+        """Render ``obj``, the current value of ``name``, within ``budget``."""
+        if budget < 0:
+            raise ValueError("budget must be nonnegative")
+        entry = self._entries.get(name)
+        if (
+            entry is not None
+            and entry[0] is obj
+            and entry[1] == budget
+            and all(map(_opened_unchanged, entry[3]))
+            and all(map(_probed_unchanged, entry[4]))
+        ):
+            self.hits += 1
+            return entry[2]
+        self.misses += 1
+        output, trace = self._renderer._render_traced(obj, budget)
+        snapshots = _snapshots(trace, budget)
+        if snapshots is None:
+            self._entries.pop(name, None)
+        else:
+            self._entries[name] = (obj, budget, output, *snapshots)
+        return output
+
+    def forget(self, name: str) -> None:
+        """Drop what is remembered about ``name``."""
+        self._entries.pop(name, None)
+
+    def clear(self) -> None:
+        """Drop every remembered output; the hit and miss counters are kept."""
+        self._entries.clear()
+
+
+def _snapshots(
+    trace: RenderTrace, budget: int
+) -> tuple[list[_Opened], list[_Probed]] | None:
+    """Snapshot everything ``trace`` recorded, or ``None`` if it cannot vouch."""
+    if not trace.complete:
+        return None
+    # The structural renderers read at most one child per output character,
+    # and inference at most EXACT_ELEMENT_LIMIT plus its samples; uniformity
+    # proofs read whole containers.
+    extent = max(budget, EXACT_ELEMENT_LIMIT)
+    opened = []
+    for obj_id, obj in trace.opened.items():
+        width = len(obj) if obj_id in trace.scanned else extent
+        children = _children(obj, width)
+        opened.append((obj, width, len(obj), children, _lengths(children)))
+    probed = []
+    # How much of each container's subtree some walk already snapshotted.
+    # Probes of a child inside a larger probe's walk need no walk of their own.
+    covered: dict[int, float] = {}
+    for obj, limit in sorted(trace.probed.values(), key=lambda entry: -entry[1]):
+        if covered.get(id(obj), 0) > limit:
+            continue
+        walked = _walk(obj, limit, covered)
+        if walked is None:
+            return None
+        probed.append((obj, limit, *walked))
+    return opened, probed
+
+
+def _opened_unchanged(snapshot: _Opened) -> bool:
+    obj, width, length, children, lengths = snapshot
+    if len(obj) != length:
+        return False
+    current = _children(obj, width)
+    return _same(current, children) and _lengths(current) == lengths
+
+
+def _probed_unchanged(snapshot: _Probed) -> bool:
+    obj, limit, nodes, lengths = snapshot
+    walked = _walk(obj, limit, {})
+    return walked is not None and walked[1] == lengths and _same(walked[0], nodes)
+
+
+def _children(obj: object, width: int) -> list[object]:
+    """The children a render of ``obj`` may read, in a deterministic order."""
+    if isinstance(obj, dict):
+        children = list(
+            itertools.chain.from_iterable(itertools.islice(obj.items(), width))
+        )
+        if isinstance(obj, collections.defaultdict):
+            children.append(obj.default_factory)
+        return children
+    children = list(itertools.islice(obj, width))
+    length = len(obj)
+    if length > width:
+        # Inference also samples the tail of long sequences.
+        if isinstance(obj, (list, tuple)):
+            children.extend(
+                obj[index] for index in sample_indices(length) if index >= width
+            )
+        elif isinstance(obj, collections.deque):
+            children.extend(itertools.islice(reversed(obj), SAMPLE_SIZE // 2))
+    return children
+
+
+def _lengths(children: list[object]) -> list[int]:
+    return [len(child) for child in children if isinstance(child, _STRUCTURED_TYPES)]
+
+
+def _same(current: list[object], previous: list[object]) -> bool:
+    return len(current) == len(previous) and all(map(operator.is_, current, previous))
+
+
+def _walk(
+    obj: object, limit: int, covered: dict[int, float]
+) -> tuple[list[object], list[int]] | None:
+    """The nodes under ``obj`` a probe within ``limit`` may read, in order.
+
+    Each node is charged a lower bound on the characters a complete rendering
+    writes before reading the next: one for its separator or the opening
+    bracket before it, plus the quoted length of text or one for any other
+    leaf. The walk stops at the first node whose separator is already past
+    ``limit``. ``covered`` receives, per container met, the charge walked of
+    its subtree, or infinity when all of it was. Returns ``None`` for a
+    ``Counter``, which a probe reads whole to sort.
+    """
+    nodes: list[object] = []
+    lengths: list[int] = []
+    charged = -1
+    # Open containers: pending children, the container's index, and the
+    # charge when it was reached.
+    stack: list[tuple[Iterator[object], int, int]] = [(iter((obj,)), -1, 0)]
+    while stack:
+        children, start, reached = stack[-1]
+        node = next(children, _WALKED)
+        if node is _WALKED:
+            stack.pop()
+            if start >= 0:
+                covered[id(nodes[start])] = math.inf
+            continue
+        charged += 1
+        if charged > limit:
+            break
+        nodes.append(node)
+        cls = type(node)
+        if cls is str:
+            charged += len(node) + 2
+        elif cls is bytes:
+            charged += len(node) + 3
+        elif not isinstance(node, _STRUCTURED_TYPES):
+            charged += 1
+        elif isinstance(node, collections.Counter):
+            return None
+        else:
+            lengths.append(len(node))
+            if isinstance(node, collections.defaultdict):
+                children = itertools.chain(
+                    (node.default_factory,),
+                    itertools.chain.from_iterable(node.items()),
+                )
+            elif isinstance(node, dict):
+                children = itertools.chain.from_iterable(node.items())
+            else:
+                children = iter(node)
+            stack.append((children, len(nodes) - 1, charged))
+    for _, start, reached in stack:
+        if start >= 0:
+            walked = charged - reached
+            if covered.get(id(nodes[start]), 0) < walked:
+                covered[id(nodes[start])] = walked
+    return nodes, lengths
+
+
+# Public recursive helpers reach the context of the innermost active render.
+_active_context: ContextVar[RenderContext] = ContextVar("reprobate_render_context")
+_SESSION = RenderSession(
+    render_child=lambda child, budget: _render_value(
+        child, budget, _active_context.get()
+    ),
+    render_attrs=lambda attrs, type_name, budget: _render_record(
+        attrs, type_name, budget, _active_context.get()
+    ),
+)
+
+
 def render(
     obj: object,
     budget: int = 200,
     policy: Policy = "greedy",
     *,
     inference: InferencePolicy = "best_effort",
+    deadline: float | None = None,
+    tokens: int | None = None,
+    counter: TokenCounter | None = None,
 ) -> str:
     """Render through the engine used by the public facade."""
-    if budget < 0:
-        raise ValueError("budget must be nonnegative")
-    if policy not in _POLICIES:
-        raise ValueError(f"unknown rendering policy: {policy!r}")
-    if inference not in _INFERENCE_POLICIES:
-        raise ValueError(f"unknown inference policy: {inference!r}")
-    if budget == 0:
-        return ""
+    return _default_renderer(policy, inference).render(
+        obj, budget, deadline=deadline, tokens=tokens, counter=counter
+    )
 
-    context = RenderContext(
-        policy=policy,
-        inference=inference,
-        work=render_work_budget(budget),
+
+def render_report(
+    obj: object,
+    budget: int = 200,
+    policy: Policy = "greedy",
+    *,
+    inference: InferencePolicy = "best_effort",
+    deadline: float | None = None,
+    tokens: int | None = None,
+    counter: TokenCounter | None = None,
+) -> RenderReport:
+    """Render and report how the render ended."""
+    return _default_renderer(policy, inference).render_report(
+        obj, budget, deadline=deadline, tokens=tokens, counter=counter
     )
-    session = RenderSession(
-        render_child=lambda child, child_budget: _render_value(
-            child, child_budget, context
-        ),
-        render_attrs=lambda attrs, type_name, attrs_budget: _render_record(
-            attrs, type_name, attrs_budget, context
-        ),
+
+
+def estimate(obj: object, limit: int) -> int | float | None:
+    """Measure a complete rendering up to ``limit`` characters."""
+    return _default_renderer("greedy", "best_effort").estimate(obj, limit)
+
+
+def fits(obj: object, budget: int) -> bool:
+    """Check whether ``obj`` renders completely within ``budget``."""
+    return _default_renderer("greedy", "best_effort").fits(obj, budget)
+
+
+def complete_budget(
+    obj: object, limit: int | None = None
+) -> int | float | None:
+    """Find the smallest lossless budget from exact subtree sizes."""
+    return _default_renderer("greedy", "best_effort").complete_budget(obj, limit)
+
+
+def child_complete_budgets(
+    obj: object, limit: int | None = None
+) -> dict[object, int | float | None]:
+    """Find the smallest lossless budget of each top-level child."""
+    return _default_renderer("greedy", "best_effort").child_complete_budgets(obj, limit)
+
+
+def render_into(
+    obj: object,
+    budget: int,
+    sink: Sink,
+    policy: Policy = "greedy",
+    *,
+    inference: InferencePolicy = "best_effort",
+) -> int:
+    """Write a render into ``sink`` through the engine used by the facade."""
+    return _default_renderer(policy, inference).render_into(obj, budget, sink)
+
+
+def render_many(
+    objs: Iterable[object],
+    budgets: int | Iterable[int],
+    policy: Policy = "greedy",
+    *,
+    inference: InferencePolicy = "best_effort",
+) -> list[str]:
+    """Render a batch of objects through one engine with shared caches."""
+    return _default_renderer(policy, inference).render_many(objs, budgets)
+
+
+def render_ladder(
+    obj: object,
+    budgets: Iterable[int],
+    policy: Policy = "greedy",
+    *,
+    inference: InferencePolicy = "best_effort",
+) -> list[str]:
+    """Render one object at several budgets with shared caches."""
+    return _default_renderer(policy, inference).render_ladder(obj, budgets)
+
+
+def render_namespace(
+    namespace: Mapping[str, object],
+    total_budget: int,
+    policy: Policy = "even",
+    *,
+    inference: InferencePolicy = "best_effort",
+) -> dict[str, str]:
+    """Render a namespace of variables within one total budget."""
+    return _default_renderer(policy, inference).render_namespace(
+        namespace, total_budget
     )
-    with activate_session(session):
-        result = _render_value(obj, budget, context)
-    if len(result) > budget:
-        raise AssertionError(f"rendering engine exceeded budget {budget}: {result!r}")
-    return result
 
 
 def render_attrs(
@@ -98,89 +995,516 @@ def render_attrs(
     inference: InferencePolicy = "best_effort",
 ) -> str:
     """Render a standalone record through the rendering engine."""
-    if budget < 0:
-        raise ValueError("budget must be nonnegative")
-    if policy not in _POLICIES:
-        raise ValueError(f"unknown rendering policy: {policy!r}")
-    if inference not in _INFERENCE_POLICIES:
-        raise ValueError(f"unknown inference policy: {inference!r}")
-    if budget == 0:
-        return ""
+    return _default_renderer(policy, inference).render_attrs(attrs, type_name, budget)
 
-    context = RenderContext(
-        policy=policy,
-        inference=inference,
-        work=render_work_budget(budget),
-    )
-    session = RenderSession(
-        render_child=lambda child, child_budget: _render_value(
-            child, child_budget, context
-        ),
-        render_attrs=lambda child_attrs, child_type, child_budget: _render_record(
-            child_attrs, child_type, child_budget, context
-        ),
-    )
-    with activate_session(session):
-        return _render_record(attrs, type_name, budget, context)
+
+def _checked(result: str, budget: int) -> str:
+    if len(result) > budget:
+        raise AssertionError(f"rendering engine exceeded budget {budget}: {result!r}")
+    return result
+
+
+def _default_renderer(policy: Policy, inference: InferencePolicy) -> Renderer:
+    renderer = _DEFAULT_RENDERERS.get((policy, inference))
+    if renderer is None:
+        # Not a valid combination; construction raises the descriptive error.
+        renderer = Renderer(policy, inference=inference)
+    return renderer
+
+
+def _render_namespace(
+    namespace: dict[str, object], budget: int, context: RenderContext
+) -> dict[str, str]:
+    """Split one budget across variables like siblings of a single container.
+
+    Every variable starts from its minimal stub and the remaining characters
+    are refined under the context's policy; under ``even`` each variable's
+    complete-size demand is probed once and max-min allocated. When even the
+    stubs cannot fit, the budget is split evenly and each variable degrades
+    within its share.
+    """
+    names = list(namespace)
+    values = list(namespace.values())
+    baseline = [_minimum(value) for value in values]
+    available = budget - sum(map(len, baseline))
+    if available < 0:
+        shares = allocate_even([None] * len(values), budget)
+        rendered = [
+            _render_at(value, name, share, context)
+            for name, value, share in zip(names, values, shares)
+        ]
+    else:
+        rendered = _refine_values(values, baseline, available, context, names)
+    return dict(zip(names, rendered))
 
 
 def _render_value(obj: object, budget: int, context: RenderContext) -> str:
     if budget <= 0:
         return ""
+    if context.trace is not None:
+        _trace_node(obj, context.trace)
+    if context.depth >= _MAX_RENDER_DEPTH:
+        return _render_beyond_depth(obj, budget, context)
+    if context.references and isinstance(obj, _STRUCTURED_TYPES):
+        reference = _back_reference(obj, budget, context)
+        if reference is not None:
+            return reference
+    if context.references and None not in context.path:
+        return _render_owned(obj, budget, context)
+    context.depth += 1
+    try:
+        return _render_node(obj, budget, context)
+    finally:
+        context.depth -= 1
 
-    custom = _custom_renderer(obj)
-    if custom is not None:
-        return _render_custom(obj, budget, context, custom)
 
-    if isinstance(obj, tuple) and hasattr(type(obj), "_fields"):
-        return _render_namedtuple(obj, budget, context)
+def _render_root(obj: object, budget: int, context: RenderContext) -> str | _Parts:
+    """Render the root like ``_render_value``, leaving its parts unjoined.
 
-    if isinstance(obj, _STRUCTURED_TYPES) and not _faithful_structured(obj):
-        native = _native_structured_repr(obj, budget)
-        if native is not None:
-            return native
+    Only exact dicts, lists, tuples, and sets drawn by the structural renderers
+    return parts; everything else comes back as its string. The root owns any
+    back-reference that points at it, and nothing reads what it showed.
+    """
+    parts_of = _PARTS_RENDERERS.get(type(obj))
+    if parts_of is None or _dispatch(type(obj))[1] or context.trace is not None:
+        return _render_value(obj, budget, context)
+    context.depth += 1
+    try:
+        full = _probe_full(obj, budget, context)
+        return full if full is not None else parts_of(obj, budget, context)
+    finally:
+        context.depth -= 1
+
+
+def _render_owned(obj: object, budget: int, context: RenderContext) -> str:
+    """Render a node and note whether it shows whole the path an owner lies on."""
+    path = "".join(context.path)
+    tracked = path in context.reference_shown
+    if tracked:
+        _forget_shown(context)
+    context.depth += 1
+    try:
+        result = _render_node(obj, budget, context)
+    finally:
+        context.depth -= 1
+    if tracked:
+        context.reference_shown[path] = _shows_whole(obj, result, context)
+    return result
+
+
+def _forget_shown(context: RenderContext) -> None:
+    """Forget what was shown below the current path, about to be redrawn."""
+    if not context.references or None in context.path:
+        return
+    prefix = "".join(context.path)
+    if prefix not in context.reference_shown:
+        return
+    for path, shown in context.reference_shown.items():
+        if shown and path != prefix and _within(path, prefix):
+            context.reference_shown[path] = False
+
+
+def _shows_whole(obj: object, rendered: str, context: RenderContext) -> bool:
+    """Whether ``rendered`` is all of ``obj``, with ancestors as cycle markers."""
+    writer = BoundedWriter(len(rendered))
+    try:
+        _write_full(
+            obj,
+            writer,
+            set(context.seen),
+            literals=context.literals,
+            objects=True,
+            cycles=True,
+        )
+    except (BudgetExceeded, _CannotRenderFull):
+        return False
+    return writer.getvalue() == rendered
+
+
+def _trace_node(obj: object, trace: RenderTrace) -> None:
+    """Record a node whose rendering is about to be read.
+
+    Exact builtin containers are snapshotted by their children; exact leaves
+    never change. Anything else may render from state no snapshot covers.
+    """
+    cls = type(obj)
+    if _dispatch(cls)[1]:
+        trace.complete = False
+    elif cls in _EXACT_STRUCTURED:
+        trace.opened[id(obj)] = obj
+    elif cls not in _EXACT_LEAVES:
+        trace.complete = False
+
+
+def _render_at(
+    obj: object, label: str | None, budget: int, context: RenderContext
+) -> str:
+    """Render a child at path segment ``label``; ``None`` marks no path."""
+    if not context.references:
+        return _render_value(obj, budget, context)
+    context.path.append(label)
+    try:
+        return _render_value(obj, budget, context)
+    finally:
+        context.path.pop()
+
+
+def _back_reference(obj: object, budget: int, context: RenderContext) -> str | None:
+    """Point a shared container back at the path that owns it.
+
+    Once the owning path has been rendered showing the container whole, any
+    other path renders it as ``<same as PATH>``, unless the marker does not fit
+    or its complete rendering is no longer than the marker.
+    """
+    entry = context.reference_paths.get(id(obj))
+    if entry is None or id(obj) in context.seen or None in context.path:
+        return None
+    if entry[1] == "".join(context.path):
+        return None
+    if not _owner_shown(entry, context.reference_shown):
+        return None
+    marker = f"<same as {entry[1]}>"
+    if len(marker) > budget:
+        return None
+    if _try_complete_for_plan(obj, len(marker), context) is not None:
+        return None
+    return marker
+
+
+def _owner_shown(entry: _Owner, shown: dict[str, bool]) -> bool:
+    """Whether the owning path, or a path above it, was rendered whole."""
+    return any(shown[path] for path in entry[2])
+
+
+def _index_references(
+    roots: Iterable[tuple[str, object]], context: RenderContext
+) -> None:
+    """Make the first path of every shared container its owner.
+
+    Built-in containers are walked in display order with an explicit stack,
+    down to the structural depth and within the work allowance. Paths are
+    spelled as the renderers label children; set members have none. Each
+    owner keeps its path and the paths above it, which renders mark as shown
+    whole or not; markers point only at an owner shown whole.
+    """
+    first: dict[int, tuple[object, int]] = {}
+    shared: set[int] = set()
+    # Visited containers as (path, index of the parent's entry or -1).
+    nodes: list[tuple[str | None, int]] = []
+    stack: list[tuple[str | None, object, int, int]] = [
+        (path, obj, 0, -1) for path, obj in reversed(list(roots))
+    ]
+    while stack:
+        path, obj, depth, parent = stack.pop()
+        if not isinstance(obj, _STRUCTURED_TYPES) or not _faithful_structured(
+            type(obj)
+        ):
+            continue
+        obj_id = id(obj)
+        if obj_id in first:
+            shared.add(obj_id)
+            continue
+        if not context.work.consume():
+            break
+        first[obj_id] = (obj, len(nodes))
+        nodes.append((path, parent))
+        if depth < _MAX_RENDER_DEPTH:
+            children = list(_labeled_children(obj, path, context.literals))
+            stack.extend(
+                (label, child, depth + 1, first[obj_id][1])
+                for label, child in reversed(children)
+            )
+    context.reference_paths = {}
+    context.reference_shown = {}
+    for obj_id in shared:
+        obj, index = first[obj_id]
+        path = nodes[index][0]
+        if path is None:
+            continue
+        chain: list[str] = []
+        while index >= 0:
+            above, index = nodes[index]
+            chain.append(above)  # type: ignore[arg-type]
+        context.reference_paths[obj_id] = (obj, path, tuple(chain))
+        context.reference_shown.update(dict.fromkeys(chain, False))
+
+
+def _labeled_children(
+    obj: object, path: str | None, literals: _Literals
+) -> Iterator[tuple[str | None, object]]:
+    """Yield the container children of ``obj`` with their paths."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if isinstance(value, _STRUCTURED_TYPES):
+                if path is None:
+                    label = None
+                else:
+                    label = f"{path}[{_minimum_key(key, literals)}]"
+                yield label, value
+    elif isinstance(obj, (set, frozenset)):
+        for value in obj:
+            yield None, value
+    else:
+        for index, value in enumerate(obj):
+            if isinstance(value, _STRUCTURED_TYPES):
+                yield None if path is None else f"{path}[{index}]", value
+
+
+def _render_beyond_depth(obj: object, budget: int, context: RenderContext) -> str:
+    """Render a node nested too deeply for the recursive structural renderers.
 
-    full = _try_full(obj, budget, context.work)
+    The complete-render probe walks an explicit stack, so a deep value that
+    fits is still shown whole. Otherwise dicts, lists, and tuples are opened
+    depth-first on an explicit stack and filled the way the greedy policy
+    fills them: each child is shown whole, opened, previewed, or stubbed in
+    turn, always leaving room to count what is left out and to close every
+    open container. The policy and inference settings are not consulted.
+    """
+    full = _try_complete_for_plan(obj, budget, context)
     if full is not None:
         return full
+    shape = _deep_shape(obj, context.literals)
+    if shape is None:
+        if type(obj) in _EXACT_LEAVES:
+            return _render_node(obj, budget, context)
+        return _fit_summary(_minimum(obj), budget)
+    opener, entries, closer = shape
+    if len(opener) + _deep_tail(len(obj), 0, closer) > budget:
+        return _fit_summary(_minimum(obj), budget)
+
+    parts = [opener]
+    used = len(opener)
+    open_ids = set(context.seen)
+    open_ids.add(id(obj))
+    # Frames are [entries, written, total, closer, reserved outside, id].
+    stack: list[list[Any]] = [[entries, 0, len(obj), closer, 0, id(obj)]]
+    while stack:
+        frame = stack[-1]
+        entries, written, total, closer, outer, obj_id = frame
+        entry = next(entries, None)
+        if entry is None:
+            parts.append(closer)
+            used += len(closer)
+            stack.pop()
+            open_ids.discard(obj_id)
+            continue
+        label, child = entry
+        prefix = (", " if written else "") + label
+        after = outer + _deep_tail(total, written + 1, closer)
+        room = budget - used - len(prefix) - after
+        piece = None
+        if room <= 0:
+            pass
+        elif id(child) in open_ids:
+            piece = _CIRCULAR if len(_CIRCULAR) <= room else None
+        elif (piece := _try_complete_for_plan(child, room, context)) is not None:
+            pass
+        elif (shape := _deep_shape(child, context.literals)) is not None:
+            child_opener, child_entries, child_closer = shape
+            if len(child_opener) + _deep_tail(len(child), 0, child_closer) <= room:
+                if context.trace is not None:
+                    _trace_node(child, context.trace)
+                parts.append(prefix + child_opener)
+                used += len(prefix) + len(child_opener)
+                frame[1] += 1
+                open_ids.add(id(child))
+                stack.append(
+                    [child_entries, 0, len(child), child_closer, after, id(child)]
+                )
+                continue
+        elif type(child) in _EXACT_LEAVES:
+            piece = _render_node(child, room, context) or None
+        elif len(stub := _minimum(child)) <= room:
+            piece = stub
+        if piece is None:
+            if len(stack) == 1 and not written:
+                return _fit_summary(_minimum(obj), budget)
+            marker = f"{', ' if written else ''}...{total - written} more"
+            parts.append(marker + closer[-1])
+            used += len(marker) + 1
+            stack.pop()
+            open_ids.discard(obj_id)
+            continue
+        parts.append(prefix + piece)
+        used += len(prefix) + len(piece)
+        frame[1] += 1
+    return "".join(parts)
 
-    if _is_scalar(obj) or isinstance(obj, (str, bytes)):
-        if not _faithful_scalar(obj):
-            native = _normalized_native_repr(obj, budget)
-            if native is not None:
-                return native
-        if _is_scalar(obj):
-            return _render_scalar(obj, budget)
-        if isinstance(obj, str):
-            return _render_text(obj, budget, "str")
-        return _render_text(obj, budget, "bytes")
-    if isinstance(obj, collections.defaultdict):
-        return _render_defaultdict(obj, budget, context)
-    if isinstance(obj, collections.Counter):
-        return _render_counter(obj, budget, context)
+
+def _deep_shape(
+    obj: object, literals: _Literals
+) -> tuple[str, Iterator[tuple[str, object]], str] | None:
+    """``(opener, (label, child) entries, closer)`` for a dict, list, or tuple.
+
+    Only containers whose repr is plain bracket syntax qualify; the closer of a
+    singleton tuple carries its comma.
+    """
+    cls = type(obj)
+    if cls not in (dict, list, tuple) and (
+        cls in _EXACT_STRUCTURED or not _faithful_structured(cls)
+    ):
+        return None
+    if _dispatch(cls)[1]:
+        return None
     if isinstance(obj, dict):
-        return _render_mapping(obj, budget, context)
-    if isinstance(obj, collections.deque):
-        return _render_deque(obj, budget, context)
-    if isinstance(obj, (list, tuple)):
-        return _render_sequence(obj, budget, context)
-    if isinstance(obj, (set, frozenset)):
-        return _render_set(obj, budget, context)
-    return _render_object(obj, budget, context)
+        pairs = (
+            (f"{_minimum_key(key, literals)}: ", value) for key, value in obj.items()
+        )
+        return "{", pairs, "}"
+    entries = (("", value) for value in obj)  # type: ignore[attr-defined]
+    if isinstance(obj, list):
+        return "[", entries, "]"
+    return "(", entries, ",)" if len(obj) == 1 else ")"  # type: ignore[arg-type]
 
 
-def _custom_renderer(obj: object):
-    method = getattr(type(obj), _PROTOCOL_METHOD, None)
+def _deep_tail(total: int, written: int, closer: str) -> int:
+    """Room an open container needs to mark its unwritten entries and close."""
+    left = total - written
+    if not left:
+        return len(closer)
+    return len(closer) + len(f"...{left} more") + (2 if written else 0)
+
+
+def _render_node(obj: object, budget: int, context: RenderContext) -> str:
+    _, _, handler, memoizable = _dispatch(type(obj))
+    if not memoizable:
+        return handler(obj, budget, context)
+    obj_id = id(obj)
+    if obj_id in context.seen:
+        # The handler must draw the circular marker.
+        return handler(obj, budget, context)
+    key = (obj_id, budget)
+    entry = context.memo.get(key)
+    if entry is not None:
+        context.memo_hits += 1
+        return entry[1]
+    context.memo_misses += 1
+    result = handler(obj, budget, context)
+    if _CIRCULAR not in result and not (
+        context.references and "<same as " in result
+    ):
+        # Output that met a cycle or placed a back-reference depends on the
+        # path it was rendered from.
+        context.memo[key] = (obj, result)
+    return result
+
+
+def _dispatch(cls: type) -> _DispatchEntry:
+    """Return the handler entry for ``cls``, classifying the class on first use.
+
+    The protocol method is read on every lookup so a class that gains, loses, or
+    replaces ``__budget_repr__`` is reclassified. Registry changes clear the
+    whole table through a registry change hook. A class that a pending named
+    registration may still claim is not cached, since importing the named
+    module changes its renderer without a registration.
+    """
+    method = getattr(cls, _PROTOCOL_METHOD, None)
+    entry = _DISPATCH.get(cls)
+    if entry is None or entry[0] is not method:
+        if len(_DISPATCH) >= _DISPATCH_LIMIT:
+            _DISPATCH.clear()
+        opaque, handler, memoizable = _classify(cls, method)
+        entry = (method, opaque, handler, memoizable)
+        if not has_pending(cls):
+            _DISPATCH[cls] = entry
+    return entry
+
+
+def _classify(cls: type, method: object) -> tuple[bool, _Handler, bool]:
+    """Map a class to its handler, probe opacity, and memoizability.
+
+    Opaque classes are skipped by planning probes, and memoizable ones may
+    reuse their output per object and budget. The checks mirror the engine's
+    precedence: custom renderers, namedtuples, container subclasses with their
+    own repr, then a complete-render attempt ahead of the structural renderer
+    for the class. Built-in containers and namedtuples are memoized; leaves
+    are cheaper to render again, arbitrary objects may run their own
+    ``__repr__``, and custom renderers qualify only when declared pure.
+    """
     if method is not None:
-        return lambda value, budget: method(value, budget)
-    return get_renderer(type(obj))
+        handler = _custom_handler(lambda value, budget: method(value, budget))
+        return True, handler, is_pure(method)
+    renderer = get_renderer(cls)
+    if renderer is not None:
+        return True, _custom_handler(renderer), is_pure(renderer)
+    if issubclass(cls, tuple) and hasattr(cls, "_fields"):
+        return True, _render_namedtuple, True
+
+    structural = _structural_handler(cls)
+
+    def render_full(obj: object, budget: int, context: RenderContext) -> str:
+        full = _probe_full(obj, budget, context)
+        if full is not None:
+            return full
+        return structural(obj, budget, context)
+
+    if not issubclass(cls, _STRUCTURED_TYPES):
+        return False, render_full, False
+    if _faithful_structured(cls):
+        return False, render_full, True
+
+    custom_repr = _has_custom_structured_repr(cls)
+
+    def render_native(obj: object, budget: int, context: RenderContext) -> str:
+        native = _native_structured_repr(obj, budget, custom_repr, context)
+        if native is not None:
+            return native
+        return render_full(obj, budget, context)
+
+    return False, render_native, False
+
+
+def _custom_handler(renderer) -> _Handler:
+    return lambda obj, budget, context: _render_custom(obj, budget, context, renderer)
+
+
+def _structural_handler(cls: type) -> _Handler:
+    """Select the degrading renderer used when a complete render does not fit."""
+    handler: _Handler
+    if cls is type(None) or issubclass(cls, (bool, int, float)):
+        handler = lambda obj, budget, context: _render_scalar(obj, budget)
+    elif issubclass(cls, str):
+        handler = lambda obj, budget, context: _render_text(obj, budget, "str")
+    elif issubclass(cls, bytes):
+        handler = lambda obj, budget, context: _render_text(obj, budget, "bytes")
+    elif issubclass(cls, collections.defaultdict):
+        return _render_defaultdict
+    elif issubclass(cls, collections.Counter):
+        return _render_counter
+    elif issubclass(cls, dict):
+        return _render_mapping
+    elif issubclass(cls, collections.deque):
+        return _render_deque
+    elif issubclass(cls, (list, tuple)):
+        return _render_sequence
+    elif issubclass(cls, (set, frozenset)):
+        return _render_set
+    else:
+        return _render_object
+
+    if _faithful_scalar(cls):
+        return handler
+
+    def render_native(obj: object, budget: int, context: RenderContext) -> str:
+        native = _normalized_native_repr(obj, budget, context)
+        if native is not None:
+            return native
+        return handler(obj, budget, context)
+
+    return render_native
 
 
 def _render_custom(obj: object, budget: int, context: RenderContext, renderer) -> str:
     obj_id = id(obj)
     if obj_id in context.seen:
         return _fit(_CIRCULAR, budget)
+    if context.work.out_of_time():
+        # A custom renderer may be arbitrarily slow; past the deadline only the
+        # type stub is affordable.
+        return _fit_summary(f"<{type(obj).__name__}>", budget)
     context.seen.add(obj_id)
+    # Children a custom renderer draws through ``render_child`` have no path.
+    context.path.append(None)
     try:
         rendered = single_line(renderer(obj, budget))
         truncated = rendered[:budget]
@@ -192,64 +1516,76 @@ def _render_custom(obj: object, budget: int, context: RenderContext, renderer) -
                 truncated = truncated[:-1]
         return truncated
     finally:
+        context.path.pop()
         context.seen.discard(obj_id)
 
 
+_EXACT_LEAVES = frozenset({str, bytes, int, float, bool, type(None)})
+
+
 def _is_scalar(obj: object) -> bool:
     return obj is None or isinstance(obj, (bool, int, float))
 
 
-def _faithful_scalar(obj: object) -> bool:
-    """True when the builtin scalar/text rendering matches the object's own repr."""
-    if obj is None or isinstance(obj, bool):
+def _faithful_scalar(cls: type) -> bool:
+    """True when the builtin scalar/text rendering matches the class's own repr."""
+    if cls is type(None) or issubclass(cls, bool):
         return True
     for base in (int, float, str, bytes):
-        if isinstance(obj, base):
-            return type(obj) is base or type(obj).__repr__ is base.__repr__
+        if issubclass(cls, base):
+            return cls is base or cls.__repr__ is base.__repr__
     return True
 
 
-def _faithful_structured(obj: object) -> bool:
-    """True when structural container output matches the object's own repr.
+def _faithful_structured(cls: type) -> bool:
+    """True when structural container output matches the class's own repr.
 
     Exact builtin containers always qualify. dict/list/tuple subclasses qualify
     while they inherit the base repr, because that repr carries no class name.
     set, frozenset, deque, Counter, and defaultdict reprs embed the class name,
     so their subclasses must degrade through their own repr instead.
     """
-    cls = type(obj)
     if cls in _EXACT_STRUCTURED:
         return True
     for base in (dict, list, tuple):
-        if isinstance(obj, base):
+        if issubclass(cls, base):
             return cls.__repr__ is base.__repr__
     return False
 
 
-def _native_structured_repr(obj: object, budget: int) -> str | None:
+def _native_structured_repr(
+    obj: object, budget: int, custom_repr: bool, context: RenderContext
+) -> str | None:
     """Honor a container subclass repr when it is affordable, else degrade."""
     try:
         # Known container reprs spell every entry, so large values cannot fit and
         # their potentially expensive reprs need not be built. A user override
         # may instead return a compact summary independent of container length.
-        if not _has_custom_structured_repr(obj) and len(obj) * 3 > budget:
+        if not custom_repr and len(obj) * 3 > budget:
             return None
     except Exception:
         return None
-    return _normalized_native_repr(obj, budget)
+    return _normalized_native_repr(obj, budget, context)
 
 
-def _has_custom_structured_repr(obj: object) -> bool:
+def _has_custom_structured_repr(cls: type) -> bool:
     """Whether the effective repr comes from a user-defined container class."""
     owner = next(
-        (cls for cls in type(obj).__mro__ if "__repr__" in cls.__dict__),
+        (klass for klass in cls.__mro__ if "__repr__" in klass.__dict__),
         object,
     )
     return owner not in _KNOWN_STRUCTURED_REPR_OWNERS
 
 
-def _normalized_native_repr(obj: object, budget: int) -> str | None:
-    """Return a single-line native repr when it fits and is not the default."""
+def _normalized_native_repr(
+    obj: object, budget: int, context: RenderContext
+) -> str | None:
+    """Return a single-line native repr when it fits and is not the default.
+
+    Native reprs run arbitrary code, so none is attempted past the deadline.
+    """
+    if context.work.out_of_time():
+        return None
     try:
         native = repr(obj)
     except Exception:
@@ -271,17 +1607,19 @@ def _render_scalar(obj: _Scalar, budget: int) -> str:
 
 
 def _render_text(obj: str | bytes, budget: int, kind: str) -> str:
-    preview = _literal_preview(obj, budget)
+    # One scan to the larger budget serves both the plain and the sized preview.
+    lengths = _preview_lengths(obj, budget)
     length_prefix = f"<{kind}({len(obj)}): "
     inner_budget = budget - len(length_prefix) - 1
 
     if inner_budget >= 12:
-        inner = _literal_preview(obj, inner_budget)
+        inner = _preview_at(obj, lengths, inner_budget)
         if len(inner) >= 8:
             candidate = f"{length_prefix}{inner}>"
             if len(candidate) <= budget:
                 return candidate
 
+    preview = _preview_at(obj, lengths, budget)
     if preview:
         return preview
 
@@ -292,42 +1630,106 @@ def _render_text(obj: str | bytes, budget: int, kind: str) -> str:
 
 
 def _literal_preview(obj: str | bytes, budget: int) -> str:
-    """Return the longest escaped, quoted prefix with an ellipsis that fits.
+    """Return the longest escaped, quoted prefix with an ellipsis that fits."""
+    return _preview_at(obj, _preview_lengths(obj, budget), budget)
+
+
+class _EscapedWidths(dict):
+    """Escaped width of each character inside a quoted literal.
+
+    ``single_quote`` is the width of ``'``: one while the literal is spelled with
+    double quotes or holds no double quote, two once it must be escaped.
+    """
+
+    def __init__(self, single_quote: int) -> None:
+        super().__init__({"'": single_quote, '"': 1})
+
+    def __missing__(self, char: str) -> int:
+        width = len(repr(char)) - 2
+        if len(self) < _ESCAPED_WIDTH_CACHE_LIMIT:
+            self[char] = width
+        return width
+
+
+_ESCAPED_WIDTH_CACHE_LIMIT = 4_096
+_CHAR_WIDTHS = _EscapedWidths(single_quote=1)
+_ESCAPED_CHAR_WIDTHS = _EscapedWidths(single_quote=2)
+_BYTE_WIDTHS = tuple(
+    1 if byte in b"'\"" else len(repr(bytes([byte]))) - 3 for byte in range(256)
+)
+_ESCAPED_BYTE_WIDTHS = tuple(
+    2 if byte == ord("'") else width for byte, width in enumerate(_BYTE_WIDTHS)
+)
+
+
+def _preview_lengths(obj: str | bytes, limit: int) -> list[int]:
+    """Lengths of the ellipsized literal of each prefix size, in one scan.
 
-    ``len(repr(obj[:size]))`` is nondecreasing in ``size``: every character adds
-    at least one output character, and a quote-style flip only ever lengthens
-    the escaped form (the single-to-double flip happens on the first quote of a
-    quoteless prefix, the double-to-single flip re-escapes prior quotes). That
-    monotonicity makes the longest fitting prefix binary-searchable.
+    Entry ``size`` is ``len(repr(obj[:size])) + 3``. Every source character adds
+    at least one output character and the quote style only flips toward longer
+    spellings, so the list is nondecreasing and can be bisected for any budget
+    up to ``limit``. ``repr`` uses double quotes while a prefix holds single
+    quotes but no double quote; from the first double quote on, every single
+    quote in the prefix is escaped.
     """
+    if isinstance(obj, bytes):
+        # Quotes, ellipsis, and the ``b`` marker.
+        base = 6
+        single, double = ord("'"), ord('"')
+        widths, escaped_widths = _BYTE_WIDTHS, _ESCAPED_BYTE_WIDTHS
+    else:
+        base = 5
+        single, double = "'", '"'
+        widths, escaped_widths = _CHAR_WIDTHS, _ESCAPED_CHAR_WIDTHS
+    chunk = obj[: max(0, limit - base)]
+
+    first_double = chunk.find(double)
+    if first_double < 0 or single not in chunk:
+        return list(itertools.accumulate(map(widths.__getitem__, chunk), initial=base))
+
+    head = chunk[:first_double]
+    lengths = list(itertools.accumulate(map(widths.__getitem__, head), initial=base))
+    # The first double quote flips the style, escaping the earlier single quotes.
+    flipped = lengths[-1] + head.count(single) + 1
+    lengths.extend(
+        itertools.accumulate(
+            map(escaped_widths.__getitem__, chunk[first_double + 1 :]),
+            initial=flipped,
+        )
+    )
+    return lengths
+
+
+def _preview_at(obj: str | bytes, lengths: list[int], budget: int) -> str:
+    """Spell the longest prefix whose ellipsized literal fits ``budget``."""
     if budget < 5:
         return ""
+    size = bisect.bisect_right(lengths, budget) - 1
+    if size < 0:
+        return ""
+    literal = repr(obj[:size])
+    return literal[:-1] + "..." + literal[-1]
 
-    def candidate(size: int) -> str:
-        literal = repr(obj[:size])
-        return literal[:-1] + "..." + literal[-1]
 
-    # Each source character costs at least one output character, so prefixes
-    # longer than the budget can never fit.
-    low, high = 0, min(len(obj), budget)
-    if len(candidate(low)) > budget:
-        return ""
-    while low < high:
-        middle = (low + high + 1) // 2
-        if len(candidate(middle)) <= budget:
-            low = middle
-        else:
-            high = middle - 1
-    return candidate(low)
+def _render_sequence(
+    obj: list[object] | tuple[object, ...] | collections.deque,
+    budget: int,
+    context: RenderContext,
+    *,
+    allow_inference: bool = True,
+) -> str:
+    return _joined(
+        _sequence_parts(obj, budget, context, allow_inference=allow_inference)
+    )
 
 
-def _render_sequence(
+def _sequence_parts(
     obj: list[object] | tuple[object, ...] | collections.deque,
     budget: int,
     context: RenderContext,
     *,
     allow_inference: bool = True,
-) -> str:
+) -> str | _Parts:
     obj_id = id(obj)
     if obj_id in context.seen:
         return _fit(_CIRCULAR, budget)
@@ -341,18 +1743,13 @@ def _render_sequence(
         if product is not None:
             return product
 
-        values: list[object] = []
-        rendered: list[str] = []
-
-        for index, value in enumerate(obj):
-            candidate = _minimum(value)
-            trial_values = rendered + [candidate]
-            omitted = len(obj) - index - 1
-            cost = _parts_cost(trial_values, omitted, 2, singleton_comma=is_tuple)
-            if cost > budget:
-                break
-            values.append(value)
-            rendered.append(candidate)
+        values, rendered = _fit_skeleton(
+            ((value, _minimum(value)) for value in obj),
+            len(obj),
+            budget,
+            2,
+            singleton_comma=is_tuple,
+        )
 
         omitted = len(obj) - len(rendered)
         if not rendered:
@@ -380,6 +1777,9 @@ def _render_sequence(
             rendered,
             budget - _parts_cost(rendered, omitted, 2, singleton_comma=is_tuple),
             context,
+            [f"[{index}]" for index in range(len(values))]
+            if context.references
+            else None,
         )
         if allow_inference:
             summary, sample_count = _sampled_summary(obj, budget, context)
@@ -392,16 +1792,34 @@ def _render_sequence(
                 if sample_count > plain_complete or (
                     plain_complete == 0 and rendered == baseline
                 ):
+                    _forget_shown(context)
                     return summary
         parts = rendered + ([f"...{omitted} more"] if omitted else [])
-        body = ", ".join(parts)
         if is_tuple and len(obj) == 1 and omitted == 0:
-            body += ","
-        return open_bracket + body + close_bracket
+            close_bracket = "," + close_bracket
+        return open_bracket, parts, close_bracket
     finally:
         context.seen.discard(obj_id)
 
 
+def _joined(rendered: str | _Parts) -> str:
+    if isinstance(rendered, str):
+        return rendered
+    opener, parts, closer = rendered
+    return opener + ", ".join(parts) + closer
+
+
+def _fragments(rendered: _Parts) -> Iterator[str]:
+    """Yield the fragments ``_joined`` would concatenate, in order."""
+    opener, parts, closer = rendered
+    yield opener
+    for index, part in enumerate(parts):
+        if index:
+            yield ", "
+        yield part
+    yield closer
+
+
 def _parts_cost(
     rendered: list[str],
     omitted: int,
@@ -410,13 +1828,68 @@ def _parts_cost(
     singleton_comma: bool = False,
 ) -> int:
     """Cost of shell plus comma-joined parts and a truthful omission marker."""
-    parts = rendered + ([f"...{omitted} more"] if omitted else [])
-    cost = shell + sum(map(len, parts)) + max(0, len(parts) - 1) * 2
-    if singleton_comma and len(rendered) == 1 and not omitted:
+    return _skeleton_cost(
+        sum(map(len, rendered)),
+        len(rendered),
+        omitted,
+        shell,
+        singleton_comma=singleton_comma,
+    )
+
+
+def _skeleton_cost(
+    used: int,
+    count: int,
+    omitted: int,
+    shell: int,
+    *,
+    singleton_comma: bool = False,
+) -> int:
+    """``_parts_cost`` for ``count`` parts whose lengths sum to ``used``."""
+    cost = shell + used
+    if omitted:
+        cost += len(f"...{omitted} more")
+        count += 1
+    cost += max(0, count - 1) * 2
+    if singleton_comma and count == 1 and not omitted:
         cost += 1
     return cost
 
 
+def _fit_skeleton(
+    entries: Iterable[tuple[_T, str]],
+    total: int,
+    budget: int,
+    shell: int,
+    *,
+    singleton_comma: bool = False,
+) -> tuple[list[_T], list[str]]:
+    """Keep leading ``(payload, part)`` entries while the skeleton still fits.
+
+    ``total`` is the container length, so each step can price the omission
+    marker for the entries that would remain. A running length keeps every
+    step O(1); fitting costs O(entries shown) instead of re-measuring the kept
+    prefix for each candidate.
+    """
+    payloads: list[_T] = []
+    rendered: list[str] = []
+    used = 0
+    for index, (payload, part) in enumerate(entries):
+        cost = _skeleton_cost(
+            used + len(part),
+            index + 1,
+            total - index - 1,
+            shell,
+            singleton_comma=singleton_comma,
+        )
+        if cost > budget:
+            break
+        payloads.append(payload)
+        rendered.append(part)
+        used += len(part)
+    return payloads, rendered
+
+
 def _has_complete_baseline(
     values: list[object],
     baseline: list[str],
@@ -424,7 +1897,7 @@ def _has_complete_baseline(
 ) -> bool:
     """True when any baseline entry already shows a complete value."""
     return any(
-        _try_full(value, len(rendered), context.work) == rendered
+        _probe_full(value, len(rendered), context) == rendered
         for value, rendered in zip(values, baseline)
     )
 
@@ -438,7 +1911,7 @@ def _complete_count(
     return sum(
         1
         for value, value_rendered in zip(values, rendered)
-        if _try_full(value, len(value_rendered), context.work) == value_rendered
+        if _probe_full(value, len(value_rendered), context) == value_rendered
     )
 
 
@@ -467,9 +1940,11 @@ def _uniform_product(
     element_budget = budget - len(shell)
     if element_budget <= 0:
         return None
-    rendered = _try_full(first, element_budget, context.work)
+    rendered = _probe_full(first, element_budget, context)
     if rendered is None:
         return None
+    if context.trace is not None:
+        context.trace.scanned[id(obj)] = obj
     if not _is_uniform(obj, context.work):
         return None
     if is_tuple:
@@ -528,35 +2003,33 @@ def _collapsed_summary(
 
 
 def _render_mapping(obj: dict, budget: int, context: RenderContext) -> str:
+    return _joined(_mapping_parts(obj, budget, context))
+
+
+def _mapping_parts(obj: dict, budget: int, context: RenderContext) -> str | _Parts:
     obj_id = id(obj)
     if obj_id in context.seen:
         return _fit(_CIRCULAR, budget)
 
     context.seen.add(obj_id)
     try:
-        keys: list[str] = []
-        values: list[object] = []
-        rendered: list[str] = []
-
-        for index, (key, value) in enumerate(obj.items()):
-            key_rendered = _minimum_key(key)
-            value_rendered = _minimum(value)
-            trial = rendered + [f"{key_rendered}: {value_rendered}"]
-            omitted = len(obj) - index - 1
-            if _parts_cost(trial, omitted, 2) > budget:
-                break
-            keys.append(key_rendered)
-            values.append(value)
-            rendered.append(f"{key_rendered}: {value_rendered}")
+        entries, rendered = _fit_skeleton(
+            _mapping_entries(obj, context.literals), len(obj), budget, 2
+        )
 
         omitted = len(obj) - len(rendered)
         if not rendered:
             return _collapsed_summary(obj, budget, context, "{", "}")
 
+        keys = [key for key, _ in entries]
+        values = [value for _, value in entries]
         value_renderings = [part[len(key) + 2 :] for key, part in zip(keys, rendered)]
         baseline = list(value_renderings)
         available = budget - _parts_cost(rendered, omitted, 2)
-        value_renderings = _refine_values(values, value_renderings, available, context)
+        labels = [f"[{key}]" for key in keys] if context.references else None
+        value_renderings = _refine_values(
+            values, value_renderings, available, context, labels
+        )
         only_summaries = all(
             value.startswith("<") and value.endswith(">") for value in value_renderings
         )
@@ -567,22 +2040,40 @@ def _render_mapping(obj: dict, budget: int, context: RenderContext) -> str:
         ):
             inferred = _inferred_summary(obj, budget, context)
             if inferred is not None:
+                _forget_shown(context)
                 return inferred
         rendered = [
             f"{key}: {value_rendered}"
             for key, value_rendered in zip(keys, value_renderings)
         ]
         parts = rendered + ([f"...{omitted} more"] if omitted else [])
-        return "{" + ", ".join(parts) + "}"
+        return "{", parts, "}"
     finally:
         context.seen.discard(obj_id)
 
 
+def _mapping_entries(
+    obj: dict, literals: _Literals
+) -> Iterable[tuple[tuple[str, object], str]]:
+    """Yield ``((key skeleton, value), "key: value")`` skeleton entries lazily."""
+    for key, value in obj.items():
+        key_rendered = _minimum_key(key, literals)
+        yield (key_rendered, value), f"{key_rendered}: {_minimum(value)}"
+
+
 def _render_set(
     obj: set[object] | frozenset[object],
     budget: int,
     context: RenderContext,
 ) -> str:
+    return _joined(_set_parts(obj, budget, context))
+
+
+def _set_parts(
+    obj: set[object] | frozenset[object],
+    budget: int,
+    context: RenderContext,
+) -> str | _Parts:
     obj_id = id(obj)
     if obj_id in context.seen:
         return _fit(_CIRCULAR, budget)
@@ -597,17 +2088,9 @@ def _render_set(
         open_bracket = prefix + "{"
         close_bracket = "}" + suffix
         shell = len(open_bracket) + len(close_bracket)
-        values: list[object] = []
-        rendered: list[str] = []
-
-        for index, value in enumerate(obj):
-            candidate = _minimum(value)
-            trial_values = rendered + [candidate]
-            omitted = len(obj) - index - 1
-            if _parts_cost(trial_values, omitted, shell) > budget:
-                break
-            values.append(value)
-            rendered.append(candidate)
+        values, rendered = _fit_skeleton(
+            ((value, _minimum(value)) for value in obj), len(obj), budget, shell
+        )
 
         omitted = len(obj) - len(rendered)
         if not rendered:
@@ -620,11 +2103,22 @@ def _render_set(
             context,
         )
         parts = rendered + ([f"...{omitted} more"] if omitted else [])
-        return open_bracket + ", ".join(parts) + close_bracket
+        return open_bracket, parts, close_bracket
     finally:
         context.seen.discard(obj_id)
 
 
+# Exact builtin containers whose degraded rendering ``render_into`` can write
+# without joining it first.
+_PARTS_RENDERERS: dict[type, Callable[[Any, int, RenderContext], str | _Parts]] = {
+    dict: _mapping_parts,
+    list: _sequence_parts,
+    tuple: _sequence_parts,
+    set: _set_parts,
+    frozenset: _set_parts,
+}
+
+
 def _render_deque(obj: collections.deque, budget: int, context: RenderContext) -> str:
     name = type(obj).__name__
     suffix = f", maxlen={obj.maxlen})" if obj.maxlen is not None else ")"
@@ -698,7 +2192,7 @@ def _render_object(obj: object, budget: int, context: RenderContext) -> str:
     type_name = type(obj).__name__
 
     if not dataclasses.is_dataclass(obj):
-        native = _normalized_native_repr(obj, budget)
+        native = _normalized_native_repr(obj, budget, context)
         if native is not None:
             return native
 
@@ -760,32 +2254,28 @@ def _render_record(
     if not attrs:
         return _fit_summary(tag, budget)
 
-    values: list[object] = []
-    names: list[str] = []
-    rendered: list[str] = []
-    items = list(attrs.items())
     shell_cost = len(type_name) + 2
+    entries, rendered = _fit_skeleton(
+        (((name, value), f"{name}={_minimum(value)}") for name, value in attrs.items()),
+        len(attrs),
+        budget,
+        shell_cost,
+    )
 
-    for index, (name, value) in enumerate(items):
-        value_rendered = _minimum(value)
-        trial = rendered + [f"{name}={value_rendered}"]
-        omitted = len(items) - index - 1
-        if _parts_cost(trial, omitted, shell_cost) > budget:
-            break
-        names.append(name)
-        values.append(value)
-        rendered.append(f"{name}={value_rendered}")
-
-    omitted = len(items) - len(rendered)
+    omitted = len(attrs) - len(rendered)
     if not rendered:
         return _fit_summary(tag, budget)
 
+    names = [name for name, _ in entries]
+    values = [value for _, value in entries]
+
     value_renderings = [part[len(name) + 1 :] for name, part in zip(names, rendered)]
     value_renderings = _refine_values(
         values,
         value_renderings,
         budget - _parts_cost(rendered, omitted, shell_cost),
         context,
+        [f".{name}" for name in names] if context.references else None,
     )
     rendered = [
         f"{name}={value_rendered}"
@@ -793,7 +2283,10 @@ def _render_record(
     ]
     parts = rendered + ([f"...{omitted} more"] if omitted else [])
     result = f"{type_name}(" + ", ".join(parts) + ")"
-    return result if len(result) <= budget else _fit_summary(tag, budget)
+    if len(result) > budget:
+        _forget_shown(context)
+        return _fit_summary(tag, budget)
+    return result
 
 
 def _refine_values(
@@ -801,14 +2294,25 @@ def _refine_values(
     rendered: list[str],
     available: int,
     context: RenderContext,
+    labels: list[str] | None = None,
 ) -> list[str]:
+    """Spend ``available`` characters improving sibling renderings.
+
+    ``labels`` are the siblings' path segments for back-references; without
+    them the siblings have no path.
+    """
     if available <= 0 or not rendered:
         return rendered
 
+    segments: list[str | None] = (
+        [None] * len(values) if labels is None else list(labels)
+    )
     result = list(rendered)
     if context.policy == "greedy":
         for index, value in enumerate(values):
-            candidate = _render_value(value, len(result[index]) + available, context)
+            candidate = _render_at(
+                value, segments[index], len(result[index]) + available, context
+            )
             growth = len(candidate) - len(result[index])
             if candidate != result[index] and growth <= available:
                 result[index] = candidate
@@ -816,8 +2320,10 @@ def _refine_values(
             if available <= 0:
                 break
         return result
+    if context.policy == "global":
+        return _refine_values_global(values, result, available, context, segments)
 
-    return _refine_values_even(values, result, available, context)
+    return _refine_values_even(values, result, available, context, segments)
 
 
 def _refine_values_even(
@@ -825,38 +2331,41 @@ def _refine_values_even(
     rendered: list[str],
     available: int,
     context: RenderContext,
+    segments: list[str | None],
 ) -> list[str]:
-    """Plan sibling demand before max-min allocation and one render pass."""
+    """Allocate sibling demand from size ladders, then render once each.
+
+    A sibling whose complete form is no longer than its baseline takes it
+    first, returning the saved characters. The rest demand exactly their
+    complete size, nothing when no reachable rung changes them, or an
+    open-ended share otherwise; max-min allocation settles the demands before
+    any sibling is rendered.
+    """
     result = list(rendered)
-    complete: list[str | None] = [None] * len(values)
+    ladders = [
+        _size_ladder(value, len(value_rendered) + available, context)
+        for value, value_rendered in zip(values, rendered)
+    ]
 
-    # First accept complete representations that already fit the baseline. A shorter
-    # complete value is both more truthful and returns its saved characters before
-    # sibling demand is measured.
+    # A shorter complete value is both more truthful and returns its saved
+    # characters before sibling demand is settled.
     for index, value in enumerate(values):
-        full = _try_complete_for_plan(value, len(result[index]), context)
-        if full is None:
+        size = ladders[index][2]
+        if size is None or size > len(result[index]):
             continue
-        available += len(result[index]) - len(full)
-        result[index] = full
-        complete[index] = full
+        full = _try_complete_for_plan(value, size, context)
+        if full is not None:
+            available += len(result[index]) - len(full)
+            result[index] = full
 
     demands: list[int | None] = []
-    for index, value in enumerate(values):
-        if complete[index] is not None:
+    for index, (_, rung, size) in enumerate(ladders):
+        if size is not None:
+            demands.append(max(0, size - len(result[index])))
+        elif rung > len(result[index]) + available:
             demands.append(0)
-            continue
-
-        full = _try_complete_for_plan(
-            value,
-            len(result[index]) + available,
-            context,
-        )
-        if full is None:
+        else:
             demands.append(None)
-            continue
-        complete[index] = full
-        demands.append(len(full) - len(result[index]))
 
     allocations = allocate_even(demands, available)
     carry = 0
@@ -864,13 +2373,16 @@ def _refine_values_even(
     for index, value in enumerate(values):
         allowance = allocations[index] + carry
         demand = demands[index]
-        full = complete[index]
-        if full is not None and demand is not None and allowance >= demand:
-            candidate = full
-        elif allowance > 0:
-            candidate = _render_value(value, len(result[index]) + allowance, context)
-        else:
+        size = ladders[index][2]
+        candidate = None
+        if allowance <= 0:
             candidate = result[index]
+        elif size is not None and demand is not None and allowance >= demand:
+            candidate = _try_complete_for_plan(value, size, context)
+        if candidate is None:
+            candidate = _render_at(
+                value, segments[index], len(result[index]) + allowance, context
+            )
 
         growth = len(candidate) - len(result[index])
         if candidate != result[index] and growth <= allowance:
@@ -882,19 +2394,201 @@ def _refine_values_even(
     return result
 
 
+def _size_ladder(obj: object, cap: int, context: RenderContext) -> _SizeLadder:
+    """The lengths at which the rendering of ``obj`` changes, up to ``cap``.
+
+    Numbers, booleans, and ``None`` show their stub until their complete form
+    fits. Text grows a preview one character past its stub, and containers and
+    records may open or summarize themselves there, so their next rung is the
+    character after the stub. The complete size comes from one probe whose
+    outcome is recorded for the rest of the render, so each node is measured
+    once however many of its ancestors plan around it.
+    """
+    stub = len(_minimum(obj))
+    full = _try_complete_for_plan(obj, cap, context)
+    size = None if full is None else len(full)
+    if type(obj) in _EXACT_LEAVES and _is_scalar(obj):
+        return stub, cap + 1 if size is None else size, size
+    return stub, stub + 1, size
+
+
+def _refine_values_global(
+    values: list[object],
+    rendered: list[str],
+    available: int,
+    context: RenderContext,
+    segments: list[str | None],
+) -> list[str]:
+    """Allocate best-first among siblings, looking ahead into their subtrees.
+
+    Each sibling offers a ladder of expansion blocks from anywhere below it,
+    in the order they must be taken. A heap over this container's siblings
+    takes the block that reveals the most values per character until none
+    fits; characters no block can use flow through the siblings in order, as
+    under ``greedy``. Each sibling then plans its own share again when it is
+    rendered, answering from the memoized ladders of its children.
+    """
+    ladders = [
+        _ladder(value, len(value_rendered) + available, context, set())
+        for value, value_rendered in zip(values, rendered)
+    ]
+    allocations, carry = allocate_best_first(ladders, available)
+    result = list(rendered)
+
+    for index, value in enumerate(values):
+        allowance = allocations[index] + carry
+        carry = allowance
+        if allowance <= 0:
+            continue
+        candidate = _render_at(
+            value, segments[index], len(result[index]) + allowance, context
+        )
+        growth = len(candidate) - len(result[index])
+        if candidate != result[index] and growth <= allowance:
+            result[index] = candidate
+            carry = allowance - growth
+
+    return result
+
+
+def _ladder(
+    obj: object, cap: int, context: RenderContext, path: set[int]
+) -> list[Block]:
+    """Expansion blocks of ``obj`` beyond its minimal stub, memoized per node.
+
+    A scalar or text reveals one value when completed, and text too long to
+    complete offers a short preview instead. A container or record first opens
+    into the skeleton of child stubs it can show, revealing one value per
+    child, and then offers its children's blocks merged by worth. Ladders stop
+    at ``cap`` characters, at the work allowance, and at the structural depth
+    limit. A ladder built at a larger
+    cap answers a smaller one with its blocks up to that cap while its opening
+    block still fits, since the skeleton it opened is then the same; otherwise
+    the ladder is rebuilt at the new cap.
+    """
+    obj_id = id(obj)
+    cached = context.ladders.get(obj_id)
+    if cached is not None and cached[1] >= cap:
+        blocks = cached[2]
+        if not blocks or blocks[0][0] <= cap:
+            return _ladder_prefix(blocks, cap)
+    if obj_id in path or len(path) >= _MAX_RENDER_DEPTH:
+        return []
+    if not context.work.consume():
+        return []
+    if context.trace is not None:
+        _trace_node(obj, context.trace)
+
+    steps: list[Block] = []
+    stub = len(_minimum(obj))
+    if isinstance(obj, (str, bytes)) or _is_scalar(obj):
+        full = _try_complete_for_plan(obj, cap, context)
+        if full is not None and len(full) > stub:
+            steps = [(len(full) - stub, 1.0)]
+        elif full is None and isinstance(obj, (str, bytes)):
+            preview = _literal_preview(obj, min(cap, stub + _LADDER_PREVIEW))
+            if len(preview) > stub:
+                steps = [(len(preview) - stub, _PREVIEW_GAIN)]
+    elif (shape := _ladder_shape(obj, context.literals)) is not None:
+        shell, entries, length = shape
+        shown, parts = _fit_skeleton(entries, length, cap, shell)
+        if parts:
+            opened = _parts_cost(parts, length - len(parts), shell) - stub
+            path.add(obj_id)
+            try:
+                children = [_ladder(child, cap, context, path) for child in shown]
+            finally:
+                path.discard(obj_id)
+            steps = merge_blocks(
+                [
+                    (max(1, opened), float(len(parts))),
+                    *heapq.merge(*children, key=_block_priority),
+                ],
+                cap,
+            )
+    context.ladders[obj_id] = (obj, cap, steps)
+    return steps
+
+
+def _ladder_prefix(steps: list[Block], cap: int) -> list[Block]:
+    """The leading blocks of ``steps`` that cost at most ``cap`` together."""
+    spent = 0
+    for index, (cost, _) in enumerate(steps):
+        spent += cost
+        if spent > cap:
+            return steps[:index]
+    return steps
+
+
+def _ladder_shape(
+    obj: object, literals: _Literals
+) -> tuple[int, Iterable[tuple[object, str]], int] | None:
+    """The shell, skeleton entries, and entry count a renderer opens ``obj`` with.
+
+    Covers faithful containers and the records ``_render_record`` draws;
+    anything else renders through hooks the planner does not model.
+    """
+    try:
+        form = _record_form(obj)
+    except _CannotRenderFull:
+        return None
+    if form is not None:
+        type_name, attrs = form
+        entries = (
+            (value, f"{name}={_minimum(value)}") for name, value in attrs.items()
+        )
+        return len(type_name) + 2, entries, len(attrs)
+    if not _faithful_structured(type(obj)):
+        return None
+    return _open_shell(obj), _ladder_entries(obj, literals), len(obj)
+
+
+def _block_priority(block: Block) -> float:
+    return -block[1] / block[0]
+
+
+def _open_shell(obj: object) -> int:
+    """Characters a container spends around its entries, as its renderer spells it."""
+    name = type(obj).__name__
+    if isinstance(obj, collections.defaultdict):
+        return len(f"{name}({_factory_name(obj.default_factory)}, {{}})")
+    if isinstance(obj, collections.Counter):
+        return len(f"{name}({{}})")
+    if isinstance(obj, collections.deque):
+        maxlen = f", maxlen={obj.maxlen}" if obj.maxlen is not None else ""
+        return len(f"{name}([]{maxlen})")
+    if isinstance(obj, (set, frozenset)) and type(obj) is not set:
+        return len(f"{name}({{}})")
+    return 2
+
+
+def _ladder_entries(obj: object, literals: _Literals) -> Iterable[tuple[object, str]]:
+    """Yield ``(child, skeleton part)`` pairs in display order."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            yield value, f"{_minimum_key(key, literals)}: {_minimum(value)}"
+    else:
+        for value in obj:  # type: ignore[attr-defined]
+            yield value, _minimum(value)
+
+
 def _try_complete_for_plan(
     obj: object, budget: int, context: RenderContext
 ) -> str | None:
     """Probe complete built-in output without invoking opaque customization hooks."""
-    if _custom_renderer(obj) is not None:
+    if _dispatch(type(obj))[1]:
         return None
-    if isinstance(obj, tuple) and hasattr(type(obj), "_fields"):
-        return None
-    return _try_full(obj, budget, context.work)
+    return _probe_full(obj, budget, context)
 
 
-def _minimum_key(obj: object) -> str:
-    full = _try_full(obj, 40)
+def _minimum_key(obj: object, literals: _Literals | None = None) -> str:
+    if literals is not None and (type(obj) is str or type(obj) is bytes):
+        # Record-heavy payloads repeat a few keys; spell each one once.
+        full = _literal(obj, literals) if len(obj) + 2 <= 40 else None
+        if full is not None and len(full) > 40:
+            full = None
+    else:
+        full = _try_full(obj, 40)
     if full is not None:
         return full
     if isinstance(obj, (str, bytes)):
@@ -928,6 +2622,152 @@ def _minimum(obj: object) -> str:
     return f"<{type(obj).__name__}>"
 
 
+def _probe_full(obj: object, budget: int, context: RenderContext) -> str | None:
+    """``_try_full`` memoized per object for the rest of the render.
+
+    Complete output has one length, so a value that fit once answers every
+    budget, and a value that overflowed a budget overflows every smaller one.
+    Failures caused by an exhausted work allowance are not recorded.
+    """
+    record = context.probe_cache.get(id(obj))
+    if record is not None:
+        if record.output is not None and _reference_owners(context) is None:
+            return record.output if len(record.output) <= budget else None
+        if record.size is not None and record.size > budget:
+            return None
+    writer = _probe_writer(obj, budget, context)
+    if writer is None:
+        return None
+    record = context.probe_cache[id(obj)]
+    record.output = writer.getvalue()
+    return record.output
+
+
+def _probe_writer(
+    obj: object, budget: int, context: RenderContext
+) -> BoundedWriter | None:
+    """Run a complete-render probe and keep its unjoined fragments.
+
+    Failures are recorded as ``_probe_full`` records them; successful output
+    is left for the caller to join or stream. Callers check cached output first.
+    """
+    obj_id = id(obj)
+    if context.trace is not None and isinstance(obj, _STRUCTURED_TYPES):
+        probed = context.trace.probed.get(obj_id)
+        if probed is None or probed[1] < budget:
+            context.trace.probed[obj_id] = (obj, budget)
+    record = context.probe_cache.get(obj_id)
+    if record is not None:
+        if record.unsupported or budget <= record.failed:
+            return None
+    else:
+        record = ProbeRecord(obj)
+        context.probe_cache[obj_id] = record
+
+    writer = BoundedWriter(budget)
+    try:
+        _write_full(
+            obj,
+            writer,
+            set(),
+            context.work,
+            context.probe_cache,
+            _reference_owners(context),
+            context.literals,
+        )
+    except BudgetExceeded:
+        record.failed = max(record.failed, budget)
+        return None
+    except _SharedElsewhere:
+        return None
+    except _CannotRenderFull:
+        if context.work.remaining > 0:
+            record.unsupported = True
+        return None
+    return writer
+
+
+def _reference_owners(context: RenderContext) -> _Owners | None:
+    """Owners of shared containers and the path a probe starts at."""
+    if not context.references or None in context.path:
+        return None
+    return context.reference_paths, context.reference_shown, "".join(context.path)
+
+
+def _measure_full(
+    obj: object, limit: int, seen: set[int], work: InspectionBudget
+) -> int | float | None:
+    """Count the complete rendering up to ``limit`` without building it.
+
+    Records are measured in their record form. Returns ``None`` past ``limit``
+    or the work allowance, and ``math.inf`` when there is no complete rendering.
+    """
+    writer = MeasuringWriter(limit)
+    try:
+        _write_full(obj, writer, seen, work, objects=True)
+    except BudgetExceeded:
+        return None
+    except _CannotRenderFull:
+        return math.inf if work.remaining > 0 else None
+    return writer.length
+
+
+def _complete_sizes(
+    obj: object, limit: int, work: InspectionBudget
+) -> tuple[int | float | None, dict[object, int | float | None]]:
+    """Exact complete sizes of ``obj`` and of each of its top-level children.
+
+    The container's punctuation comes from the child iterator ``_write_full``
+    walks, written into a writer of its own; each child is measured once
+    against ``limit`` and added to it, so no subtree is walked twice. Sizes
+    combine as ``estimate`` reports them: ``math.inf`` wins over ``None``.
+    """
+    if isinstance(obj, (str, bytes)) or _is_scalar(obj):
+        return _measure_full(obj, limit, set(), work), {}
+    shell = MeasuringWriter(sys.maxsize)
+    seen: set[int] = set()
+    try:
+        form = _record_form(obj)
+        frame = _open_node(obj, shell, seen, work, None, None, objects=True)
+    except _CannotRenderFull:
+        return (math.inf if work.remaining > 0 else None), {}
+    if frame is None:
+        return _measure_full(obj, limit, seen, work), {}
+
+    seen.add(id(obj))
+    names = None if form is None else list(form[1])
+    children: dict[object, int | float | None] = {}
+    total: int | float | None = 0
+    key = None
+    for index, child in enumerate(frame[1]):
+        size = _measure_full(child, limit, seen, work)
+        total = _add_sizes(total, size)
+        if names is not None:
+            children[names[index]] = size
+        elif isinstance(obj, dict):
+            # Mapping iterators yield each key before its value.
+            if index % 2 == 0:
+                key = child
+            else:
+                children[key] = size
+        elif isinstance(obj, (set, frozenset)):
+            children[child] = size
+        else:
+            children[index] = size
+    total = _add_sizes(total, shell.length)
+    if total is not None and limit < total < math.inf:
+        total = None
+    return total, children
+
+
+def _add_sizes(
+    total: int | float | None, size: int | float | None
+) -> int | float | None:
+    if total is None or size is None:
+        return math.inf if math.inf in (total, size) else None
+    return total + size
+
+
 def _try_full(
     obj: object,
     budget: int,
@@ -946,13 +2786,129 @@ def _write_full(
     writer: BoundedWriter,
     seen: set[int],
     work: InspectionBudget | None = None,
+    records: dict[int, ProbeRecord] | None = None,
+    owners: _Owners | None = None,
+    literals: _Literals | None = None,
+    objects: bool = False,
+    cycles: bool = False,
 ) -> None:
+    """Write the complete rendering of ``obj`` or raise.
+
+    Containers are walked with an explicit stack of open frames rather than
+    by recursion, so depth is limited by the budget and the work allowance
+    instead of the interpreter's recursion limit.
+
+    With ``records``, every container written records its outcome bottom-up:
+    the exact size of a subtree that was written, the allowance it overflowed,
+    or that it has no complete rendering. Later probes answer from those
+    records instead of walking the subtree again.
+
+    With ``owners``, a descendant container whose owner outside the probe's
+    path was shown whole raises ``_SharedElsewhere``, and recorded outputs are
+    not reused since their descendants were never checked. With ``literals``,
+    str and bytes reprs are interned for the rest of the render. With
+    ``objects``, namedtuples, dataclasses, and other objects are written in the
+    record form the structural renderers give them instead of raising. With
+    ``cycles``, a container met again inside itself, or one in ``seen``, is
+    written as the cycle marker instead of raising.
+    """
+    reuse = owners is None
+    frame = _open_node(
+        obj, writer, seen, work, records, literals, objects, cycles, reuse
+    )
+    if frame is None:
+        return
+    seen.add(id(frame[0]))
+    stack = [frame]
+    try:
+        while stack:
+            frame = stack[-1]
+            for child in frame[1]:
+                if type(child) is str:
+                    # The commonest leaf, written inline as ``_open_node`` would.
+                    if work is not None and not work.consume():
+                        raise _CannotRenderFull
+                    if len(child) + 2 > writer.remaining:
+                        raise BudgetExceeded
+                    writer.write(_literal(child, literals))
+                    continue
+                if owners is not None:
+                    _check_owner(child, owners)
+                opened = _open_node(
+                    child,
+                    writer,
+                    seen,
+                    work,
+                    records,
+                    literals,
+                    objects,
+                    cycles,
+                    reuse,
+                )
+                if opened is not None:
+                    seen.add(id(opened[0]))
+                    stack.append(opened)
+                    break
+            else:
+                stack.pop()
+                seen.discard(id(frame[0]))
+                if records is not None:
+                    _record_size(frame, writer, records)
+    except (BudgetExceeded, _CannotRenderFull) as error:
+        while stack:
+            frame = stack.pop()
+            seen.discard(id(frame[0]))
+            if records is not None and not isinstance(error, _SharedElsewhere):
+                _record_failure(frame, error, work, records)
+        raise
+
+
+def _check_owner(obj: object, owners: _Owners) -> None:
+    paths, shown, prefix = owners
+    entry = paths.get(id(obj))
+    if (
+        entry is not None
+        and not _within(entry[1], prefix)
+        and _owner_shown(entry, shown)
+    ):
+        raise _SharedElsewhere
+
+
+def _within(path: str, prefix: str) -> bool:
+    """Whether ``path`` is ``prefix`` or a path below it."""
+    return path.startswith(prefix) and (
+        len(path) == len(prefix) or path[len(prefix)] in "[."
+    )
+
+
+# A container being written: the object, its pending children, where its
+# output began, the allowance it had, and its probe record if one existed.
+_WriteFrame: TypeAlias = tuple[object, Iterator[object], int, int, ProbeRecord | None]
+
+
+def _open_node(
+    obj: object,
+    writer: BoundedWriter,
+    seen: set[int],
+    work: InspectionBudget | None,
+    records: dict[int, ProbeRecord] | None,
+    literals: _Literals | None,
+    objects: bool = False,
+    cycles: bool = False,
+    reuse: bool = True,
+) -> _WriteFrame | None:
+    """Write a leaf or a recorded container whole, or open a frame for it.
+
+    ``reuse`` allows writing a container's recorded complete output.
+    """
     if work is not None and not work.consume():
         raise _CannotRenderFull
-    if isinstance(obj, (str, bytes)) or _is_scalar(obj):
+    if type(obj) not in _EXACT_LEAVES and (
+        isinstance(obj, (str, bytes)) or _is_scalar(obj)
+    ):
         # A subclass with its own repr controls its own spelling; the probe
         # must not claim the builtin rendering is complete for it.
-        if not _faithful_scalar(obj):
+        if not _faithful_scalar(type(obj)):
             raise _CannotRenderFull
 
     if isinstance(obj, str):
@@ -960,129 +2916,203 @@ def _write_full(
         # quotes. Reject obvious overflows before allocating the complete repr.
         if len(obj) + 2 > writer.remaining:
             raise BudgetExceeded
-        writer.write(repr(obj))
-        return
+        writer.write(_literal(obj, literals))
+        return None
 
     if isinstance(obj, bytes):
         # A bytes repr has the same lower bound plus its leading ``b`` marker.
         if len(obj) + 3 > writer.remaining:
             raise BudgetExceeded
-        writer.write(repr(obj))
-        return
+        writer.write(_literal(obj, literals))
+        return None
 
     if _is_scalar(obj):
         rendered = _bounded_scalar_repr(obj, writer.remaining)
         if rendered is None:
             raise BudgetExceeded
         writer.write(rendered)
-        return
+        return None
+
+    form = _record_form(obj) if objects else None
+    if form is not None:
+        if id(obj) in seen:
+            if cycles:
+                writer.write(_CIRCULAR)
+                return None
+            raise _CannotRenderFull
+        type_name, attrs = form
+        if not attrs:
+            writer.write(f"<{type_name}>")
+            return None
+        children = _record_children(type_name, attrs, writer)
+        return obj, children, writer.length, writer.remaining, None
 
     # Reject namedtuples and container subclasses whose repr differs from the
     # structural spelling; they degrade through their own representations.
-    if not _faithful_structured(obj):
+    if not _faithful_structured(type(obj)):
         raise _CannotRenderFull
 
-    obj_id = id(obj)
-    if obj_id in seen:
+    if id(obj) in seen:
+        if cycles:
+            writer.write(_CIRCULAR)
+            return None
         raise _CannotRenderFull
-    seen.add(obj_id)
-    try:
-        if isinstance(obj, collections.defaultdict):
-            writer.write("defaultdict(")
-            writer.write(repr(obj.default_factory))
-            writer.write(", ")
-            _write_mapping_items(obj.items(), writer, seen, work)
-            writer.write(")")
-            return
+    record = None if records is None else records.get(id(obj))
+    if record is not None:
+        if record.output is not None and reuse:
+            writer.write(record.output)
+            return None
+        if record.unsupported:
+            raise _CannotRenderFull
+        if writer.remaining <= record.failed or (
+            record.size is not None and record.size > writer.remaining
+        ):
+            raise BudgetExceeded
+    children = _container_children(obj, writer)
+    return obj, children, writer.length, writer.remaining, record
 
-        if isinstance(obj, collections.Counter):
-            if not obj:
-                writer.write("Counter()")
-                return
-            # Avoid sorting a large counter merely to discover that it cannot fit.
-            if len(obj) * 3 > writer.remaining:
-                raise BudgetExceeded
-            writer.write("Counter(")
-            _write_mapping_items(_counter_ordered(obj).items(), writer, seen, work)
-            writer.write(")")
-            return
-
-        if isinstance(obj, dict):
-            _write_mapping_items(obj.items(), writer, seen, work)
-            return
-
-        if isinstance(obj, collections.deque):
-            if not obj and obj.maxlen is None:
-                writer.write("deque()")
-                return
-            writer.write("deque(")
-            _write_sequence_items(obj, "[", "]", writer, seen, work)
-            if obj.maxlen is not None:
-                writer.write(f", maxlen={obj.maxlen}")
-            writer.write(")")
-            return
-
-        if isinstance(obj, (set, frozenset)):
+
+def _record_form(obj: object) -> tuple[str, dict[str, object]] | None:
+    """The type name and attributes of the record form ``render`` draws ``obj`` in.
+
+    Returns ``None`` for containers, and raises ``_CannotRenderFull`` for values
+    drawn by a custom renderer or by their own ``repr``.
+    """
+    cls = type(obj)
+    _, opaque, handler, _ = _dispatch(cls)
+    if handler is _render_namedtuple:
+        return cls.__name__, dict(zip(cls._fields, obj))
+    if opaque:
+        raise _CannotRenderFull
+    if isinstance(obj, _STRUCTURED_TYPES):
+        return None
+    if not dataclasses.is_dataclass(obj) and cls.__repr__ is not object.__repr__:
+        raise _CannotRenderFull
+    return cls.__name__, _object_attrs(obj)
+
+
+def _literal(obj: str | bytes, literals: _Literals | None) -> str:
+    """``repr(obj)``, interned for the rest of the render for exact str and bytes."""
+    if literals is None or (type(obj) is not str and type(obj) is not bytes):
+        return repr(obj)
+    key = obj if len(obj) <= _INTERNED_BY_VALUE else id(obj)
+    entry = literals.get(key)
+    if entry is None:
+        entry = literals[key] = (obj, repr(obj))
+    return entry[1]
+
+
+def _record_size(
+    frame: _WriteFrame, writer: BoundedWriter, records: dict[int, ProbeRecord]
+) -> None:
+    obj, _, start, _, record = frame
+    size = writer.length - start
+    # Small subtrees are cheaper to walk again than to record.
+    if size >= _RECORDED_SIZE:
+        if record is None:
+            record = records[id(obj)] = ProbeRecord(obj)
+        record.size = size
+
+
+def _record_failure(
+    frame: _WriteFrame,
+    error: Exception,
+    work: InspectionBudget | None,
+    records: dict[int, ProbeRecord],
+) -> None:
+    obj, _, _, allowance, record = frame
+    if isinstance(error, BudgetExceeded):
+        if record is None:
+            record = records[id(obj)] = ProbeRecord(obj)
+        record.failed = max(record.failed, allowance)
+    elif work is None or work.remaining > 0:
+        # Cycles and unfaithful descendants are properties of the subtree; an
+        # exhausted work allowance is not.
+        if record is None:
+            record = records[id(obj)] = ProbeRecord(obj)
+        record.unsupported = True
+
+
+def _container_children(obj: object, writer: BoundedWriter) -> Iterator[object]:
+    """Iterate a container's children, writing its punctuation around them.
+
+    The caller writes each child completely before resuming the iterator.
+    """
+    if isinstance(obj, collections.defaultdict):
+        prefix = f"defaultdict({obj.default_factory!r}, {{"
+        return _mapping_children(obj.items(), writer, prefix, "})")
+    if isinstance(obj, collections.Counter):
+        return _counter_children(obj, writer)
+    if isinstance(obj, dict):
+        return _mapping_children(obj.items(), writer, "{", "}")
+    if isinstance(obj, collections.deque):
+        if not obj and obj.maxlen is None:
+            return _sequence_children((), writer, "deque()", "")
+        suffix = "])" if obj.maxlen is None else f"], maxlen={obj.maxlen})"
+        return _sequence_children(obj, writer, "deque([", suffix)
+    if isinstance(obj, (set, frozenset)):
+        if isinstance(obj, frozenset):
             if not obj:
-                writer.write("frozenset()" if isinstance(obj, frozenset) else "set()")
-                return
-            if isinstance(obj, frozenset):
-                writer.write("frozenset(")
-            _write_sequence_items(obj, "{", "}", writer, seen, work)
-            if isinstance(obj, frozenset):
-                writer.write(")")
-            return
-
-        open_bracket, close_bracket = (
-            ("(", ")") if isinstance(obj, tuple) else ("[", "]")
-        )
-        _write_sequence_items(
-            obj,
-            open_bracket,
-            close_bracket,
-            writer,
-            seen,
-            work,
-            trailing_comma=isinstance(obj, tuple) and len(obj) == 1,
-        )
-    finally:
-        seen.discard(obj_id)
+                return _sequence_children((), writer, "frozenset()", "")
+            return _sequence_children(obj, writer, "frozenset({", "})")
+        if not obj:
+            return _sequence_children((), writer, "set()", "")
+        return _sequence_children(obj, writer, "{", "}")
+    if isinstance(obj, tuple):
+        suffix = ",)" if len(obj) == 1 else ")"
+        return _sequence_children(obj, writer, "(", suffix)
+    return _sequence_children(obj, writer, "[", "]")  # type: ignore[arg-type]
+
+
+def _counter_children(
+    obj: collections.Counter, writer: BoundedWriter
+) -> Iterator[object]:
+    if not obj:
+        writer.write("Counter()")
+        return
+    # Avoid sorting a large counter merely to discover that it cannot fit.
+    if len(obj) * 3 > writer.remaining:
+        raise BudgetExceeded
+    yield from _mapping_children(
+        _counter_ordered(obj).items(), writer, "Counter({", "})"
+    )
 
 
-def _write_mapping_items(
+def _mapping_children(
     items: Iterable[tuple[object, object]],
     writer: BoundedWriter,
-    seen: set[int],
-    work: InspectionBudget | None = None,
-) -> None:
-    writer.write("{")
+    prefix: str,
+    suffix: str,
+) -> Iterator[object]:
+    writer.write(prefix)
     for index, (key, value) in enumerate(items):
         if index:
             writer.write(", ")
-        _write_full(key, writer, seen, work)
+        yield key
         writer.write(": ")
-        _write_full(value, writer, seen, work)
-    writer.write("}")
+        yield value
+    writer.write(suffix)
 
 
-def _write_sequence_items(
-    values: Iterable[object],
-    open_bracket: str,
-    close_bracket: str,
-    writer: BoundedWriter,
-    seen: set[int],
-    work: InspectionBudget | None = None,
-    *,
-    trailing_comma: bool = False,
-) -> None:
-    writer.write(open_bracket)
+def _record_children(
+    type_name: str, attrs: dict[str, object], writer: BoundedWriter
+) -> Iterator[object]:
+    writer.write(f"{type_name}(")
+    for index, (name, value) in enumerate(attrs.items()):
+        writer.write(f", {name}=" if index else f"{name}=")
+        yield value
+    writer.write(")")
+
+
+def _sequence_children(
+    values: Iterable[object], writer: BoundedWriter, prefix: str, suffix: str
+) -> Iterator[object]:
+    writer.write(prefix)
     for index, value in enumerate(values):
         if index:
             writer.write(", ")
-        _write_full(value, writer, seen, work)
-    if trailing_comma:
-        writer.write(",")
-    writer.write(close_bracket)
+        yield value
+    writer.write(suffix)
 
 
 def _factory_name(factory: object) -> str:
@@ -1095,7 +3125,21 @@ def _inferred_schema(obj: object, context: RenderContext) -> Schema | None:
     key = id(obj)
     entry = context.schema_cache.get(key)
     if entry is None:
-        schema = infer_schema(obj, context.inference, context.inspection)
+        opened = None if context.trace is None else context.trace.opened
+        history = context.list_schemas
+        if history is not None and type(obj) is list:
+            schema, inferred = infer_list_schema(
+                obj,
+                context.inference,
+                context.inspection,
+                history.get(obj, context.inference),
+                opened=opened,
+            )
+            history.put(inferred)
+        else:
+            schema = infer_schema(
+                obj, context.inference, context.inspection, opened=opened
+            )
         entry = (obj, schema)
         context.schema_cache[key] = entry
     schema = entry[1]
@@ -1174,3 +3218,10 @@ def _fit_summary(value: str, budget: int) -> str:
 
 def _fit(value: str, budget: int) -> str:
     return value[:budget]
+
+
+_DEFAULT_RENDERERS = {
+    (policy, inference): Renderer(policy, inference=inference)
+    for policy in sorted(_POLICIES)
+    for inference in sorted(_INFERENCE_POLICIES)
+}
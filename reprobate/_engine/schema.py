@@ -1,66 +1,137 @@
 """Internal schema vocabulary for compact aggregate type hints."""
 
+import dataclasses
+import threading
+import weakref
 from dataclasses import dataclass
+from typing import Any
 
 
-class Schema:
-    """Base class for inferred schema fragments."""
+class _Interned(type):
+    """Hash-conses instances: constructing a value equal to a live one returns it.
+
+    Equal schemas are therefore the same object, so they compare and hash by
+    identity and each node's text is formatted once however often it recurs.
+    """
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        key = (cls, *_field_values(cls, args, kwargs))
+        reference = _INTERNED.get(key)
+        instance = None if reference is None else reference()
+        if instance is None:
+            with _INTERN_LOCK:
+                reference = _INTERNED.get(key)
+                instance = None if reference is None else reference()
+                if instance is None:
+                    instance = super().__call__(*args, **kwargs)
+                    _INTERNED[key] = weakref.ref(instance, _Forget(key))
+        return instance
+
+
+class _Forget:
+    """Drops an interning entry once its schema is collected."""
+
+    def __init__(self, key: tuple) -> None:
+        self.key = key
+
+    def __call__(self, reference: weakref.ref) -> None:
+        with _INTERN_LOCK:
+            if _INTERNED.get(self.key) is reference:
+                del _INTERNED[self.key]
+
+
+# Weak references to live schemas by class and field values. Children are
+# interned before their parents, so keys hash child schemas by identity.
+_INTERNED: dict[tuple, weakref.ref] = {}
+_INTERN_LOCK = threading.RLock()
+# Field names and defaults per interned class, in constructor order.
+_SIGNATURES: dict[type, tuple[tuple[str, object], ...]] = {}
+
+
+def _field_values(
+    cls: type, args: tuple[object, ...], kwargs: dict[str, object]
+) -> tuple[object, ...]:
+    signature = _SIGNATURES.get(cls)
+    if signature is None:
+        signature = _SIGNATURES[cls] = tuple(
+            (field.name, field.default) for field in dataclasses.fields(cls)
+        )
+    if not kwargs and len(args) == len(signature):
+        return args
+    values = list(args)
+    for name, default in signature[len(args) :]:
+        values.append(kwargs.get(name, default))
+    return tuple(values)
+
+
+class Schema(metaclass=_Interned):
+    """Base class for inferred schema fragments.
+
+    Schemas are interned and immutable; ``format`` is computed once per node.
+    """
 
     def format(self) -> str:
+        text = self.__dict__.get("_text")
+        if text is None:
+            text = self._format()
+            object.__setattr__(self, "_text", text)
+        return text
+
+    def _format(self) -> str:
         raise NotImplementedError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class ScalarSchema(Schema):
     name: str
 
-    def format(self) -> str:
+    def _format(self) -> str:
         return self.name
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class UnionSchema(Schema):
     members: tuple[Schema, ...]
 
-    def format(self) -> str:
+    def _format(self) -> str:
         return " | ".join(member.format() for member in self.members)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class SequenceSchema(Schema):
     kind: str
     item: Schema | None
 
-    def format(self) -> str:
+    def _format(self) -> str:
         if self.item is None:
             return self.kind
         return f"{self.kind}[{self.item.format()}]"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class MappingSchema(Schema):
     key: Schema | None
     value: Schema | None
 
-    def format(self) -> str:
+    def _format(self) -> str:
         if self.key is None or self.value is None:
             return "dict"
         return f"dict[{self.key.format()}, {self.value.format()}]"
 
 
-@dataclass(frozen=True)
-class FieldSchema:
+@dataclass(frozen=True, eq=False)
+class FieldSchema(metaclass=_Interned):
     key: object
     value: Schema
     optional: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class RecordSchema(Schema):
     fields: tuple[FieldSchema, ...]
     complete: bool = True
 
-    def format(self) -> str:
+    def _format(self) -> str:
         parts = []
         for field in self.fields:
             optional = "?" if field.optional else ""
@@ -0,0 +1,23 @@
+"""Token counting for token-budget rendering."""
+
+import re
+from typing import Callable, TypeAlias
+
+TokenCounter: TypeAlias = Callable[[str], int]
+
+# Starting chars-per-token guess; each render recalibrates it on its own output.
+CHARS_PER_TOKEN = 4.0
+
+# Roughly the splits a byte-pair tokenizer makes on repr output: short letter
+# and digit runs with an optional leading space, whitespace runs, and single
+# punctuation or non-ASCII characters.
+_TOKEN_PATTERN = re.compile(r" ?[A-Za-z]{1,4}| ?[0-9]{1,3}|\s+|[^\sA-Za-z0-9]")
+
+
+def approximate_token_count(text: str) -> int:
+    """Count tokens with a deterministic local stand-in for a real tokenizer.
+
+    Useful in tests and offline; pass a model's own tokenizer to render against
+    real token limits.
+    """
+    return sum(1 for _ in _TOKEN_PATTERN.finditer(text))
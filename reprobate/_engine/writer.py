@@ -1,5 +1,10 @@
 """Bounded string writer used by complete-render probes."""
 
+import io
+from typing import Callable, TypeAlias
+
+Sink: TypeAlias = io.TextIOBase | list[str] | Callable[[str], object]
+
 
 class BudgetExceeded(Exception):
     """Raised when a bounded writer cannot accept another fragment."""
@@ -24,5 +29,40 @@ class BoundedWriter:
         """Characters that can still be accepted."""
         return self.limit - self._length
 
+    @property
+    def length(self) -> int:
+        """Characters accepted so far."""
+        return self._length
+
     def getvalue(self) -> str:
         return "".join(self._parts)
+
+    def write_to(self, emit: Callable[[str], object]) -> int:
+        """Pass every fragment to ``emit`` without joining them first."""
+        for part in self._parts:
+            emit(part)
+        return self._length
+
+
+class MeasuringWriter(BoundedWriter):
+    """Count fragments against ``limit`` without retaining them."""
+
+    def write(self, fragment: str) -> None:
+        if self._length + len(fragment) > self.limit:
+            raise BudgetExceeded
+        self._length += len(fragment)
+
+    def getvalue(self) -> str:
+        raise TypeError("a measuring writer keeps no output")
+
+
+def sink_writer(sink: Sink) -> Callable[[str], object]:
+    """Return the function that appends one fragment to ``sink``."""
+    if isinstance(sink, list):
+        return sink.append
+    write = getattr(sink, "write", None)
+    if callable(write):
+        return write
+    if callable(sink):
+        return sink
+    raise TypeError("sink must be a text stream, a list, or a callable")
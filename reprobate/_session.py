@@ -1,9 +1,8 @@
 """Active render-session routing for recursive public helpers."""
 
-from contextlib import contextmanager
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 from dataclasses import dataclass
-from typing import Callable, Iterator
+from typing import Callable
 
 RenderChild = Callable[[object, int], str]
 RenderAttrs = Callable[[dict[str, object], str, int], str]
@@ -20,14 +19,14 @@ class RenderSession:
 _active_session: ContextVar[RenderSession] = ContextVar("reprobate_render_session")
 
 
-@contextmanager
-def activate_session(session: RenderSession) -> Iterator[None]:
+def set_active_session(session: RenderSession) -> Token[RenderSession]:
     """Make an engine's recursive callbacks active for the current context."""
-    token = _active_session.set(session)
-    try:
-        yield
-    finally:
-        _active_session.reset(token)
+    return _active_session.set(session)
+
+
+def reset_active_session(token: Token[RenderSession]) -> None:
+    """Restore the session that was active before ``set_active_session``."""
+    _active_session.reset(token)
 
 
 def get_active_session() -> RenderSession:
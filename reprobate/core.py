@@ -1,10 +1,56 @@
 """Stable public facade for the rendering engine."""
 
-from ._engine import InferencePolicy, Policy
+from collections.abc import Iterable, Mapping
+
+from ._engine import (
+    IncrementalRenderer,
+    InferencePolicy,
+    Policy,
+    Renderer,
+    RenderLimits,
+    RenderReport,
+    ResultCache,
+    SchemaCache,
+)
+from ._engine import child_complete_budgets as _child_complete_budgets
+from ._engine import complete_budget as _complete_budget
+from ._engine import estimate as _estimate
+from ._engine import fits as _fits
 from ._engine import render as _render
 from ._engine import render_attrs as _render_attrs
+from ._engine import render_into as _render_into
+from ._engine import render_ladder as _render_ladder
+from ._engine import render_many as _render_many
+from ._engine import render_namespace as _render_namespace
+from ._engine import render_report as _render_report
+from ._engine.tokens import TokenCounter, approximate_token_count
+from ._engine.writer import Sink
 from ._session import get_active_session
 
+__all__ = [
+    "IncrementalRenderer",
+    "InferencePolicy",
+    "Policy",
+    "Renderer",
+    "RenderLimits",
+    "RenderReport",
+    "ResultCache",
+    "SchemaCache",
+    "approximate_token_count",
+    "child_complete_budgets",
+    "complete_budget",
+    "estimate",
+    "fits",
+    "render",
+    "render_attrs",
+    "render_child",
+    "render_into",
+    "render_ladder",
+    "render_many",
+    "render_namespace",
+    "render_report",
+]
+
 
 def render(
     obj: object,
@@ -12,9 +58,135 @@ def render(
     policy: Policy = "greedy",
     *,
     inference: InferencePolicy = "best_effort",
+    deadline: float | None = None,
+    tokens: int | None = None,
+    counter: TokenCounter | None = None,
 ) -> str:
-    """Render an object through the rendering engine."""
-    return _render(obj, budget, policy, inference=inference)
+    """Render an object through the rendering engine.
+
+    ``tokens`` fits the output under ``counter(text) <= tokens`` instead of the
+    character ``budget``. ``policy`` and ``inference`` apply to the first 100
+    levels of nesting; deeper containers are filled greedily, child by child,
+    without inferred summaries.
+    """
+    return _render(
+        obj,
+        budget,
+        policy,
+        inference=inference,
+        deadline=deadline,
+        tokens=tokens,
+        counter=counter,
+    )
+
+
+def render_report(
+    obj: object,
+    budget: int = 200,
+    policy: Policy = "greedy",
+    *,
+    inference: InferencePolicy = "best_effort",
+    deadline: float | None = None,
+    tokens: int | None = None,
+    counter: TokenCounter | None = None,
+) -> RenderReport:
+    """Render an object and report whether ``deadline`` cut the render short.
+
+    ``tokens`` fits the output under ``counter(text) <= tokens`` instead of the
+    character ``budget``.
+    """
+    return _render_report(
+        obj,
+        budget,
+        policy,
+        inference=inference,
+        deadline=deadline,
+        tokens=tokens,
+        counter=counter,
+    )
+
+
+def render_into(
+    obj: object,
+    budget: int,
+    sink: Sink,
+    policy: Policy = "greedy",
+    *,
+    inference: InferencePolicy = "best_effort",
+) -> int:
+    """Render an object into a text stream, list, or callable sink.
+
+    Returns the number of characters written.
+    """
+    return _render_into(obj, budget, sink, policy, inference=inference)
+
+
+def estimate(obj: object, limit: int) -> int | float | None:
+    """Return the exact complete-render length of ``obj``, up to ``limit``.
+
+    ``None`` means more than ``limit`` characters, and ``math.inf`` means no
+    complete rendering at any budget; such values used to report ``None``.
+    """
+    return _estimate(obj, limit)
+
+
+def fits(obj: object, budget: int) -> bool:
+    """Check whether the complete rendering of ``obj`` fits within ``budget``."""
+    return _fits(obj, budget)
+
+
+def complete_budget(
+    obj: object, limit: int | None = None
+) -> int | float | None:
+    """Return the smallest budget at which ``obj`` renders losslessly.
+
+    ``None`` means more than ``limit`` characters, and ``math.inf`` means no
+    complete rendering at any budget. ``limit`` defaults to a million.
+    """
+    return _complete_budget(obj, limit)
+
+
+def child_complete_budgets(
+    obj: object, limit: int | None = None
+) -> dict[object, int | float | None]:
+    """Return the smallest lossless budget of each top-level child of ``obj``.
+
+    Keys are mapping keys, sequence indexes, set elements, or record fields.
+    """
+    return _child_complete_budgets(obj, limit)
+
+
+def render_many(
+    objs: Iterable[object],
+    budgets: int | Iterable[int],
+    policy: Policy = "greedy",
+    *,
+    inference: InferencePolicy = "best_effort",
+) -> list[str]:
+    """Render a batch of objects, sharing inference and probes between them."""
+    return _render_many(objs, budgets, policy, inference=inference)
+
+
+def render_ladder(
+    obj: object,
+    budgets: Iterable[int],
+    policy: Policy = "greedy",
+    *,
+    inference: InferencePolicy = "best_effort",
+) -> list[str]:
+    """Render one object at several budgets, sharing inference and probes."""
+    return _render_ladder(obj, budgets, policy, inference=inference)
+
+
+def render_namespace(
+    namespace: Mapping[str, object],
+    total_budget: int,
+    policy: Policy = "even",
+    *,
+    inference: InferencePolicy = "best_effort",
+) -> dict[str, str]:
+    """Render named variables whose outputs together fit ``total_budget``."""
+    return _render_namespace(namespace, total_budget, policy, inference=inference)
 
 
 def render_child(obj: object, budget: int) -> str:
@@ -1,9 +1,6 @@
 """Optional renderer for PyArrow objects."""
 
-try:
-    import pyarrow as pa
-except ImportError:
-    pa = None
+from typing import TYPE_CHECKING
 
 from ._engine.summaries import (
     TableColumn,
@@ -14,42 +11,44 @@ from ._engine.summaries import (
 from .core import render_child
 from .registry import register
 
-if pa is not None:
-
-    @register(pa.Table)
-    def render_table(obj: "pa.Table", budget: int) -> str:
-        native = native_repr_if_fits(obj, budget)
-        if native is not None:
-            return native
-
-        columns = tuple(
-            TableColumn(field.name, str(field.type)) for field in obj.schema
-        )
-        return render_table_summary("Table", len(obj), columns, budget, render_child)
-
-    @register(pa.ChunkedArray)
-    def render_chunked_array(obj: "pa.ChunkedArray", budget: int) -> str:
-        native = native_repr_if_fits(obj, budget)
-        if native is not None:
-            return native
-
-        return render_array_summary(
-            "ChunkedArray",
-            len(obj),
-            str(obj.type),
-            len(obj),
-            budget,
-            render_child,
-        )
-
-    @register(pa.Array)
-    def render_array(obj: "pa.Array", budget: int) -> str:
-        return render_array_summary(
-            "Array",
-            len(obj),
-            str(obj.type),
-            len(obj),
-            budget,
-            render_child,
-            value_at=lambda index: obj[index].as_py(),
-        )
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+@register("pyarrow.Table")
+def render_table(obj: "pa.Table", budget: int) -> str:
+    native = native_repr_if_fits(obj, budget)
+    if native is not None:
+        return native
+
+    columns = tuple(TableColumn(field.name, str(field.type)) for field in obj.schema)
+    return render_table_summary("Table", len(obj), columns, budget, render_child)
+
+
+@register("pyarrow.ChunkedArray")
+def render_chunked_array(obj: "pa.ChunkedArray", budget: int) -> str:
+    native = native_repr_if_fits(obj, budget)
+    if native is not None:
+        return native
+
+    return render_array_summary(
+        "ChunkedArray",
+        len(obj),
+        str(obj.type),
+        len(obj),
+        budget,
+        render_child,
+    )
+
+
+@register("pyarrow.Array")
+def render_array(obj: "pa.Array", budget: int) -> str:
+    return render_array_summary(
+        "Array",
+        len(obj),
+        str(obj.type),
+        len(obj),
+        budget,
+        render_child,
+        value_at=lambda index: obj[index].as_py(),
+    )
@@ -1,9 +1,6 @@
 """Optional renderer for pandas objects."""
 
-try:
-    import pandas as pd
-except ImportError:
-    pd = None
+from typing import TYPE_CHECKING
 
 from ._engine.summaries import (
     TableColumn,
@@ -14,35 +11,36 @@ from ._engine.summaries import (
 from .core import render_child
 from .registry import register
 
-if pd is not None:
-
-    @register(pd.DataFrame)
-    def render_dataframe(obj: "pd.DataFrame", budget: int) -> str:
-        native = native_repr_if_fits(obj, budget)
-        if native is not None:
-            return native
-
-        columns = tuple(
-            TableColumn(name, str(dtype))
-            for name, dtype in zip(obj.columns, obj.dtypes, strict=True)
-        )
-        return render_table_summary(
-            "DataFrame", len(obj), columns, budget, render_child
-        )
-
-    @register(pd.Series)
-    def render_series(obj: "pd.Series", budget: int) -> str:
-        native = native_repr_if_fits(obj, budget)
-        if native is not None:
-            return native
-
-        metadata = (("name", obj.name),) if obj.name is not None else ()
-        return render_array_summary(
-            "Series",
-            len(obj),
-            str(obj.dtype),
-            len(obj),
-            budget,
-            render_child,
-            metadata=metadata,
-        )
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@register("pandas.DataFrame")
+def render_dataframe(obj: "pd.DataFrame", budget: int) -> str:
+    native = native_repr_if_fits(obj, budget)
+    if native is not None:
+        return native
+
+    columns = tuple(
+        TableColumn(name, str(dtype))
+        for name, dtype in zip(obj.columns, obj.dtypes, strict=True)
+    )
+    return render_table_summary("DataFrame", len(obj), columns, budget, render_child)
+
+
+@register("pandas.Series")
+def render_series(obj: "pd.Series", budget: int) -> str:
+    native = native_repr_if_fits(obj, budget)
+    if native is not None:
+        return native
+
+    metadata = (("name", obj.name),) if obj.name is not None else ()
+    return render_array_summary(
+        "Series",
+        len(obj),
+        str(obj.dtype),
+        len(obj),
+        budget,
+        render_child,
+        metadata=metadata,
+    )
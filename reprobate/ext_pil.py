@@ -1,20 +1,19 @@
 """Optional renderer for PIL/Pillow images."""
 
-try:
-    from PIL import Image
-except ImportError:
-    Image = None
+from typing import TYPE_CHECKING
 
 from .registry import register
 
-if Image is not None:
+if TYPE_CHECKING:
+    from PIL import Image
+
 
-    @register(Image.Image)
-    def render_image(obj: "Image.Image", budget: int) -> str:
-        w, h = obj.size
-        mode = obj.mode
-        fmt = obj.format
-        fmt_part = f", format={fmt}" if fmt else ""
-        header = f"Image({w}x{h}, {mode}{fmt_part})"
+@register("PIL.Image.Image")
+def render_image(obj: "Image.Image", budget: int) -> str:
+    w, h = obj.size
+    mode = obj.mode
+    fmt = obj.format
+    fmt_part = f", format={fmt}" if fmt else ""
+    header = f"Image({w}x{h}, {mode}{fmt_part})"
 
-        return header[:budget]
+    return header[:budget]
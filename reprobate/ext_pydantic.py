@@ -1,17 +1,16 @@
 """Optional renderer for pydantic models."""
 
-try:
-    import pydantic
-except ImportError:
-    pydantic = None
+from typing import TYPE_CHECKING
 
 from .core import render_attrs
 from .registry import register
 
-if pydantic is not None:
+if TYPE_CHECKING:
+    import pydantic
+
 
-    @register(pydantic.BaseModel)
-    def render_basemodel(obj: "pydantic.BaseModel", budget: int) -> str:
-        type_name = type(obj).__name__
-        attrs = {name: getattr(obj, name) for name in type(obj).model_fields}
-        return render_attrs(attrs, type_name, budget)
+@register("pydantic.BaseModel")
+def render_basemodel(obj: "pydantic.BaseModel", budget: int) -> str:
+    type_name = type(obj).__name__
+    attrs = {name: getattr(obj, name) for name in type(obj).model_fields}
+    return render_attrs(attrs, type_name, budget)
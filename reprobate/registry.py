@@ -1,15 +1,33 @@
 """Type-specific renderer registry."""
 
-from typing import Any, Callable
+import itertools
+import sys
+from typing import Any, Callable, TypeVar
 
 Renderer = Callable[[Any, int], str]
+_F = TypeVar("_F", bound=Callable[..., Any])
 
 _registry: dict[type, Renderer] = {}
+# Registration order of each entry in ``_registry``, so a named declaration that
+# resolves late still loses to any registration made after it.
+_order: dict[type, int] = {}
+_sequence = itertools.count()
+# Deferred declarations grouped by top-level package: the package name maps to
+# (qualified type name, renderer, registration order) triples that resolve once
+# the package is loaded.
+_pending: dict[str, list[tuple[str, Renderer, int]]] = {}
+_MISSING = object()
+_change_hooks: list[Callable[[], None]] = []
+_PURE_ATTRIBUTE = "__reprobate_pure__"
 
 
-def register(cls: type) -> Callable[[Renderer], Renderer]:
+def register(cls: type | str) -> Callable[[Renderer], Renderer]:
     """Register a budget renderer for a type.
 
+    ``cls`` may be a type or a qualified type name such as ``"pandas.DataFrame"``.
+    A named type is never imported: it resolves from ``sys.modules`` the first
+    time a class from its package is rendered.
+
     Usage::
 
         @register(MyClass)
@@ -18,15 +36,108 @@ def register(cls: type) -> Callable[[Renderer], Renderer]:
     """
 
     def decorator(fn: Renderer) -> Renderer:
-        _registry[cls] = fn
+        if isinstance(cls, str):
+            package = cls.partition(".")[0]
+            _pending.setdefault(package, []).append((cls, fn, next(_sequence)))
+        else:
+            _registry[cls] = fn
+            _order[cls] = next(_sequence)
+        _notify_change()
         return fn
 
     return decorator
 
 
+def pure(fn: _F) -> _F:
+    """Declare a budget renderer deterministic in its object and budget.
+
+    Works on registered renderers and on ``__budget_repr__`` methods. Within
+    one render, the engine reuses a pure renderer's output when the same
+    object is rendered again at the same budget instead of calling it twice.
+    Renderers that read mutable or global state must not be marked.
+    """
+    setattr(fn, _PURE_ATTRIBUTE, True)
+    return fn
+
+
+def is_pure(fn: object) -> bool:
+    """Return whether ``fn`` was declared with :func:`pure`."""
+    return getattr(fn, _PURE_ATTRIBUTE, False) is True
+
+
+def add_change_hook(hook: Callable[[], None]) -> None:
+    """Call ``hook`` whenever a registration may change renderer lookups."""
+    _change_hooks.append(hook)
+
+
 def get_renderer(cls: type) -> Renderer | None:
     """Look up a renderer for a type, checking MRO."""
+    if _pending:
+        _resolve_pending(cls)
     for klass in cls.__mro__:
         if klass in _registry:
             return _registry[klass]
     return None
+
+
+def has_pending(cls: type) -> bool:
+    """Whether a named declaration may still resolve to a class in ``cls.__mro__``.
+
+    Lookups for such a class can change once the named module is imported,
+    without a registration to announce it.
+    """
+    return bool(_pending) and any(
+        getattr(klass, "__module__", "").partition(".")[0] in _pending
+        for klass in cls.__mro__
+    )
+
+
+def _resolve_pending(cls: type) -> None:
+    """Resolve named declarations whose packages appear in ``cls.__mro__``.
+
+    Declarations resolve in registration order, and each replaces an entry
+    registered before it, so the last registration for a type wins.
+    """
+    for klass in cls.__mro__:
+        package = getattr(klass, "__module__", "").partition(".")[0]
+        declarations = _pending.pop(package, None)
+        if declarations is None:
+            continue
+        unresolved = []
+        for name, fn, order in declarations:
+            resolved = _lookup_loaded(name)
+            if resolved is None:
+                unresolved.append((name, fn, order))
+            elif isinstance(resolved, type) and _order.get(resolved, -1) < order:
+                _registry[resolved] = fn
+                _order[resolved] = order
+        if unresolved:
+            _pending[package] = unresolved
+        if len(unresolved) < len(declarations):
+            _notify_change()
+
+
+def _lookup_loaded(name: str) -> object | None:
+    """Resolve a qualified name against already-imported modules only.
+
+    Returns ``None`` while the owning module is not loaded or still lacks the
+    named attribute, as a partially initialized module does during a circular
+    import; the declaration then stays pending.
+    """
+    parts = name.split(".")
+    for split in range(len(parts) - 1, 0, -1):
+        module = sys.modules.get(".".join(parts[:split]))
+        if module is None:
+            continue
+        value: object = module
+        for attr in parts[split:]:
+            value = getattr(value, attr, _MISSING)
+            if value is _MISSING:
+                return None
+        return value
+    return None
+
+
+def _notify_change() -> None:
+    for hook in _change_hooks:
+        hook()
@@ -1,10 +1,12 @@
 """Core collection contracts for the private replacement engine."""
 
 import collections
+import random
 
 import pytest
 
 from reprobate._engine import render
+from reprobate._engine.render import _fit_skeleton
 
 
 @pytest.mark.parametrize(
@@ -149,3 +151,49 @@ def test_shorter_complete_child_replaces_larger_type_stub():
 
     assert "'empty': []" in result
     assert len(result) <= 45
+
+
+def _quadratic_skeleton(parts, budget, shell, singleton_comma=False):
+    """Reference skeleton fitting that re-measures the kept prefix per entry."""
+    rendered = []
+    for index, part in enumerate(parts):
+        omitted = len(parts) - index - 1
+        trial = rendered + [part] + ([f"...{omitted} more"] if omitted else [])
+        cost = shell + sum(map(len, trial)) + max(0, len(trial) - 1) * 2
+        if singleton_comma and len(rendered) == 0 and not omitted:
+            cost += 1
+        if cost > budget:
+            break
+        rendered.append(part)
+    return rendered
+
+
+@pytest.mark.parametrize("singleton_comma", [False, True])
+def test_running_skeleton_fit_matches_quadratic_reference(singleton_comma):
+    rng = random.Random(3)
+    for _ in range(500):
+        count = rng.choice([0, 1, 2, 9, 10, 11, 99, 100, 101, 1_000])
+        parts = ["x" * rng.randint(1, 12) for _ in range(count)]
+        budget = rng.randint(0, 400)
+        shell = rng.randint(2, 12)
+
+        payloads, rendered = _fit_skeleton(
+            ((index, part) for index, part in enumerate(parts)),
+            len(parts),
+            budget,
+            shell,
+            singleton_comma=singleton_comma,
+        )
+
+        expected = _quadratic_skeleton(parts, budget, shell, singleton_comma)
+        assert rendered == expected
+        assert payloads == list(range(len(expected)))
+
+
+def test_wide_mapping_skeleton_scales_with_entries_shown():
+    value = {f"key_{index}": index for index in range(100_000)}
+
+    result = render(value, 20_000, inference="off")
+
+    assert len(result) <= 20_000
+    assert result.endswith(" more}")
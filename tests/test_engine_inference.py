@@ -3,6 +3,12 @@
 from reprobate._engine import render
 from reprobate._engine.context import InspectionBudget
 from reprobate._engine.inference import MAX_RECORD_FIELDS, infer_schema
+from reprobate._engine.schema import (
+    FieldSchema,
+    RecordSchema,
+    ScalarSchema,
+    SequenceSchema,
+)
 
 
 def test_inference_off_uses_untyped_collection_summary():
@@ -133,6 +139,14 @@ def test_merged_record_schema_marks_fields_dropped_by_the_key_cap():
     assert schema.format().endswith(", ...}]")
 
 
+def test_merged_record_keys_keep_first_seen_order_and_presence():
+    value = [{"b": 1, "c": "x"}, {"a": None, "b": 2}, {"c": "y", "b": 3}]
+
+    schema = infer_schema(value, "best_effort", InspectionBudget())
+
+    assert schema.format() == "list[{'b': int, 'c'?: str, 'a'?: None}]"
+
+
 def test_standalone_fixed_record_inference_preserves_literal_keys():
     value = {
         "users": ["alice" * 30] * 200,
@@ -238,3 +252,28 @@ def test_pathological_runtime_type_names_degrade_to_object():
 
     assert schema is not None
     assert schema.format() == "list[object]"
+
+
+def test_equal_schemas_are_interned_as_one_object():
+    first = infer_schema(
+        [{"id": 1, "name": "a"}, {"id": 2}], "best_effort", InspectionBudget()
+    )
+    second = infer_schema(
+        [{"id": 3}, {"id": 4, "name": "b"}], "best_effort", InspectionBudget()
+    )
+
+    assert first is second
+    assert SequenceSchema("list", ScalarSchema("int")) is SequenceSchema(
+        "list", item=ScalarSchema("int")
+    )
+    assert RecordSchema((FieldSchema("id", ScalarSchema("int")),)) is RecordSchema(
+        (FieldSchema("id", ScalarSchema("int"), optional=False),), complete=True
+    )
+
+
+def test_schema_text_is_formatted_once_per_node():
+    kinds = [type(f"Kind{index}", (), {})() for index in range(200)]
+    schema = infer_schema(kinds, "best_effort", InspectionBudget())
+
+    assert schema.format() is schema.format()
+    assert schema.format().count(" | ") == 199
@@ -2,6 +2,8 @@
 
 import collections
 import dataclasses
+import sys
+import types
 
 import reprobate
 from reprobate._engine import render
@@ -206,3 +208,187 @@ def test_every_dataclass_budget_is_respected():
 
     for budget in range(120):
         assert len(render(value, budget, inference="off")) <= budget
+
+
+def test_named_registration_resolves_from_loaded_module_without_importing():
+    module = types.ModuleType("reprobate_lazy_fixture")
+
+    class Widget:
+        pass
+
+    class SpecialWidget(Widget):
+        pass
+
+    Widget.__module__ = SpecialWidget.__module__ = module.__name__
+    module.Widget = Widget
+
+    @reprobate.register("reprobate_lazy_fixture.Widget")
+    def render_widget(obj, budget):
+        return "widget"[:budget]
+
+    assert "reprobate_lazy_fixture" not in sys.modules
+    sys.modules[module.__name__] = module
+    try:
+        assert render(SpecialWidget(), 100) == "widget"
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_later_registration_wins_over_a_pending_named_one():
+    module = types.ModuleType("reprobate_override_fixture")
+
+    class Sprocket:
+        pass
+
+    class Cog:
+        pass
+
+    Sprocket.__module__ = Cog.__module__ = module.__name__
+    module.Sprocket = Sprocket
+    module.Cog = Cog
+
+    @reprobate.register("reprobate_override_fixture.Sprocket")
+    def render_bundled(obj, budget):
+        return "bundled"[:budget]
+
+    @reprobate.register("reprobate_override_fixture.Sprocket")
+    def render_user(obj, budget):
+        return "user"[:budget]
+
+    @reprobate.register(Cog)
+    def render_cog(obj, budget):
+        return "cog"[:budget]
+
+    @reprobate.register("reprobate_override_fixture.Cog")
+    def render_named_cog(obj, budget):
+        return "named cog"[:budget]
+
+    sys.modules[module.__name__] = module
+    try:
+        assert render(Sprocket(), 100) == "user"
+        assert render(Cog(), 100) == "named cog"
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_named_registration_stays_pending_until_its_module_is_loaded():
+    class Gadget:
+        pass
+
+    Gadget.__module__ = "reprobate_unloaded_fixture.gadgets"
+
+    @reprobate.register("reprobate_unloaded_fixture.gadgets.Gadget")
+    def render_gadget(obj, budget):
+        return "gadget"[:budget]
+
+    assert render(Gadget(), 100) == "<Gadget>"
+
+
+def test_named_registration_waits_for_a_partially_initialized_module():
+    module = types.ModuleType("reprobate_partial_fixture")
+
+    class Sprite:
+        pass
+
+    Sprite.__module__ = module.__name__
+
+    @reprobate.register("reprobate_partial_fixture.Sprite")
+    def render_sprite(obj, budget):
+        return "sprite"[:budget]
+
+    sys.modules[module.__name__] = module
+    try:
+        assert render(Sprite(), 100) == "<Sprite>"
+        module.Sprite = Sprite
+        assert render(Sprite(), 100) == "sprite"
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_class_seen_before_its_named_module_loads_is_redispatched():
+    module = types.ModuleType("reprobate_deferred_fixture")
+
+    class Gizmo:
+        pass
+
+    Gizmo.__module__ = module.__name__
+    module.Gizmo = Gizmo
+
+    @reprobate.register("reprobate_deferred_fixture.Gizmo")
+    def render_gizmo(obj, budget):
+        return "gizmo"[:budget]
+
+    assert render(Gizmo(), 100) == "<Gizmo>"
+
+    sys.modules[module.__name__] = module
+    try:
+        assert render(Gizmo(), 100) == "gizmo"
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_class_gaining_protocol_after_first_render_is_redispatched():
+    class Late:
+        def __init__(self):
+            self.value = 1
+
+    assert render(Late(), 100) == "Late(value=1)"
+
+    Late.__budget_repr__ = lambda self, budget: "late"[:budget]
+
+    assert render(Late(), 100) == "late"
+
+
+def test_registration_after_first_render_is_redispatched():
+    class Registered:
+        def __init__(self):
+            self.value = 1
+
+    assert render(Registered(), 100) == "Registered(value=1)"
+
+    @reprobate.register(Registered)
+    def render_registered(obj, budget):
+        return "registered"[:budget]
+
+    assert render(Registered(), 100) == "registered"
+
+
+def test_pure_custom_renderer_output_is_reused_within_a_render():
+    calls = []
+
+    class Pure:
+        @reprobate.pure
+        def __budget_repr__(self, budget):
+            calls.append("pure")
+            return "Pure()"
+
+    class Impure:
+        def __budget_repr__(self, budget):
+            calls.append("impure")
+            return "Impure()"
+
+    class Pair:
+        def __init__(self, item):
+            self.item = item
+
+        def __budget_repr__(self, budget):
+            first = reprobate.render_child(self.item, 20)
+            second = reprobate.render_child(self.item, 20)
+            return f"Pair({first}, {second})"
+
+    assert render(Pair(Pure()), 100) == "Pair(Pure(), Pure())"
+    assert render(Pair(Impure()), 100) == "Pair(Impure(), Impure())"
+    assert calls == ["pure", "impure", "impure"]
+
+
+def test_shared_containers_are_rendered_once_per_budget():
+    shared = {"mode": "x" * 50, "options": list(range(30))}
+    value = [item for index in range(10) for item in (shared, index)]
+
+    report = reprobate.Renderer(policy="even", inference="off").render_report(
+        value, 600
+    )
+
+    assert report.memo_hits > 0
+    assert 0 < report.memo_hit_rate <= 1
+    assert report.text == render(value, 600, policy="even", inference="off")
@@ -1,10 +1,15 @@
 """Layer-planning and sibling allocation contracts."""
 
+import collections
 import dataclasses
 
+import pytest
+
 import reprobate
 from reprobate._engine import render
-from reprobate._engine.planning import allocate_even
+from reprobate._engine.context import RenderContext
+from reprobate._engine.planning import allocate_best_first, allocate_even, merge_blocks
+from reprobate._engine.render import _ladder, _probe_full, _size_ladder
 
 
 def test_even_allocator_redistributes_finite_unused_demand():
@@ -19,6 +24,76 @@ def test_even_allocator_returns_all_space_from_saturated_siblings():
     assert allocate_even([None, 0, 0], 30) == [30, 0, 0]
 
 
+def test_blocks_merge_a_cheap_step_into_the_poorer_step_before_it():
+    assert merge_blocks([(10, 1.0), (2, 2.0), (20, 1.0)], 100) == [
+        (12, 3.0),
+        (20, 1.0),
+    ]
+
+
+def test_blocks_stop_at_the_character_limit():
+    assert merge_blocks([(4, 2.0), (5, 1.0), (50, 1.0)], 20) == [(4, 2.0), (5, 1.0)]
+
+
+def test_best_first_allocator_takes_the_most_revealing_blocks():
+    ladders = [[(30, 1.0), (10, 5.0)], [(4, 2.0)], [(6, 2.0), (100, 1.0)]]
+
+    assert allocate_best_first(ladders, 20) == ([0, 4, 6], 10)
+
+
+def test_global_policy_reveals_cheap_siblings_behind_a_deep_first_branch():
+    value = {
+        "deep": {"a": {"b": {"c": list(range(50)), "d": "x" * 200}}},
+        "id": 7,
+        "tags": ["x", "y"],
+    }
+
+    greedy = render(value, 100, policy="greedy", inference="off")
+    best_first = render(value, 100, policy="global", inference="off")
+
+    assert "'tags': <list(2)>" in greedy
+    assert "'tags': ['x', 'y']" in best_first
+    assert "'c':" in best_first
+    assert len(best_first) <= 100
+
+
+def test_global_policy_respects_every_budget():
+    value = {
+        "deep": {"a": {"b": {"c": list(range(50)), "d": "x" * 200}}},
+        "name": "alice",
+        "tags": ["x", "y"],
+    }
+
+    for budget in range(len(repr(value)) + 5):
+        assert len(render(value, budget, policy="global", inference="off")) <= budget
+
+
+def test_global_ladders_are_rebuilt_for_a_larger_cap():
+    value = {"rows": [list(range(20)) for _ in range(10)]}
+    context = RenderContext(policy="global", inference="off")
+
+    small = _ladder(value, 30, context, set())
+    large = _ladder(value, 400, context, set())
+
+    assert sum(cost for cost, _ in small) <= 30
+    assert sum(cost for cost, _ in large) > 30
+    assert _ladder(value, 30, context, set()) == small
+
+
+def test_global_ladders_open_records():
+    Point = collections.namedtuple("Point", ["x", "y"])
+
+    @dataclasses.dataclass
+    class User:
+        name: str
+        tags: list
+
+    context = RenderContext(policy="global", inference="off")
+
+    assert _ladder(Point(1, 2), 100, context, set())
+    assert _ladder(User("alice", ["admin"]), 100, context, set())
+
+
 def test_even_mapping_redistributes_space_from_later_complete_sibling():
     early_large = {"large": "E" * 200, "done": "x"}
     late_large = {"done": "x", "large": "E" * 200}
@@ -53,6 +128,23 @@ def test_even_record_redistributes_space_from_complete_field():
     assert "done='x'" in result
 
 
+def test_size_ladders_mark_where_renderings_change():
+    context = RenderContext(policy="even", inference="off")
+
+    assert _size_ladder(10**40, 20, context) == (5, 21, None)
+    assert _size_ladder(10**40, 41, context) == (5, 41, 41)
+    assert _size_ladder("x" * 200, 50, context) == (10, 11, None)
+    assert _size_ladder(["alpha", "beta"], 50, context) == (9, 10, 17)
+
+
+def test_even_policy_gives_no_share_to_numbers_that_cannot_complete():
+    value = {"text": "x" * 200, "number": 10**40}
+
+    result = render(value, 50, policy="even", inference="off")
+
+    assert result == "{'text': 'xxxxxxxxxxxxxxxxxx...', 'number': <int>}"
+
+
 def test_greedy_output_is_unchanged_by_even_layer_planning():
     value = {"large": "E" * 200, "done": "x"}
 
@@ -101,3 +193,98 @@ def test_even_layer_probes_share_a_budget_proportional_to_output():
 
     assert len(result) <= 400
     assert sum(child.reads for child in children) <= 2_000
+
+
+def test_complete_probes_answer_monotonic_queries_from_cache():
+    context = RenderContext(policy="greedy", inference="off")
+    value = ["alpha", "beta"]
+    full = repr(value)
+
+    assert _probe_full(value, len(full) - 1, context) is None
+    assert _probe_full(value, len(full), context) == full
+    spent = context.work.remaining
+
+    assert _probe_full(value, len(full) + 100, context) == full
+    assert _probe_full(value, 3, context) is None
+    assert context.work.remaining == spent
+
+
+def test_even_policy_does_not_repeat_failed_child_probes():
+    class CountingList(list):
+        reads = 0
+
+        def __iter__(self):
+            CountingList.reads += 1
+            return super().__iter__()
+
+    value = {f"key_{index}": CountingList(range(20)) for index in range(20)}
+
+    render(value, 400, policy="even", inference="off")
+
+    assert CountingList.reads <= 3 * len(value)
+
+
+# Global planning walks each container once more to build its expansion ladder.
+@pytest.mark.parametrize("policy, walks", [("greedy", 4), ("even", 4), ("global", 5)])
+def test_deep_nesting_walks_each_container_a_bounded_number_of_times(policy, walks):
+    class CountingList(list):
+        reads = 0
+
+        def __iter__(self):
+            CountingList.reads += 1
+            return super().__iter__()
+
+    value = CountingList(["tail"])
+    for _ in range(150):
+        value = CountingList([value, {"label": "x" * 12}])
+
+    result = render(value, 2_000, policy=policy, inference="off")
+
+    assert len(result) <= 2_000
+    # Sizes recorded bottom-up by one probe answer the probes of every level
+    # below it, so walks grow with the containers rather than with depth.
+    assert CountingList.reads <= walks * 151
+
+
+def test_namespace_outputs_share_one_total_budget():
+    namespace = {
+        "rows": [{"id": index, "name": f"user{index}"} for index in range(500)],
+        "count": 1,
+        "name": "alice",
+        "log": "line\n" * 1_000,
+        "values": list(range(10_000)),
+    }
+
+    for total in range(0, 400, 7):
+        rendered = reprobate.render_namespace(namespace, total)
+
+        assert list(rendered) == list(namespace)
+        assert sum(map(len, rendered.values())) <= total
+
+
+def test_namespace_even_policy_redistributes_unused_demand():
+    namespace = {"large": "E" * 200, "done": "x", "other": "F" * 200}
+
+    rendered = reprobate.render_namespace(namespace, 80, inference="off")
+
+    assert rendered["done"] == "'x'"
+    assert abs(rendered["large"].count("E") - rendered["other"].count("F")) <= 1
+
+
+def test_namespace_greedy_policy_favors_earlier_variables():
+    namespace = {"large": "E" * 200, "other": "F" * 200}
+
+    rendered = reprobate.render_namespace(
+        namespace, 80, policy="greedy", inference="off"
+    )
+
+    assert rendered["large"].count("E") > rendered["other"].count("F")
+
+
+def test_namespace_degrades_evenly_when_stubs_cannot_fit():
+    namespace = {f"value_{index}": list(range(100)) for index in range(10)}
+
+    rendered = reprobate.render_namespace(namespace, 30)
+
+    assert sum(map(len, rendered.values())) <= 30
+    assert all(rendered.values())
@@ -1,10 +1,15 @@
 """Vertical contract tests for the private rendering engine."""
 
 import ast
+import importlib
+import random
 
 import pytest
 
 from reprobate._engine import render
+from reprobate._engine.render import _literal_preview, _minimum_key
+
+render_module = importlib.import_module("reprobate._engine.render")
 
 
 def test_complete_nested_value_is_preserved_when_it_fits():
@@ -84,6 +89,60 @@ def test_literal_preview_remains_parseable(value):
     assert ast.literal_eval(result) is not None
 
 
+def _searched_preview(value, budget):
+    """Reference preview: the longest ellipsized prefix by repeated ``repr``."""
+    best = ""
+    for size in range(min(len(value), budget) + 1):
+        literal = repr(value[:size])
+        candidate = literal[:-1] + "..." + literal[-1]
+        if budget >= 5 and len(candidate) <= budget:
+            best = candidate
+    return best
+
+
+@pytest.mark.parametrize("kind", [str, bytes])
+def test_scanned_literal_preview_matches_repr_quoting(kind):
+    rng = random.Random(11)
+    alphabet = "ab '\"\\\n\t\x00\x7fé\u2028😀"
+    for _ in range(400):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        value = text if kind is str else text.encode("utf-8", "surrogatepass")
+        budget = rng.randint(0, 60)
+
+        assert _literal_preview(value, budget) == _searched_preview(value, budget)
+
+
+@pytest.mark.parametrize("kind", [str, bytes])
+def test_interned_keys_match_probed_keys(kind):
+    rng = random.Random(13)
+    alphabet = "ab '\"\\\n\x00é😀"
+    literals = {}
+    for _ in range(400):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 90)))
+        key = text if kind is str else text.encode("utf-8", "surrogatepass")
+
+        # Asked twice so the second answer comes from the intern table.
+        assert _minimum_key(key, literals) == _minimum_key(key)
+        assert _minimum_key(key, literals) == _minimum_key(key)
+
+
+def test_record_keys_are_spelled_once_per_render(monkeypatch):
+    probed = []
+    original = render_module._try_full
+
+    def counting_try_full(obj, *args, **kwargs):
+        probed.append(obj)
+        return original(obj, *args, **kwargs)
+
+    monkeypatch.setattr(render_module, "_try_full", counting_try_full)
+    rows = [{"id": index, "bio": "x" * 100} for index in range(200)]
+
+    result = render(rows, 20_000, policy="even", inference="off")
+
+    assert result.startswith("[{'id': 0, 'bio': <str(100): 'xxx")
+    assert not any(isinstance(obj, str) for obj in probed)
+
+
 def test_huge_integer_does_not_require_an_unbounded_decimal_repr():
     result = render(10**100_000, 20, inference="off")
 
@@ -94,7 +153,7 @@ def test_singleton_tuple_keeps_its_comma():
     assert render((1,), 4, inference="off") == "(1,)"
 
 
-@pytest.mark.parametrize("policy", ["greedy", "even"])
+@pytest.mark.parametrize("policy", ["greedy", "even", "global"])
 def test_allocation_policies_are_accepted(policy):
     assert render([1, 2, 3], 100, policy=policy) == "[1, 2, 3]"
 
@@ -111,3 +170,37 @@ def test_invalid_arguments_are_rejected():
         render([], 10, policy="unknown")
     with pytest.raises(ValueError, match="inference policy"):
         render([], 10, inference="unknown")
+
+
+def test_values_deeper_than_the_recursion_limit_render_completely():
+    value = "end"
+    for index in range(5_000):
+        value = [value, index]
+    # Built without ``repr``, which itself recurses once per level.
+    full = "[" * 5_000 + "'end'" + "".join(f", {index}]" for index in range(5_000))
+
+    assert render(value, len(full), inference="off") == full
+
+
+@pytest.mark.parametrize("policy", ["greedy", "even", "global"])
+def test_values_deeper_than_the_recursion_limit_respect_every_budget(policy):
+    value = "end"
+    for index in range(5_000):
+        value = {"next": value, "index": index}
+
+    for budget in (0, 40, 2_000, 50_000):
+        result = render(value, budget, policy=policy, inference="off")
+        assert len(result) <= budget
+
+
+def test_deep_value_spends_the_budget_past_the_structural_depth():
+    value = "end"
+    for _ in range(300):
+        value = {"next": value, "pad": "x" * 40}
+
+    result = render(value, 8_000, inference="off")
+
+    assert result.startswith("{'next': {'next': ")
+    assert result.count("'next'") == 300
+    assert "'end'" in result
+    assert len(result) == 8_000
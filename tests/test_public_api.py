@@ -1,7 +1,21 @@
 """Public facade contracts introduced by the replacement-engine cutover."""
 
+import collections
+import dataclasses
+import gc
+import importlib
+import io
+import math
+import subprocess
+import sys
+
+import pytest
+
 import reprobate
 
+# The engine package re-exports ``render``, shadowing the module attribute.
+render_module = importlib.import_module("reprobate._engine.render")
+
 
 def test_public_render_exposes_best_effort_inference_by_default():
     values = ["alice" * 30] * 1_000
@@ -31,3 +45,702 @@ def test_public_render_attrs_uses_replacement_engine_outside_a_render_call():
 
 def test_inference_policy_type_is_exported():
     assert reprobate.InferencePolicy is not None
+
+
+def test_import_does_not_import_optional_libraries():
+    script = (
+        "import sys, reprobate; "
+        "print(sorted({'numpy', 'pandas', 'polars', 'pyarrow', 'PIL', 'pydantic'}"
+        " & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_renderer_matches_module_render():
+    renderer = reprobate.Renderer(policy="even", inference="off")
+    value = {"large": "E" * 200, "done": "x"}
+
+    assert renderer.render(value, 60) == reprobate.render(
+        value, 60, policy="even", inference="off"
+    )
+    assert renderer.render(value, 60) == renderer.render(value, 60)
+
+
+def test_renderer_validates_options_at_construction():
+    with pytest.raises(ValueError, match="rendering policy"):
+        reprobate.Renderer(policy="unknown")
+    with pytest.raises(ValueError, match="inference policy"):
+        reprobate.Renderer(inference="unknown")
+    with pytest.raises(ValueError, match="nonnegative"):
+        reprobate.Renderer(limits=reprobate.RenderLimits(inspection_nodes=-1))
+    with pytest.raises(ValueError, match="nonnegative"):
+        reprobate.Renderer().render([], -1)
+
+
+def test_renderer_limits_bound_inference():
+    values = ["alice" * 30] * 1_000
+    starved = reprobate.Renderer(limits=reprobate.RenderLimits(inspection_nodes=0))
+
+    assert reprobate.Renderer().render(values, 25) == "<list[str](1000)>"
+    assert starved.render(values, 25) == "[<str(150)>, ...999 more]"
+
+
+def test_renderer_routes_public_helpers_to_its_active_render():
+    class Box:
+        def __init__(self, value):
+            self.value = value
+
+    @reprobate.register(Box)
+    def render_box(obj, budget):
+        return f"Box({reprobate.render_child(obj.value, budget - 5)})"
+
+    renderer = reprobate.Renderer(inference="off")
+
+    assert renderer.render(Box([1, 2, 3]), 100) == "Box([1, 2, 3])"
+    assert renderer.render_attrs({"a": 1}, "Model", 100) == "Model(a=1)"
+    with pytest.raises(RuntimeError, match="render_child"):
+        reprobate.render_child(1, 10)
+
+
+def test_render_many_matches_individual_renders():
+    rows = [{"id": index, "name": f"user{index}"} for index in range(300)]
+    objs = [{"rows": rows, "n": index} for index in range(5)] + ["x" * 500, None]
+    budgets = [120, 80, 60, 40, 20, 30, 10]
+
+    assert reprobate.render_many(objs, budgets) == [
+        reprobate.render(obj, budget) for obj, budget in zip(objs, budgets)
+    ]
+
+
+def test_render_many_accepts_one_budget_for_all_objects():
+    assert reprobate.render_many([[1, 2], "abc", {}], 8) == ["[1, 2]", "'abc'", "{}"]
+    assert reprobate.render_many([[1, 2]], 0) == [""]
+
+
+def test_render_many_rejects_mismatched_budgets():
+    with pytest.raises(ValueError, match="one budget per object"):
+        reprobate.render_many([1, 2], [10])
+    with pytest.raises(ValueError, match="nonnegative"):
+        reprobate.render_many([1], [-1])
+
+
+def test_render_many_infers_shared_structure_once(monkeypatch):
+    calls = []
+    original = render_module.infer_schema
+
+    def counting_infer_schema(obj, *args, **kwargs):
+        calls.append(id(obj))
+        return original(obj, *args, **kwargs)
+
+    monkeypatch.setattr(render_module, "infer_schema", counting_infer_schema)
+    rows = [{"id": index, "name": f"user{index}"} for index in range(300)]
+
+    reprobate.render_many([{"rows": rows, "n": index} for index in range(20)], 120)
+
+    assert calls.count(id(rows)) == 1
+
+
+def test_render_report_without_deadline_matches_render():
+    value = {"rows": [{"id": index} for index in range(50)]}
+
+    report = reprobate.render_report(value, 80)
+
+    assert report == reprobate.RenderReport(reprobate.render(value, 80))
+    assert reprobate.render(value, 80, deadline=60.0) == report.text
+
+
+def test_render_report_takes_a_token_budget():
+    count = reprobate.approximate_token_count
+    value = list(range(1_000))
+
+    report = reprobate.render_report(value, tokens=40, counter=count)
+
+    assert report.text == reprobate.render(value, tokens=40, counter=count)
+    assert count(report.text) <= 40
+
+
+def test_expired_deadline_skips_native_reprs_and_custom_renderers():
+    calls = []
+
+    class Slow:
+        def __repr__(self):
+            calls.append("repr")
+            return "Slow()"
+
+    class Custom:
+        def __budget_repr__(self, budget):
+            calls.append("custom")
+            return "Custom()"
+
+    value = {"items": list(range(200)), "slow": Slow(), "custom": Custom()}
+
+    report = reprobate.render_report(value, 120, deadline=0)
+
+    assert calls == []
+    assert report.deadline_exceeded
+    assert len(report.text) <= 120
+    assert report.text.startswith("{")
+
+
+def test_negative_deadline_is_rejected():
+    with pytest.raises(ValueError, match="deadline must be nonnegative"):
+        reprobate.render([], 10, deadline=-1)
+
+
+@pytest.mark.parametrize("tokens", [0, 1, 7, 40, 300])
+def test_token_budget_output_fits_the_counter(tokens):
+    count = reprobate.approximate_token_count
+    values = [
+        list(range(10_000)),
+        "hello world " * 1_000,
+        {"rows": [{"id": index, "name": f"user{index}"} for index in range(50)]},
+    ]
+
+    for value in values:
+        result = reprobate.render(value, tokens=tokens, counter=count)
+
+        assert count(result) <= tokens
+
+
+def test_token_budget_fills_the_limit_with_few_exact_counts():
+    calls = []
+
+    def counter(text):
+        calls.append(text)
+        return reprobate.approximate_token_count(text)
+
+    result = reprobate.render(list(range(10_000)), tokens=500, counter=counter)
+
+    assert 490 <= reprobate.approximate_token_count(result) <= 500
+    assert len(calls) <= 6
+
+
+def test_token_budget_stops_at_complete_output():
+    renderer = reprobate.Renderer()
+    count = reprobate.approximate_token_count
+
+    assert renderer.render([1, 2, 3], tokens=100, counter=count) == "[1, 2, 3]"
+
+
+def test_token_budget_counts_the_empty_fallback():
+    def counter(text):
+        # A tokenizer that always adds a start token.
+        return reprobate.approximate_token_count(text) + 1
+
+    with pytest.raises(ValueError, match="no output fits within 0 tokens"):
+        reprobate.render([1, 2, 3], tokens=0, counter=counter)
+    assert counter(reprobate.render(list(range(100)), tokens=5, counter=counter)) <= 5
+
+
+def test_token_budget_keeps_searching_past_unchanged_output():
+    # Every budget below 60 renders the same stub, so two equal outputs say
+    # nothing about larger budgets.
+    class Stepped:
+        def __budget_repr__(self, budget):
+            return "<stepped>" if budget < 60 else "x" * 20
+
+    def counter(text):
+        return len(text) // 2
+
+    assert reprobate.render(Stepped(), tokens=10, counter=counter) == "x" * 20
+
+
+def test_token_budget_reaches_output_whose_tail_costs_fewer_tokens():
+    # The first 300 characters cost a token each, the rest a tenth of one.
+    class Tapered:
+        def __budget_repr__(self, budget):
+            return "a" * min(budget, 300) + "b" * max(0, budget - 300)
+
+    def counter(text):
+        return text.count("a") + text.count("b") // 10
+
+    result = reprobate.render(Tapered(), tokens=300, counter=counter)
+
+    assert counter(result) <= 300
+    assert len(result) > 300
+
+
+def test_token_budget_needs_a_counter():
+    with pytest.raises(ValueError, match="needs a counter"):
+        reprobate.render([], tokens=10)
+    with pytest.raises(ValueError, match="tokens must be nonnegative"):
+        reprobate.render([], tokens=-1, counter=len)
+
+
+def test_approximate_token_count_splits_like_a_subword_tokenizer():
+    assert reprobate.approximate_token_count("") == 0
+    assert reprobate.approximate_token_count("[1, 2]") == 5
+    assert reprobate.approximate_token_count("'hello world'") == 6
+
+
+@pytest.mark.parametrize("budget", [0, 10, 60, 100_000])
+def test_render_into_writes_what_render_returns(budget):
+    value = {"rows": [{"id": index, "tags": ["a", "b"]} for index in range(2_000)]}
+    expected = reprobate.render(value, budget)
+    fragments = []
+    stream = io.StringIO()
+    received = []
+
+    assert reprobate.render_into(value, budget, fragments) == len(expected)
+    assert reprobate.render_into(value, budget, stream) == len(expected)
+    assert reprobate.render_into(value, budget, received.append) == len(expected)
+
+    assert "".join(fragments) == stream.getvalue() == "".join(received) == expected
+
+
+def test_render_into_streams_complete_output_as_fragments():
+    fragments = []
+
+    reprobate.Renderer().render_into([1, "two", 3.0], 100, fragments)
+
+    assert fragments == ["[", "1", ", ", "'two'", ", ", "3.0", "]"]
+
+
+def test_render_into_streams_a_degraded_container_entry_by_entry():
+    value = {"a": "x" * 100, "b": [1, 2, 3], "c": 7}
+    fragments = []
+
+    reprobate.Renderer().render_into(value, 40, fragments)
+
+    assert fragments == ["{", "'a': 'xxxxxxxxxxxxxxxxx...'", ", ", "...2 more", "}"]
+
+
+def test_render_into_rejects_unknown_sinks():
+    with pytest.raises(TypeError, match="sink"):
+        reprobate.render_into([1], 10, object())
+
+
+def test_render_ladder_returns_one_output_per_budget():
+    value = {"rows": [{"id": index, "name": f"user{index}"} for index in range(300)]}
+    budgets = [80, 400, 0, 2_000, 80]
+
+    assert reprobate.render_ladder(value, budgets) == [
+        reprobate.render(value, budget) for budget in budgets
+    ]
+    assert reprobate.Renderer().render_ladder([1, 2, 3], [5, 100]) == [
+        reprobate.render([1, 2, 3], 5),
+        "[1, 2, 3]",
+    ]
+
+
+def test_render_ladder_probes_shared_children_once(monkeypatch):
+    calls = []
+    original = render_module._open_node
+
+    def counting_open_node(obj, *args, **kwargs):
+        calls.append(id(obj))
+        return original(obj, *args, **kwargs)
+
+    monkeypatch.setattr(render_module, "_open_node", counting_open_node)
+    rows = [[index, f"user{index}"] for index in range(20)]
+
+    reprobate.render_ladder({"rows": rows}, [2_000, 1_000, 600])
+
+    assert calls.count(id(rows)) == 1
+
+
+def test_render_ladder_rejects_negative_budgets():
+    with pytest.raises(ValueError, match="nonnegative"):
+        reprobate.render_ladder([1], [10, -1])
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        3.5,
+        'it\'s "quoted"\n',
+        b"\x00bytes",
+        [1, (2,), {3}],
+        {"rows": [{"id": index} for index in range(50)]},
+        collections.Counter("mississippi"),
+        collections.deque([1, 2], maxlen=4),
+    ],
+)
+def test_estimate_measures_the_complete_rendering(value):
+    size = len(repr(value))
+
+    assert reprobate.estimate(value, size) == size
+    assert reprobate.estimate(value, 10_000) == size
+    assert reprobate.estimate(value, size - 1) is None
+    assert reprobate.fits(value, size)
+    assert not reprobate.fits(value, size - 1)
+    assert reprobate.render(value, size) == repr(value)
+
+
+def test_estimate_has_no_complete_length_for_opaque_or_cyclic_values():
+    class Custom:
+        def __budget_repr__(self, budget):
+            return "Custom()"
+
+    cycle = []
+    cycle.append(cycle)
+
+    assert reprobate.estimate(Custom(), 1_000) == math.inf
+    assert reprobate.estimate(cycle, 1_000) == math.inf
+    assert reprobate.estimate([[1, 2], cycle], 1) is None
+    assert not reprobate.fits(Custom(), 1_000)
+    with pytest.raises(ValueError, match="nonnegative"):
+        reprobate.estimate([], -1)
+
+
+def test_estimate_measures_records_in_their_rendered_form():
+    Point = collections.namedtuple("Point", ["x", "y"])
+
+    @dataclasses.dataclass
+    class User:
+        name: str
+        tags: list
+
+    class Job:
+        def __init__(self):
+            self.status = "running"
+            self.owner = User("alice", ["admin"])
+
+    class Described:
+        def __repr__(self):
+            return "Described()"
+
+    for value in [Point(1, 2), User("bob", []), Job(), [Point(3, 4), Job()]]:
+        size = len(reprobate.render(value, 1_000, inference="off"))
+
+        assert reprobate.estimate(value, 1_000) == size
+        assert reprobate.fits(value, size)
+        assert not reprobate.fits(value, size - 1)
+    assert reprobate.render(Point(1, 2), 100) == "Point(x=1, y=2)"
+    assert reprobate.estimate(Point(1, 2), 100) == len("Point(x=1, y=2)")
+    assert reprobate.estimate(Described(), 100) == math.inf
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        [],
+        (1,),
+        ((), [], {}),
+        {"a": [1, 2], 3: (4,)},
+        set(),
+        {1, 2, 3},
+        frozenset(),
+        frozenset({"x"}),
+        collections.deque(),
+        collections.deque([1], maxlen=3),
+        collections.deque(maxlen=0),
+        collections.Counter(),
+        collections.Counter("abracadabra"),
+        collections.defaultdict(list, {"k": [1]}),
+        collections.defaultdict(None),
+        "plain",
+        42,
+    ],
+)
+def test_complete_budget_is_assembled_from_exact_child_sizes(value):
+    children = reprobate.child_complete_budgets(value)
+    size = len(reprobate.render(value, 10_000))
+
+    assert reprobate.complete_budget(value) == size == reprobate.estimate(value, 10_000)
+    assert reprobate.complete_budget(value, size - 1) is None
+    if isinstance(value, dict):
+        assert children == {key: len(repr(item)) for key, item in value.items()}
+    elif isinstance(value, (set, frozenset)):
+        assert children == {item: len(repr(item)) for item in value}
+    elif isinstance(value, (list, tuple, collections.deque)):
+        assert children == {index: len(repr(item)) for index, item in enumerate(value)}
+    else:
+        assert children == {}
+
+
+def test_child_complete_budgets_mark_children_without_complete_renderings():
+    class Custom:
+        def __budget_repr__(self, budget):
+            return "Custom()"
+
+    value = {"small": [1, 2], "large": "x" * 100, "custom": Custom()}
+    value["self"] = value
+
+    assert reprobate.child_complete_budgets(value, limit=50) == {
+        "small": 6,
+        "large": None,
+        "custom": math.inf,
+        "self": math.inf,
+    }
+    assert reprobate.complete_budget(value) == math.inf
+    assert reprobate.complete_budget({"large": "x" * 100}, limit=50) is None
+
+
+def test_complete_budget_measures_records_by_field():
+    Point = collections.namedtuple("Point", ["x", "y"])
+
+    @dataclasses.dataclass
+    class User:
+        name: str
+        tags: list
+
+    value = User("alice", ["a", "b"])
+    expected = "User(name='alice', tags=['a', 'b'])"
+
+    assert reprobate.complete_budget(Point(1, 2)) == len("Point(x=1, y=2)")
+    assert reprobate.child_complete_budgets(Point(1, 2)) == {"x": 1, "y": 1}
+    assert reprobate.complete_budget(value) == len(expected)
+    assert reprobate.child_complete_budgets(value) == {"name": 7, "tags": 10}
+
+
+def test_references_render_later_occurrences_of_shared_containers_as_markers():
+    config = {"mode": "fast", "nested": {"limits": list(range(30))}}
+    rows = [{"id": index, "config": config} for index in range(6)]
+    renderer = reprobate.Renderer(inference="off", references=True)
+
+    result = renderer.render(rows, 1_000)
+
+    assert result.startswith(f"[{{'id': 0, 'config': {config!r}}}, ")
+    assert result.count("<same as [0]['config']>") == 5
+    assert reprobate.render(rows, 1_000, inference="off").count("same as") == 0
+
+
+def test_references_are_spelled_from_namespace_names():
+    config = {"mode": "fast", "retries": 3}
+    renderer = reprobate.Renderer(inference="off", references=True)
+
+    rendered = renderer.render_namespace({"config": config, "jobs": [config]}, 200)
+
+    assert rendered == {"config": repr(config), "jobs": "[<same as config>]"}
+
+
+def test_references_never_point_at_an_elided_first_occurrence():
+    config = {"mode": "fast", "retries": 3, "tags": ["a", "b"]}
+    value = {"a": [{"i": index} for index in range(50)] + [config], "b": config}
+    renderer = reprobate.Renderer(inference="off", references=True)
+
+    result = renderer.render(value, 300)
+
+    assert "...27 more]" in result
+    assert "same as" not in result
+
+
+def test_references_keep_cycle_markers_and_short_complete_values():
+    cycle = []
+    cycle.append(cycle)
+    small = [1]
+    renderer = reprobate.Renderer(references=True)
+
+    assert renderer.render([cycle, cycle], 100) == "[[<...>], <same as [0]>]"
+    assert renderer.render([small, small], 100) == "[[1], [1]]"
+
+
+@pytest.mark.parametrize("policy", ["greedy", "even", "global"])
+def test_references_respect_every_budget(policy):
+    shared = {"values": list(range(20))}
+    value = {"a": shared, "b": [shared, {"c": shared}], "d": shared["values"]}
+    renderer = reprobate.Renderer(policy, references=True)
+
+    for budget in range(200):
+        assert len(renderer.render(value, budget)) <= budget
+
+
+def test_result_cache_answers_repeated_immutable_renders():
+    blob = tuple(f"item-{index}" for index in range(1_000))
+    cache = reprobate.ResultCache()
+    renderer = reprobate.Renderer(inference="off", cache=cache)
+
+    first = renderer.render(blob, 80)
+    assert (
+        renderer.render(blob, 80)
+        == first
+        == reprobate.render(blob, 80, inference="off")
+    )
+    assert renderer.render("x" * 10_000, 30) == renderer.render("x" * 10_000, 30)
+
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert len(cache) == 2
+
+
+def test_result_cache_skips_values_that_can_change():
+    cache = reprobate.ResultCache()
+    renderer = reprobate.Renderer(cache=cache)
+    rows = [1, 2]
+    holder = (rows, "fixed")
+
+    assert renderer.render(rows, 50) == "[1, 2]"
+    assert renderer.render(holder, 50) == "([1, 2], 'fixed')"
+    rows.append(3)
+
+    assert renderer.render(holder, 50) == "([1, 2, 3], 'fixed')"
+    assert len(cache) == 0
+
+
+def test_result_cache_keys_include_budget_and_options():
+    cache = reprobate.ResultCache()
+    value = tuple(range(100))
+    greedy = reprobate.Renderer(cache=cache)
+    even = reprobate.Renderer("even", inference="off", cache=cache)
+
+    assert greedy.render(value, 40) == reprobate.render(value, 40)
+    assert greedy.render(value, 60) == reprobate.render(value, 60)
+    assert even.render(value, 40) == reprobate.render(
+        value, 40, "even", inference="off"
+    )
+    assert len(cache) == 3
+
+
+def test_result_cache_evicts_by_size_and_collection():
+    cache = reprobate.ResultCache(max_chars=65)
+    renderer = reprobate.Renderer(cache=cache)
+    first, second = tuple(range(10)), tuple(range(20, 30))
+
+    renderer.render(first, 50)
+    renderer.render(second, 50)
+    assert len(cache) == 1
+    renderer.render(second, 50)
+    assert cache.hits == 1
+
+    members = frozenset({"a", "b"})
+    renderer.render(members, 40)
+    assert len(cache) == 2
+    del members
+    gc.collect()
+    assert len(cache) == 1
+
+
+def test_result_cache_is_cleared_by_registration():
+    cache = reprobate.ResultCache()
+    renderer = reprobate.Renderer(cache=cache)
+    renderer.render(("a", "b"), 40)
+
+    class Unrelated:
+        pass
+
+    @reprobate.register(Unrelated)
+    def render_unrelated(obj, budget):
+        return "<unrelated>"
+
+    assert len(cache) == 0
+
+
+def test_renderer_rejects_a_cache_of_the_wrong_type():
+    with pytest.raises(TypeError, match="ResultCache"):
+        reprobate.Renderer(cache={})
+
+
+def test_incremental_renderer_reuses_output_until_what_it_read_changes():
+    renderer = reprobate.Renderer()
+    incremental = reprobate.IncrementalRenderer(renderer)
+    rows = [{"id": index, "tags": ["a", "b"]} for index in range(1_000)]
+
+    first = incremental.render("rows", rows, 120)
+    assert incremental.render("rows", rows, 120) == first
+    assert (incremental.hits, incremental.misses) == (1, 1)
+
+    rows[0]["tags"].append("c")
+    assert incremental.render("rows", rows, 120) == renderer.render(rows, 120)
+    rows.append({"id": -1})
+    assert incremental.render("rows", rows, 120) == renderer.render(rows, 120)
+    assert (incremental.hits, incremental.misses) == (1, 3)
+
+
+def test_incremental_renderer_keys_on_identity_and_budget():
+    incremental = reprobate.IncrementalRenderer()
+    value = {"status": "ok", "items": list(range(100))}
+
+    incremental.render("value", value, 60)
+    incremental.render("value", value, 80)
+    incremental.render("value", dict(value), 80)
+    incremental.render("value", value, 80)
+
+    assert (incremental.hits, incremental.misses) == (0, 4)
+    assert incremental.render("value", value, 80) == reprobate.render(value, 80)
+    assert incremental.hits == 1
+
+
+def test_incremental_renderer_never_reuses_values_it_cannot_snapshot():
+    class Opaque:
+        pass
+
+    shared = [1, 2]
+    incremental = reprobate.IncrementalRenderer()
+    referencing = reprobate.IncrementalRenderer(reprobate.Renderer(references=True))
+
+    incremental.render("opaque", [Opaque()], 50)
+    incremental.render("opaque", [Opaque()], 50)
+    referencing.render("shared", [shared, shared], 50)
+    referencing.render("shared", [shared, shared], 50)
+
+    assert (incremental.hits, len(incremental)) == (0, 0)
+    assert (referencing.hits, len(referencing)) == (0, 0)
+
+
+def test_incremental_renderer_forgets_names():
+    incremental = reprobate.IncrementalRenderer()
+    first, second = [1], [2]
+    incremental.render("first", first, 20)
+    incremental.render("second", second, 20)
+
+    incremental.forget("first")
+    assert len(incremental) == 1
+    incremental.clear()
+    assert len(incremental) == 0
+    incremental.render("second", second, 20)
+    assert incremental.hits == 0
+
+
+def test_incremental_renderer_rejects_invalid_arguments():
+    with pytest.raises(TypeError, match="Renderer"):
+        reprobate.IncrementalRenderer(reprobate.ResultCache())
+    with pytest.raises(ValueError, match="nonnegative"):
+        reprobate.IncrementalRenderer().render("value", [], -1)
+
+
+def test_schema_cache_infers_only_appended_elements(monkeypatch):
+    inference_module = importlib.import_module("reprobate._engine.inference")
+    original = inference_module._infer
+    inferred = []
+
+    def counting_infer(obj, *args, **kwargs):
+        inferred.append(obj)
+        return original(obj, *args, **kwargs)
+
+    monkeypatch.setattr(inference_module, "_infer", counting_infer)
+    cache = reprobate.SchemaCache()
+    renderer = reprobate.Renderer(schema_cache=cache)
+    history = [{"role": "user", "content": f"turn {index}"} for index in range(100)]
+
+    renderer.render(history, 120)
+    history.append({"role": "assistant", "content": "reply"})
+    inferred.clear()
+
+    assert renderer.render(history, 120) == reprobate.render(history, 120)
+    assert inferred[:3] == [history[-1], "assistant", "reply"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_schema_cache_infers_changed_elements_again():
+    renderer = reprobate.Renderer(schema_cache=reprobate.SchemaCache())
+    history = [{"role": "user", "content": f"turn {index}"} for index in range(100)]
+
+    renderer.render(history, 80)
+    history[0]["content"] = None
+    history[1] = {"role": "user"}
+
+    assert renderer.render(history, 80) == reprobate.render(history, 80)
+    assert "'content'?: str | None" in renderer.render(history, 80)
+
+
+def test_schema_cache_evicts_least_recently_used_lists():
+    cache = reprobate.SchemaCache(max_entries=1)
+    renderer = reprobate.Renderer(schema_cache=cache)
+    first, second = [1, 2, 3] * 50, ["a", "b"] * 50
+
+    renderer.render(first, 40)
+    renderer.render(second, 40)
+    renderer.render(first, 40)
+
+    assert len(cache) == 1
+    assert (cache.hits, cache.misses) == (0, 3)
+    with pytest.raises(TypeError, match="SchemaCache"):
+        reprobate.Renderer(schema_cache=reprobate.ResultCache())